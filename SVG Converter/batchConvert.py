@@ -0,0 +1,186 @@
+"""
+File: batchConvert.py
+Name: Cody J. McBride
+Contact: cody.mcbride@unh.edu
+Description: Command line (headless) batch mode for the SVG Converter
+             Converts every Illustrator SVG in a folder on a pool of worker processes
+Version: 0.1
+Date: 10/18/2026
+General Notes:
+    Every file gets its own ConversionContext (see converter.py), so files convert independently.
+    Converted files are named like the UI names them: converted_<file name>
+    A file that fails to convert is reported and the batch carries on.
+
+Usage:
+    python batchConvert.py SOURCE_FOLDER [--destination FOLDER] [--workers N] [--chunksize N]
+                           [--tolerance MM] [--keep-curves] [--simplify MM] [--backend regex|expat]
+                           [--trace SUBSYSTEMS] [--trace-level LEVEL] [--trace-file FILE]
+                           [--metrics FILE] [--summary]
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+
+from conversionMetrics import FileMetrics, Metrics
+from converter import ELEMENT_READERS, ConversionOptions, convertFile
+from curveFlattening import DEFAULT_TOLERANCE
+from tracing import LEVEL_NAMES, SUBSYSTEMS, tracerFromArguments
+
+
+# converts a single file inside a worker process
+# Argument: task
+# (source path, destination path, collect metrics, converter.ConversionOptions) tuple
+# returns (source path, error message or None, metrics dictionary or None)
+def convertTask(task):
+    source, destination, measure, options = task
+    metrics = Metrics() if measure else None
+    try:
+        convertFile(source, destination, metrics, options)
+        error = None
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    fileMetrics = metrics.files[0].as_dict() if measure and metrics.files else None
+    return source, error, fileMetrics
+
+
+# pool of worker processes, or None when workers is 1 (the files are converted in this process)
+def workerPool(workers):
+    if workers == 1:
+        return nullcontext()
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+# results of function for every task, in the order of the tasks, from the pool or from this process
+def mapTasks(executor, function, tasks, chunksize):
+    if executor is None:
+        return map(function, tasks)
+    return executor.map(function, tasks, chunksize=chunksize)
+
+
+def collectTasks(sourceFolder, destinationFolder, measure, options=None):
+    tasks = []
+    for filename in sorted(os.listdir(sourceFolder)):
+        # don't convert files that were converted before
+        if filename.endswith(".svg") and not filename.startswith("converted_"):
+            tasks.append((os.path.join(sourceFolder, filename),
+                          os.path.join(destinationFolder, "converted_" + filename), measure, options))
+    return tasks
+
+
+# converts every svg in a folder
+# Argument: sourceFolder
+# folder containing the Illustrator svgs
+# Argument: destinationFolder (optional)
+# folder the converted files are written to, defaults to the source folder
+# Argument: workers (optional)
+# number of worker processes, defaults to the number of CPUs, 1 converts in this process
+# Argument: metrics (optional)
+# conversionMetrics.Metrics that receives the per-file metrics from the workers
+# Argument: options (optional)
+# converter.ConversionOptions used for every file
+# returns a dictionary of statistics for the batch
+def runBatch(sourceFolder, destinationFolder=None, workers=None, chunksize=4, metrics=None, options=None):
+    start = time.perf_counter()
+    destinationFolder = destinationFolder or sourceFolder
+    os.makedirs(destinationFolder, exist_ok=True)
+    tasks = collectTasks(sourceFolder, destinationFolder, metrics is not None, options)
+
+    failed = []
+    with workerPool(workers) as executor:
+        for source, error, fileMetrics in mapTasks(executor, convertTask, tasks, chunksize):
+            if error is not None:
+                failed.append((source, error))
+            if fileMetrics is not None:
+                metrics.add(FileMetrics.from_dict(fileMetrics))
+
+    elapsed = time.perf_counter() - start
+    return {
+        "files": len(tasks),
+        "converted": len(tasks) - len(failed),
+        "failed": failed,
+        "seconds": elapsed,
+        "filesPerSecond": len(tasks) / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+# argparse type of the tolerances, a number greater than 0
+def positiveFloat(text):
+    value = float(text)
+    if not value > 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, not {text}")
+    return value
+
+
+# argparse type of the worker and chunk counts, a whole number greater than 0
+def positiveInt(text):
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, not {text}")
+    return value
+
+
+def parseArguments(argv):
+    parser = argparse.ArgumentParser(description="Converts every Illustrator SVG in a folder to an S100 SVG.")
+    parser.add_argument("source", help="folder containing the Illustrator .svg files")
+    parser.add_argument("-d", "--destination", default=None,
+                        help="folder for the converted files (default: the source folder)")
+    parser.add_argument("-w", "--workers", type=positiveInt, default=None,
+                        help="number of worker processes (default: number of CPUs)")
+    parser.add_argument("-c", "--chunksize", type=positiveInt, default=4,
+                        help="number of files handed to a worker at a time (default: 4)")
+    parser.add_argument("-t", "--tolerance", type=positiveFloat, default=DEFAULT_TOLERANCE,
+                        help=f"largest distance between a curve and its segments, in S100 mm (default: {DEFAULT_TOLERANCE})")
+    parser.add_argument("-k", "--keep-curves", action="store_true",
+                        help="write curves as C/Q path commands instead of straight segments")
+    parser.add_argument("-s", "--simplify", type=positiveFloat, default=None, metavar="MM",
+                        help="drop points of flattened paths and polygons closer than this to the simplified "
+                             "outline, in S100 mm (default: keep every point)")
+    parser.add_argument("-b", "--backend", choices=sorted(ELEMENT_READERS), default="regex",
+                        help="parser the files are read with (default: regex)")
+    parser.add_argument("--trace", default=None, metavar="SUBSYSTEMS",
+                        help=f"trace these subsystems, comma separated ({', '.join(SUBSYSTEMS)}) or 'all'")
+    parser.add_argument("--trace-level", choices=sorted(LEVEL_NAMES), default="info",
+                        help="lowest level of the trace lines written (default: info)")
+    parser.add_argument("--trace-file", default=None,
+                        help="append the trace lines to this file instead of stderr")
+    parser.add_argument("-m", "--metrics", default=None,
+                        help="write per-file phase timings and counters to this file as JSON lines")
+    parser.add_argument("--summary", action="store_true",
+                        help="print a summary table of the phase timings and counters")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parseArguments(argv)
+    if not os.path.isdir(args.source):
+        print(f"Not a directory: {args.source}", file=sys.stderr)
+        return 1
+
+    metrics = Metrics() if args.metrics or args.summary else None
+    try:
+        trace = tracerFromArguments(args.trace, args.trace_level, args.trace_file)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+    options = ConversionOptions(curveTolerance=args.tolerance, keepCurves=args.keep_curves,
+                                simplifyTolerance=args.simplify, trace=trace, backend=args.backend)
+    stats = runBatch(args.source, args.destination, args.workers, args.chunksize, metrics, options)
+
+    for source, error in stats["failed"]:
+        print(f"Failed: {source} ({error})", file=sys.stderr)
+    print(f"Files converted: {stats['converted']} of {stats['files']}, "
+          f"{stats['seconds']:.2f}s ({stats['filesPerSecond']:.1f} files/sec)")
+
+    if args.metrics:
+        with open(args.metrics, "w") as writer:
+            metrics.write_json_lines(writer)
+    if args.summary:
+        print(metrics.summary())
+    return 0 if not stats["failed"] else 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""
+File: boundingBox.py
+Name: Cody J. McBride
+Contact: cody.mcbride@unh.edu
+Description: Bounding box of the converted shapes, the viewBox of the converted svg
+Version: 0.1
+Date: 10/18/2026
+General Notes:
+    The box grows as shapes are parsed (see addBounds of the shapes in classDefs.py), so it's known
+    before the <svg> tag is written and no shape is looked at twice.
+    Shapes with many points add them with one NumPy min and max over their (transformed) points,
+    shapes with a few points add a box. Every shape adds half of its stroke width around its geometry,
+    so strokes aren't cut off by the viewBox.
+    Curves add their control points, a Bezier curve never leaves the box around its control points.
+    The pivot point (a circle around the origin) is written with the shapes, converter.writeSvg adds it.
+    The viewBox is rounded outwards to VIEW_BOX_PRECISION digits.
+"""
+
+# import system libraries
+import math
+
+# number of digits after the decimal point of the viewBox
+VIEW_BOX_PRECISION = 3
+
+
+'''
+    Box around everything added to it, in S100 millimetres
+
+    Class Members:
+        minX            smallest x added, inf while the box is empty
+        minY            smallest y added
+        maxX            largest x added, -inf while the box is empty
+        maxY            largest y added
+'''
+class BoundingBox:
+    __slots__ = ("minX", "minY", "maxX", "maxY")
+
+    def __init__(self):
+        self.minX = math.inf
+        self.minY = math.inf
+        self.maxX = -math.inf
+        self.maxY = -math.inf
+
+    def isEmpty(self):
+        return self.minX > self.maxX
+
+    # grows the box around a box
+    # Argument: margin (optional)
+    # distance added around the box on every side (Ex. half of a stroke width)
+    def addBox(self, x1, y1, x2, y2, margin=0.0):
+        self.minX = min(self.minX, x1 - margin, x2 - margin)
+        self.minY = min(self.minY, y1 - margin, y2 - margin)
+        self.maxX = max(self.maxX, x1 + margin, x2 + margin)
+        self.maxY = max(self.maxY, y1 + margin, y2 + margin)
+
+    # grows the box around many points at once
+    # Argument: points
+    # (n, 2) NumPy array
+    def addPoints(self, points, margin=0.0):
+        if len(points) == 0:
+            return
+        low = points.min(axis=0)
+        high = points.max(axis=0)
+        self.addBox(float(low[0]), float(low[1]), float(high[0]), float(high[1]), margin)
+
+    # (x, y, width, height) of the viewBox around the box, rounded outwards, default when the box is empty
+    def viewBox(self, default):
+        if self.isEmpty():
+            return default
+        scale = 10 ** VIEW_BOX_PRECISION
+        x = math.floor(self.minX * scale) / scale
+        y = math.floor(self.minY * scale) / scale
+        width = round(math.ceil(self.maxX * scale) / scale - x, VIEW_BOX_PRECISION)
+        height = round(math.ceil(self.maxY * scale) / scale - y, VIEW_BOX_PRECISION)
+        return x, y, width, height
@@ -3,10 +3,50 @@ File: classDefs.py
 Name: Cody J. McBride
 Contact: cody.mcbride@unh.edu
 Description: This file contains the class definitions for the data types used by AI/S100 SVGs
-Version: 0.1
+Version: 0.17
 Date: 07/17/2023
 General Notes:
 Version History
+[0.17]
+    Rects and rotated ellipses add the box they are written in to the bounding box
+[0.16]
+    Circles with only a stroke get their stroke class (addClass returned None)
+[0.15]
+    Rects and ellipses are written where the page transform puts them, without their own offsets, ellipses are
+    absolute paths through their transformed (rotated) axes
+[0.14]
+    Polygon points are an (n, 2) NumPy array (see pathData.parsePoints), polygons without closed are polylines
+[0.13]
+    Shapes add their geometry and half of their stroke width to the bounding box of the file (addBounds,
+    see boundingBox.py)
+[0.12]
+    Rotated and skewed rects keep their transformed corners and are drawn as paths through them,
+    instead of being rebuilt from the rotation angle of their matrix
+[0.11]
+    Flattened paths and polygons can drop the points the simplification tolerance allows (see polylineSimplification.py)
+[0.10]
+    Removed the debug print of circles, paths trace their flattening through the writer's tracer (see tracing.py)
+[0.9]
+    Shapes and css classes use __slots__ (no per-instance __dict__)
+    Shapes without a style or transformation have None instead of the 0/-1 sentinels
+[0.8]
+    Paths and polygons stream their points into an svgWriter.SvgWriter (writeTo), with a fixed precision
+[0.7]
+    Paths can keep their curves as C/Q commands (keepCurves) instead of flattening them
+[0.6]
+    Curves are flattened together with a chord tolerance (see curveFlattening.py) instead of a fixed segment count
+[0.5]
+    Paths keep their parsed path data (see pathData.py), every path command is supported
+    Curves are drawn as straight segments along the Bezier curve instead of fitted exponentials/splines,
+    SciPy is no longer used
+[0.4]
+    Shapes map page coordinates through pageTransform.PageTransform instead of their own formulas
+    Polygons transform all of their points in one NumPy call
+[0.3]
+    cssClass remembers which properties its style sheet declared (used to merge classes, see styleRegistry.py)
+[0.2]
+    NumPy/SciPy are imported on demand by the curve segments that need them
+    Removed the unused matplotlib and bezier imports
 [0.1]
     Created file
     Added the following classes
@@ -19,26 +59,32 @@ Version History
             Line
             Path
 """
+import io
 import math
-import re
-import matplotlib.pyplot as plt
-import numpy
-import bezier
-import numpy as np
-from scipy import interpolate
-from scipy.optimize import curve_fit
-from scipy.interpolate import CubicSpline
+from itertools import groupby
+
+from curveFlattening import DEFAULT_TOLERANCE, flattenCurves
+from pageTransform import PageTransform
+from pathData import POINT_COUNTS
+from polylineSimplification import reportSimplification, simplifyMask, simplifyRuns
+from svgWriter import SvgWriter
+from tracing import channel
+
+# NumPy takes hundreds of milliseconds to import, it is only imported (see pageTransform.py,
+# pathData.py and curveFlattening.py) by shapes with many points
 
 
 # TODO change a to something meaningful (class)
 class s100Rect:
+    __slots__ = ("a", "x", "y", "height", "width", "style")
+
     def __init__(self):
         self.a = 0
         self.x = 0
         self.y = 0
         self.height = 0
         self.width = 0
-        self.style = 0
+        self.style = None
         pass
 
     def __str__(self):
@@ -54,6 +100,8 @@ class s100Rect:
     Fill and Stroke are hex color codes (#FFFFFF)
 '''
 class illustratorCssClass:
+    __slots__ = ("name", "fill", "stroke", "strokeMiterLimit", "strokeWidth", "opacity", "declared")
+
     def __init__(self):
         self.name = 0
         self.fill = 0
@@ -61,6 +109,8 @@ class illustratorCssClass:
         self.strokeMiterLimit = 0
         self.strokeWidth = 1
         self.opacity = 1.0
+        # properties the style sheet sets for this class, the others keep their defaults
+        self.declared = set()
 
     def __str__(self):
         return f"\t{self.name}" "{" f"fill:{self.fill};stroke:{self.stroke};stroke-width:{self.strokeWidth};stroke-miterlimit:{self.strokeMiterLimit};" "}\n"
@@ -68,40 +118,40 @@ class illustratorCssClass:
 
 '''
     Default rectangle shape (non-rounded corners, unmodified)
-    x,y is the center of the rectangle
-    x/y + 0.5(width/height) gives you the edges of the rectangle
+    x,y is the top left corner of the rectangle
+    x/y + width/height gives you the other edges of the rectangle
     _class is the css styling added by Illustrator
     
     <rect x="298.5" y="421" class="st0" width="233" height="178"/>
     
     Class Members:
-        x               x-coordinate for the center of the rectangle
-        y               y-coordinate for the center of the rectangle
+        x               x-coordinate for the top left corner of the rectangle (transformed)
+        y               y-coordinate for the top left corner of the rectangle (transformed)
         width           width of the rectangle
         height          height of the rectangle
         style
         strokeWidth
         opacity
+        corners         the four transformed corners of a rotated or skewed rectangle, None when it's axis aligned
 '''
 class illustratorRect:
+    __slots__ = ("x", "y", "width", "height", "style", "strokeWidth", "opacity", "corners")
+
     def __init__(self):
         self.x = 0
         self.y = 0
         self.width = 0
         self.height = 0
-        self.style = 0
+        self.style = None
         self.strokeWidth = 0.32  #default
         self.opacity = 1.0
-        self.transformation = -1
+        self.corners = None
 
     def hasTransformation(self):
-        if self.transformation == -1:
-            return False
-        else:
-            return True
+        return self.corners is not None
 
     def hasStrokeWidth(self):
-        if self.style != 0:
+        if self.style is not None:
             if self.style.strokeWidth == 1:
                 return self.strokeWidth
             else:
@@ -118,35 +168,15 @@ class illustratorRect:
         if self.hasTransformation():
             return self.buildTransformation()
         else:
-            return f"<rect x=\"{round(self.x - 0.5 * self.width * 0.3527777778, 2)}\" " \
-                   f"y=\"{round(self.y - 0.5 * self.height * 0.3527777778, 2)}\" height=\"{self.height}\" " \
-                   f"width=\"{self.width}\" " + self.addClass() + f"style=\"stroke-width:{self.strokeWidth};\" />"
+            return f"<rect x=\"{round(self.x, 3)}\" y=\"{round(self.y, 3)}\" height=\"{round(self.height, 3)}\" " \
+                   f"width=\"{round(self.width, 3)}\" " + self.addClass() + f"style=\"stroke-width:{self.strokeWidth};\" />"
 
     def buildTransformation(self):
-        cx = self.x - 0.5 * self.width * 0.3527777778
-        cy = self.y - 0.5 * self.height * 0.3527777778
-        theta = abs(round(math.degrees(math.atan2(self.transformation[1], self.transformation[0]))))
-        x1 = round(cx - (0.5 * self.width * math.cos(math.radians(theta))), 3)
-        y1 = round(cy + (0.5 * self.width * math.sin(math.radians(theta))), 3)
-        x2 = round(cx + (0.5 * self.width * math.cos(math.radians(theta))), 3)
-        y2 = round(cy - (0.5 * self.width * math.sin(math.radians(theta))), 3)
-
-        p1x = round(x1 - (0.5 * self.height * math.sin(math.radians(theta))), 3)
-        p1y = round(y1 - (0.5 * self.height * math.cos(math.radians(theta))), 3)
-
-        p2x = round(x2 - (0.5 * self.height * math.sin(math.radians(theta))), 3)
-        p2y = round(y2 - (0.5 * self.height * math.cos(math.radians(theta))), 3)
-
-        p3x = round(x2 + (0.5 * self.height * math.sin(math.radians(theta))), 3)
-        p3y = round(y2 + (0.5 * self.height * math.cos(math.radians(theta))), 3)
-
-        p4x = round(x1 + (0.5 * self.height * math.sin(math.radians(theta))), 3)
-        p4y = round(y1 + (0.5 * self.height * math.cos(math.radians(theta))), 3)
-
-        return f"<path d=\" M {p1x},{p1y} L {p2x},{p2y} L {p3x},{p3y} L {p4x},{p4y}, L {p1x},{p1y}\"" + self.addClass() + f"style=\"stroke-width:{self.hasStrokeWidth() * 0.32};\" />"
+        corners = " L ".join(f"{round(x, 3)},{round(y, 3)}" for x, y in self.corners + self.corners[:1])
+        return f"<path d=\" M {corners}\" " + self.addClass() + f"style=\"stroke-width:{self.hasStrokeWidth() * 0.32};\" />"
 
     def addClass(self):
-        if self.style != 0:
+        if self.style is not None:
             if self.style.fill != 0:
                 if self.style.fill == 'none':
                     return f"fill=\"{self.style.fill}\" class=\"s{self.style.stroke}\" "
@@ -155,21 +185,31 @@ class illustratorRect:
             return f"class=\"s{self.style.stroke} f#000000\" "  # AI defaults to black fill
         return ""
 
+    # adds the rectangle as it is written (see buildString) to a boundingBox.BoundingBox
+    def addBounds(self, bounds):
+        if self.hasTransformation():
+            margin = self.hasStrokeWidth() * 0.32 / 2
+            for x, y in self.corners:
+                bounds.addBox(x, y, x, y, margin)
+        else:
+            bounds.addBox(self.x, self.y, self.x + self.width, self.y + self.height, self.strokeWidth / 2)
+
     def __str__(self):
         return self.buildString()
 
 
 class illustratorCircle:
+    __slots__ = ("cx", "cy", "r", "style", "strokeWidth")
+
     def __init__(self):
         self.cx = 0
         self.cy = 0
         self.r = 0
-        self.style = 0
+        self.style = None
         self.strokeWidth = 0.32
-        self.transformation = -1
 
     def hasStrokeWidth(self):
-        if self.style != 0:
+        if self.style is not None:
             if self.style.strokeWidth == 1:
                 return self.strokeWidth
             else:
@@ -182,19 +222,23 @@ class illustratorCircle:
         else:
             return True
 
+    def addBounds(self, bounds):
+        bounds.addBox(self.cx - self.r, self.cy - self.r, self.cx + self.r, self.cy + self.r,
+                      self.hasStrokeWidth() * 0.32 / 2)
+
     def buildString(self):
-        print('debug')
         return f"<circle cx=\"{round(self.cx, 3)}\" cy=\"{round(self.cy, 3)}\" r=\"{round(self.r, 3)}\" " + self.addClass() + f" style=\"stroke-width:{self.hasStrokeWidth() * 0.32};\" />"
 
     def addClass(self):
-        if self.style != 0:
+        if self.style is not None:
             if self.style.fill != 0:
                 if self.style.fill == 'none':
                     return f"fill=\"{self.style.fill}\" class=\"s{self.style.stroke}\" "
                 else:
                     return f"class=\"s{self.style.stroke} f{self.style.fill}\" "
-        else:
-            return ""
+            # stroke only. Ex. .st1{stroke:#00FF00;}
+            return f"class=\"s{self.style.stroke}\" "
+        return ""
 
     def __str__(self):
         return self.buildString()
@@ -208,24 +252,27 @@ class illustratorCircle:
     <ellipse class="st1" cx="298" cy="421" rx="116.5" ry="89" />
     
     Class Members:
-        cx              x-coordinate for the center of the circle           
-        cy              y-coordinate for the center of the circle
-        rx              radius of the ellipse along the x-axis
-        ry              radius of the ellipse along the y-axis
+        cx              x-coordinate for the center of the ellipse (transformed)
+        cy              y-coordinate for the center of the ellipse (transformed)
+        rx              radius of the ellipse along its (rotated) x-axis
+        ry              radius of the ellipse along its (rotated) y-axis
+        angle           rotation of the ellipse's x-axis, in degrees (see pageTransform.PageTransform.ellipse)
         style
 '''
 class illustratorEllipse:
+    __slots__ = ("cx", "cy", "rx", "ry", "angle", "strokeWidth", "style")
+
     def __init__(self):
         self.cx = 0
         self.cy = 0
         self.rx = 0
         self.ry = 0
+        self.angle = 0.0
         self.strokeWidth = 0.32
-        self.style = 0
-        self.transformation = -1
+        self.style = None
 
     def hasStrokeWidth(self):
-        if self.style.strokeWidth == 1:
+        if self.style is None or self.style.strokeWidth == 1:
             return self.strokeWidth
         else:
             return self.style.strokeWidth
@@ -236,23 +283,34 @@ class illustratorEllipse:
         else:
             return True
 
+    # adds the (rotated) ellipse as it is written (see buildString) to a boundingBox.BoundingBox
+    def addBounds(self, bounds):
+        angle = math.radians(self.angle)
+        cos, sin = math.cos(angle), math.sin(angle)
+        # half of the width and height of the box around a rotated ellipse
+        dx = math.hypot(self.rx * cos, self.ry * sin)
+        dy = math.hypot(self.rx * sin, self.ry * cos)
+        bounds.addBox(self.cx - dx, self.cy - dy, self.cx + dx, self.cy + dy, self.hasStrokeWidth() * 0.32 / 2)
+
+    # two absolute arcs, from one end of the ellipse's x-axis to the other and back
     def buildString(self):
-        return self.tempSTR()
-        #return f"<ellipse cx=\"{self.cx}\" cy=\"{self.cy}\" rx=\"{self.rx}\" ry=\"{self.ry}\" " + self.addClass() + f" style=\"stroke-width:{self.hasStrokeWidth() * 0.32};\" />"
+        angle = math.radians(self.angle)
+        dx = self.rx * math.cos(angle)
+        dy = self.rx * math.sin(angle)
+        start = f"{round(self.cx - dx, 3)},{round(self.cy - dy, 3)}"
+        end = f"{round(self.cx + dx, 3)},{round(self.cy + dy, 3)}"
+        arc = f"A {round(self.rx, 3)},{round(self.ry, 3)},{round(self.angle, 3)},1,0,"
+        return f"<path d=\" M {start} {arc}{end} {arc}{start} Z\" " + self.addClass() + f" style=\"stroke-width:{self.hasStrokeWidth() * 0.32};\" />"
 
     def addClass(self):
+        if self.style is None:
+            return ""
         if self.style.fill != 0:
             return f"fill=\"{self.style.fill}\" class=\"s{self.style.stroke}\""
         return f"class=\"s{self.style.stroke}\""
 
     def __str__(self):
         return self.buildString()
-        #return f"<ellipse class=\"{self.style}\" cx=\"{self.cx}\" cy=\"{self.cy}\" rx=\"{self.rx}\" ry=\"{self.ry}\" />\n"
-
-    def tempSTR(self):
-        return f"<path d=\" M {round((self.cx - self.rx) + 0.5 * self.rx * 0.3527777778, 3)},{round((self.cy - self.ry) + 0.5 * self.rx * 0.3527777778, 3)} " \
-               f"a {self.rx},{self.ry},0,1,0,{round(self.cx + self.rx, 3)},{self.cy} a {self.rx},{self.ry},0,1,0,{round(-1 * (self.cx + self.rx), 3)},{self.cy}Z\" " \
-               f"" + self.addClass() + f" style=\"stroke-width:{self.hasStrokeWidth() * 0.32};\" />"
 
 '''
     Default straight line
@@ -263,25 +321,31 @@ class illustratorEllipse:
     <line class="st1" x1="414.5" y1="332" x2="298" y2="421"/>
 '''
 class illustratorLine:
+    __slots__ = ("x1", "x2", "y1", "y2", "style", "strokeWidth")
+
     def __init__(self):
         self.x1 = 0
         self.x2 = 0
         self.y1 = 0
         self.y2 = 0
-        self.style = 0
+        self.style = None
+        self.strokeWidth = 0.32
+
+    def addBounds(self, bounds):
+        bounds.addBox(self.x1, self.y1, self.x2, self.y2, self.hasStrokeWidth() * 0.32 / 2)
 
     def __str__(self):
         return f"<path d=\"M {round(self.x1, 3)},{round(self.y1, 3)} L {round(self.x2, 3)},{round(self.y2, 3)}\" " + self.addClass() + f"style=\"stroke-width:{self.hasStrokeWidth() * 0.32};\" />"
 
     def addClass(self):
-        if self.style != 0:
+        if self.style is not None:
             if self.style.fill != 0:
                 return f"fill=\"{self.style.fill}\" class=\"s{self.style.stroke}\" "
             return f"class=\"s{self.style.stroke}\" "
         return ""
 
     def hasStrokeWidth(self):
-        if self.style != 0:
+        if self.style is not None:
             if self.style.strokeWidth == 1:
                 return self.strokeWidth
             else:
@@ -289,143 +353,202 @@ class illustratorLine:
         return 1
     pass
 
-def fit_func(x, a, b):
-    return a * np.exp(b*x)
-
-def bezier_curve(t, *params):
-    n = len(params) // 2
-    control_points = np.array(params).reshape((n, 2))
-    basis = np.array([(1 - t) ** (n - i - 1) * t ** i for i in range(n)]).T
-    return basis @ control_points
-
+'''
+    Path drawn with lines and curves
+    Curves are drawn as straight segments, see curveFlattening.py
+    
+    <path class="st3" d="M298,421c0.5-1.2,2.3-3.4,4-5h10V400z"/>
+    
+    Class Members:
+        path            pathData.PathData (absolute M, L, C, Q and Z commands in page coordinates)
+        transform       page to S100 transform (see pageTransform.py), applied to every point at once
+        tolerance       largest distance between a curve and its segments, in S100 millimetres
+        keepCurves      write curves as C/Q commands (SVG Tiny 1.2 supports them) instead of segments
+        simplifyTolerance   points of the flattened path closer than this to the simplified path are dropped,
+                            None keeps every point (curves kept as curves aren't simplified)
+'''
 class illustratorPath:
+    __slots__ = ("style", "path", "transform", "tolerance", "keepCurves", "simplifyTolerance")
+
     def __init__(self):
-        self.style = -1
-        self.points = 0
+        self.style = None
+        self.path = None
+        self.transform = PageTransform()
+        self.tolerance = DEFAULT_TOLERANCE
+        self.keepCurves = False
+        self.simplifyTolerance = None
 
     def __str__(self):
-        curX = float(0)
-        curY = float(0)
-        ret = "<path d=\" "
-        for p in self.points:
-            if p.find("M") >= 0:
-                coord = re.findall('[0-9.]+', p)
-                curX = (float(coord[0]) / 100)
-                curY = (float(coord[1]) / 100)
-                ret = ret + f"M {curX.__str__()},{curY.__str__()} "
-            if p.find("H") >= 0:
-                coord = re.findall('[0-9.]+', p)
-                curX = (float(coord[0]) / 100)
-                ret = ret + f"L {curX.__str__()},{curY.__str__()} "
-            if p.find("h") >= 0:
-                coord = re.findall('[0-9.]+', p)
-                curX = curX + (float(coord[0]) / 100)
-                ret = ret + f"L {curX.__str__()},{curY.__str__()} "
-            if p.find("V") >= 0:
-                coord = re.findall('[0-9.]+', p)
-                curY = (float(coord[0]) / 100)
-                ret = ret + f"L {curX.__str__()},{curY.__str__()} "
-            if p.find("v") >= 0:
-                coord = re.findall('[0-9.]+', p)
-                curY = curY + (float(coord[0]) / 100)
-                ret = ret + f"L {curX.__str__()},{curY.__str__()} "
-            if p.find("C") >= 0:
-                coord = re.findall('-?[0-9.]+', p)
-                print("absolute C " + "(" + coord[0] + "," + coord[1] + ")\t(" + coord[2] + "," + coord[3] + ")\t(" + coord[4] + "," + coord[5] + ")")
-                x1 = round((float(coord[0]) / 100), 3)
-                y1 = round((float(coord[1]) / 100), 3)
-                x2 = round((float(coord[2]) / 100), 3)
-                y2 = round((float(coord[3]) / 100), 3)
-                deltaY = y2 - y1
-                y2 = y2 - 2 * deltaY
-
-                x3 = round((float(coord[4]) / 100), 3)
-                y3 = round((float(coord[5]) / 100), 3)
-                y3 = y3 - 2 * deltaY
-
-                x_data = np.array([x1, x2, x3])
-                y_data = np.array([y1, y2, y3])
-
-                params, params_covariance = curve_fit(fit_func, x_data, y_data)
-                granularity = 5
-                delta = x1 - x3
-                offset = float(delta / granularity)
-                startingY = y1
-                for x in range(granularity):
-                    xval = x1 - (x * offset)
-                    yval = round(fit_func(xval, params[0], params[1]), 3)
-                    ret = ret + f"L {xval},{startingY + (startingY - yval)} "
-                    print(f"({xval},{startingY + (startingY - yval)})")
-
-            if p.find("c") >= 0:
-                coord = re.findall('-?[0-9.]+', p)
-                print("relative c " + "(" + coord[0] + "," + coord[1] + ")\t(" + coord[2] + "," + coord[3] + ")\t(" + coord[4] + "," + coord[5] + ")")
-                x1 = curX
-                y1 = curY
-
-                curX = x1
-                curY = y1
-
-                x2 = round((float(coord[2]) / 100), 3) + curX
-                y2 = round((float(coord[3]) / 100), 3) + curY
-
-                curX = x2
-                curY = y2
-
-                x3 = round((float(coord[4]) / 100), 3) + curX
-                y3 = round((float(coord[5]) / 100), 3) + curY
-
-                curX = x3
-                curY = y3
-
-                x_data = [x1, x2, x3]
-                y_data = [y1, y2, y3]
-
-                cs = interpolate.CubicSpline(x_data, y_data)
-
-                granularity = 10
-                delta1 = x_data[1] - x_data[0]
-
-                for x in range(granularity):
-                    val = round((float(x / granularity) * delta1) + x_data[0], 3)
-                    ret = ret + f"L {val}, {cs(val)} "
-
-                delta2 = x_data[2] - x_data[1]
-
-                for x in range(granularity):
-                    val = round((float(x / granularity) * delta2) + x_data[1], 3)
-                    ret = ret + f"L {val}, {cs(val)} "
-
-                #ret = ret + f"L {x_data[0]},{cs(x_data[0])} "
-                #ret = ret + f"L {x_data[1]},{cs(x_data[1])} "
-                #ret = ret + f"L {x_data[2]},{cs(x_data[2])} "
-                pass
-            if p.find("z") >= 0:
-                ret = ret + "z"
-                pass
-
-        ret = ret + "\" class=\"s1 f0 sCHBLK\" style=\"stroke-width:0.32;\"/>"
-        return ret
+        fil = io.StringIO()
+        out = SvgWriter(fil)
+        self.writeTo(out)
+        out.flush()
+        return fil.getvalue()
+
+    # adds the points of the path (curves add their control points) to a boundingBox.BoundingBox
+    def addBounds(self, bounds):
+        if self.path is not None and len(self.path.coords) > 0:
+            bounds.addPoints(self.transform.points(self.path.coords), 0.32 / 2)
+
+    # streams the path into an svgWriter.SvgWriter
+    def writeTo(self, out):
+        out.write("<path d=\" ")
+        if self.path is not None and len(self.path) > 0:
+            if self.keepCurves:
+                self.writeCurveData(out)
+            else:
+                self.writePathData(out)
+        out.write("\" class=\"s1 f0 sCHBLK\" style=\"stroke-width:0.32;\"/>")
+
+    # path data with the curves kept as curves, only the points are transformed
+    def writeCurveData(self, out):
+        points = self.transform.points(self.path.coords)
+        index = 0
+        for command, run in groupby(self.path.commands):
+            commands = sum(1 for _ in run)
+            if command == "Z":
+                out.write("z" * commands)
+                continue
+            count = POINT_COUNTS[command] * commands
+            out.writePoints(command, points[index:index + count], POINT_COUNTS[command])
+            index += count
+
+    # path data with the curves drawn as straight segments
+    def writePathData(self, out):
+        import numpy as np
+        points = self.transform.points(self.path.coords)
+
+        # indices (into points) of the start and control points of every curve
+        cubics = []
+        quadratics = []
+        index = 0
+        current = subpathStart = 0
+        for command in self.path.commands:
+            if command == "M":
+                current = subpathStart = index
+                index += 1
+            elif command == "L":
+                current = index
+                index += 1
+            elif command == "C":
+                cubics.append((current, index, index + 1, index + 2))
+                current = index + 2
+                index += 3
+            elif command == "Q":
+                quadratics.append((current, index, index + 1))
+                current = index + 1
+                index += 2
+            elif command == "Z":
+                current = subpathStart
+
+        # every curve of the path is flattened in one call per degree
+        flatCubics, cubicCounts = flattenCurves(points[np.array(cubics)], self.tolerance) if cubics \
+            else (np.empty((0, 2)), [])
+        flatQuadratics, quadraticCounts = flattenCurves(points[np.array(quadratics)], self.tolerance) \
+            if quadratics else (np.empty((0, 2)), [])
+        trace = channel(out.trace, "flatten")
+        if trace is not None:
+            trace(f"{len(cubics)} cubics -> {len(flatCubics)} segments,",
+                  f"{len(quadratics)} quadratics -> {len(flatQuadratics)} segments,",
+                  f"tolerance {self.tolerance}")
+        flat = {"C": (len(points), iter(cubicCounts)),
+                "Q": (len(points) + len(flatCubics), iter(quadraticCounts))}
+        allPoints = np.concatenate((points, flatCubics, flatQuadratics))
+
+        # the points that are written (indices into allPoints) and runs of (command, number of points)
+        order = []
+        runs = []
+        index = 0
+        for command in self.path.commands:
+            if command == "M" or command == "L":
+                order.append(index)
+                index += 1
+                count = 1
+            elif command == "Z":
+                runs.append(["z", 0])
+                continue
+            else:
+                base, counts = flat[command]
+                count = int(next(counts))
+                order.extend(range(base, base + count))
+                flat[command] = (base + count, counts)
+                index += POINT_COUNTS[command]
+                command = "L"
+            if runs and runs[-1][0] == command:
+                runs[-1][1] += count
+            else:
+                runs.append([command, count])
+
+        vertices = allPoints[np.array(order, dtype=np.int64)]
+        if self.simplifyTolerance is not None:
+            pointsIn = len(vertices)
+            vertices, runs = simplifyRuns(vertices, runs, self.simplifyTolerance)
+            reportSimplification(out, "path", pointsIn, len(vertices))
+        start = 0
+        for command, count in runs:
+            if command == "z":
+                out.write("z")
+            else:
+                out.writePoints(command, vertices[start:start + count])
+                start += count
 
+'''
+    Closed shape through a list of points, or an open one (a polyline)
+    
+    <polygon class="st2" points="298,421 414.5,332 298,243 "/>
+    <polyline class="st2" points="298,421 414.5,332 298,243 "/>
+    
+    Class Members:
+        points          (n, 2) NumPy array of page points
+        transform       page to S100 transform (see pageTransform.py), applied to every point at once
+        simplifyTolerance   points closer than this to the simplified outline are dropped, None keeps every point
+        closed          False for polylines, the last point isn't joined to the first
+'''
 class illustratorPolygon:
+    __slots__ = ("style", "points", "transform", "simplifyTolerance", "closed")
+
     def __init__(self):
-        self.style = -1
-        self.startingPoint = 0
-        self.points = 0
-        self.vbHeight = 0
-        self.vbWidth = 0
+        self.style = None
+        self.points = []
+        self.transform = PageTransform()
+        self.simplifyTolerance = None
+        self.closed = True
 
     def __str__(self):
-        self.startingPoint = self.startingPoint.split(",")
-        ret = f"<path d=\"M {float(self.startingPoint[0]) * 0.3527777778 * 0.039408866995 - (self.vbWidth / 2) * 0.3527777778 * 0.039408866995}," \
-              f"{float(self.startingPoint[1]) * 0.3527777778 * 0.039408866995 - (self.vbHeight / 2) * 0.3527777778 * 0.039408866995} "
-        lastPoint = None
-        for p in self.points:
-            coord = p.split(",")
-            ret = ret + f"L {float(coord[0]) * 0.3527777778 * 0.039408866995 - (self.vbWidth / 2) * 0.3527777778 * 0.039408866995}," \
-                        f"{float(coord[1]) * 0.3527777778 * 0.039408866995 - (self.vbHeight / 2) * 0.3527777778 * 0.039408866995} "
-
-        ret = ret + f"L {float(self.startingPoint[0]) * 0.3527777778 * 0.039408866995 - (self.vbWidth / 2) * 0.3527777778 * 0.039408866995}," \
-                    f"{float(self.startingPoint[1]) * 0.3527777778 * 0.039408866995 - (self.vbHeight / 2) * 0.3527777778 * 0.039408866995}\" "
-        ret = ret + "class=\"s#00AEEF\" style=\"stroke-width:0.32;\" />"
-        return ret
+        fil = io.StringIO()
+        out = SvgWriter(fil)
+        self.writeTo(out)
+        out.flush()
+        return fil.getvalue()
+
+    def addBounds(self, bounds):
+        if len(self.points) > 0:
+            bounds.addPoints(self.transform.points(self.points), 0.32 / 2)
+
+    # streams the polygon into an svgWriter.SvgWriter
+    def writeTo(self, out):
+        points = self.transform.points(self.points)
+        if not self.closed:
+            self.writePolyline(out, points)
+            return
+        if self.simplifyTolerance is not None and len(points) > 0:
+            # the outline is closed, it is simplified from the first point around to the first point again
+            import numpy as np
+            outline = np.concatenate((points, points[:1]))
+            points = outline[simplifyMask(outline, self.simplifyTolerance)][:-1]
+            reportSimplification(out, "polygon", len(outline) - 1, len(points))
+        out.write("<path d=\"")
+        out.writePoints("M", points[:1])
+        out.writePoints("L", points)
+        out.writePoints("L", points[:1])
+        out.write("\" class=\"s#00AEEF\" style=\"stroke-width:0.32;\" />")
+
+    def writePolyline(self, out, points):
+        if self.simplifyTolerance is not None and len(points) > 0:
+            pointsIn = len(points)
+            points = points[simplifyMask(points, self.simplifyTolerance)]
+            reportSimplification(out, "polyline", pointsIn, len(points))
+        out.write("<path d=\"")
+        out.writePoints("M", points[:1])
+        out.writePoints("L", points[1:])
+        out.write("\" class=\"s#00AEEF\" style=\"stroke-width:0.32;\" />")
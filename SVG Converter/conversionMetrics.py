@@ -0,0 +1,37 @@
+"""
+File: conversionMetrics.py
+Name: Cody J. McBride
+Contact: cody.mcbride@unh.edu
+Description: Opt-in per-file timing and counters for the SVG Converter
+Version: 0.2
+Date: 10/18/2026
+General Notes:
+    Metrics are off unless a Metrics object is passed in (convertFile(..., metrics=Metrics())).
+    When they're off the converter only pays for a few 'is None' checks per file.
+    The timers, counters and the summary are the translator's (metrics.py, one folder up), this module
+    puts that folder on the import path and re-exports them. For each file the collector records
+        wall time per phase     read, tokenize, parse (the loop over the elements and css rules),
+                                parse <rect>, parse <path>, ... (the parser of each kind of element),
+                                curves (flattening and serializing paths), serialize (other items),
+                                write (writes to the file, not counted in the curves or serialize it happens in)
+        counters                tokens, classes, elements by tag (<rect>, <path>, ...),
+                                points in and out of the polyline simplification (when it's on)
+        bytes in and out
+    Results can be written as JSON lines (one file per line) or printed as a summary table.
+Version History
+[0.2]
+    Uses the translator's metrics.py instead of a copy of it
+[0.1]
+    Per-phase timing and counters of the converter
+"""
+
+# import system libraries
+import os
+import sys
+
+# folder of the translator, where metrics.py is. Appended, so the converter's own modules come first
+TRANSLATOR_FOLDER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if TRANSLATOR_FOLDER not in sys.path:
+    sys.path.append(TRANSLATOR_FOLDER)
+
+from metrics import FileMetrics, Metrics, PhaseTimer  # noqa: E402,F401
@@ -0,0 +1,492 @@
+"""
+File: converter.py
+Name: Cody J. McBride
+Contact: cody.mcbride@unh.edu
+Description: Library interface for the Illustrator SVG to S100 SVG converter, no UI
+Version: 0.1
+Date: 10/18/2026
+General Notes:
+    Nothing here imports tkinter. Everything a conversion needs (items, classes, viewBox, title,
+    description) lives in a ConversionContext, so conversions never share module globals.
+        convert(text)               -> converted text
+        convert(data)               -> converted bytes
+        convert(reader)             -> converted text read from a file-like object
+        convert(reader, writer)     -> writes the converted text into writer
+        convertFile(source, destination)
+        convertFile(source, destination, options=ConversionOptions(curveTolerance=0.01))
+        convertFile(source, destination, options=ConversionOptions(keepCurves=True))
+        convertFile(source, destination, options=ConversionOptions(simplifyTolerance=0.01))
+        convertFile(source, destination, options=ConversionOptions(backend="expat"))
+    The file is split into elements by one of two parser backends (ConversionOptions.backend):
+        regex       the string scanner of svgTokenizer.py
+        expat       the XML parser of xmlElements.py, handles entities, comments, CDATA and '>' in attributes
+    A file (convertFile) that isn't well-formed XML is converted with the regex backend instead,
+    other sources raise xml.parsers.expat.ExpatError.
+        convertFile(source, destination, options=ConversionOptions(trace=Tracer({"parse"}, DEBUG)))
+"""
+import io
+import math
+import os
+
+# import items from other project files
+from boundingBox import BoundingBox
+from classDefs import illustratorRect, illustratorCssClass, illustratorCircle, illustratorLine, illustratorEllipse, illustratorPath, illustratorPolygon
+from stringConstants import XML_VERSION, STYLE_SHEET, METADATA, PIVOT_POINT, PIVOT_POINT_RADIUS, buildTitle, buildDescription, DEFAULT_TITLE, DEFAULT_DESCRIPTION, \
+    DEFAULT_VIEW_BOX, buildSvgTag
+from curveFlattening import DEFAULT_TOLERANCE
+from pageTransform import PageTransform
+from pathData import parsePathData, parsePoints
+from styleRegistry import StyleRegistry
+from svgTokenizer import iterElements
+from xmlElements import iterXmlElements
+from xml.parsers.expat import ExpatError
+from svgWriter import SvgWriter, writeItem
+from tracing import INFO, channel
+
+# import regular expression library
+import re
+
+# a number in an attribute. Ex. -1.5 or 2e-3
+NUMBER_PATTERN = re.compile("[-+]?(?:[0-9]+\\.?[0-9]*|\\.[0-9]+)(?:[eE][-+]?[0-9]+)?")
+
+# parser backend name -> function splitting a file-like object into (name, attributes, source) elements
+ELEMENT_READERS = {"regex": iterElements, "expat": iterXmlElements}
+
+
+'''
+    Settings of a conversion, shared by every file converted with them
+    
+    Class Members:
+        curveTolerance  largest distance between a curve and the segments it is drawn with, in S100 millimetres,
+                        greater than 0
+        keepCurves      write curves as C/Q path commands (SVG Tiny 1.2) instead of drawing them with segments,
+                        smaller files and no flattening, curveTolerance isn't used
+        simplifyTolerance   points of flattened paths and polygons closer than this (S100 millimetres) to the
+                        simplified outline are dropped, see polylineSimplification.py. None keeps every point,
+                        otherwise greater than 0
+        trace           tracing.Tracer, None turns tracing off
+        backend         parser backend the files are read with, "regex" or "expat" (see ELEMENT_READERS)
+
+    Raises ValueError for a tolerance that isn't greater than 0
+'''
+class ConversionOptions:
+    def __init__(self, curveTolerance=DEFAULT_TOLERANCE, keepCurves=False, simplifyTolerance=None, trace=None,
+                 backend="regex"):
+        self.curveTolerance = checkTolerance("curveTolerance", curveTolerance)
+        self.keepCurves = keepCurves
+        self.simplifyTolerance = None if simplifyTolerance is None else checkTolerance("simplifyTolerance", simplifyTolerance)
+        self.trace = trace
+        self.backend = backend
+
+
+# a tolerance of 0 would need infinitely many segments (and NaN segment counts), so it has to be greater than 0
+# returns the tolerance, raises ValueError otherwise
+def checkTolerance(name, tolerance):
+    if not tolerance > 0:
+        raise ValueError(f"{name} must be greater than 0, not {tolerance}")
+    return tolerance
+
+
+'''
+    Everything that belongs to a single conversion
+    
+    Class Members:
+        items           converted shapes, in drawing order
+        styles          Illustrator css classes (.st0, .st1, ...), see styleRegistry.py
+        viewBoxWidth    width of the Illustrator viewBox
+        viewBoxHeight   height of the Illustrator viewBox
+        transform       page to S100 transform for the viewBox, composed with the transforms of the groups
+                        the parser is in, see pageTransform.py
+        groups          transforms to go back to at the end of the groups the parser is in (a stack)
+        bounds          boundingBox.BoundingBox around the items, the viewBox of the converted svg
+        title           title of the symbol
+        description     description of the symbol
+        metrics         conversionMetrics.FileMetrics for the conversion, None when metrics are off
+        options         ConversionOptions of the conversion
+        trace           tracing.Tracer of the options, None when tracing is off
+'''
+class ConversionContext:
+    def __init__(self, metrics=None, options=None):
+        self.metrics = metrics
+        self.options = options if options is not None else ConversionOptions()
+        self.trace = self.options.trace
+        self.items = []
+        self.styles = StyleRegistry()
+        self.viewBoxWidth = 0
+        self.viewBoxHeight = 0
+        self.transform = PageTransform()
+        self.groups = []
+        self.bounds = BoundingBox()
+        self.title = DEFAULT_TITLE
+        self.description = DEFAULT_DESCRIPTION
+
+
+# converts an Illustrator svg document
+# Argument: source
+# the document as a string, bytes or a file-like object opened for reading
+# Argument: destination (optional)
+# file-like object the converted document is written to, only used with a file-like source
+# Argument: encoding (optional)
+# encoding of bytes sources
+# Argument: options (optional)
+# ConversionOptions, defaults to ConversionOptions()
+# returns the converted document (the same type as source), or None when it was written to destination
+def convert(source, destination=None, encoding="utf-8", options=None):
+    if isinstance(source, str):
+        return convertString(source, options)
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return convertString(bytes(source).decode(encoding), options).encode(encoding)
+    if destination is None:
+        destination = io.StringIO()
+        convertStream(source, destination, options)
+        return destination.getvalue()
+    convertStream(source, destination, options)
+    return None
+
+
+def convertString(text, options=None):
+    fil = io.StringIO()
+    convertStream(io.StringIO(text), fil, options)
+    return fil.getvalue()
+
+
+# converts the document read from filePointer and writes it into fil
+# returns the ConversionContext of the conversion
+def convertStream(filePointer, fil, options=None):
+    ctx = ConversionContext(options=options)
+    parseTokens(ctx, ELEMENT_READERS[ctx.options.backend](filePointer))
+    writeSvg(ctx, fil)
+    return ctx
+
+
+# converts the file at source into the file at destination
+# Argument: metrics (optional)
+# conversionMetrics.Metrics collecting per-phase timing and counters for the file
+# Argument: options (optional)
+# ConversionOptions, defaults to ConversionOptions()
+def convertFile(source, destination, metrics=None, options=None):
+    if metrics is not None:
+        return convertFileMeasured(source, destination, metrics.start_file(source), options)
+
+    with open(source, "r") as filePointer:
+        ctx = ConversionContext(options=options)
+        traceFile(ctx, source)
+        try:
+            parseTokens(ctx, ELEMENT_READERS[ctx.options.backend](filePointer))
+        except ExpatError as e:
+            # not well-formed XML, the string scanner converts what it can
+            filePointer.seek(0)
+            ctx = ConversionContext(options=options)
+            traceFallback(ctx, e)
+            parseTokens(ctx, iterElements(filePointer))
+    writeNewFile(ctx, destination)
+    return ctx
+
+
+# convertFile with metrics, reading and tokenizing run on their own (instead of streaming) so each can be timed
+def convertFileMeasured(source, destination, fileMetrics, options=None):
+    ctx = ConversionContext(fileMetrics, options)
+    traceFile(ctx, source)
+    fileMetrics.bytes_in = os.path.getsize(source)
+
+    with fileMetrics.phase("read"):
+        with open(source, "r") as filePointer:
+            fileContents = filePointer.read()
+    with fileMetrics.phase("tokenize"):
+        try:
+            elements = list(ELEMENT_READERS[ctx.options.backend](io.StringIO(fileContents)))
+        except ExpatError as e:
+            fileMetrics.count("xml errors")
+            traceFallback(ctx, e)
+            elements = list(iterElements(io.StringIO(fileContents)))
+    with fileMetrics.phase("parse"):
+        parseTokens(ctx, elements)
+    # writeSvg times the serializing and the curve fitting itself
+    writeNewFile(ctx, destination)
+
+    fileMetrics.bytes_out = os.path.getsize(destination)
+    return ctx
+
+
+# the trace lines that follow are for source
+def traceFile(ctx, source):
+    trace = channel(ctx.trace, "parse", INFO)
+    if trace is not None:
+        trace("file", source)
+
+
+def traceFallback(ctx, error):
+    trace = channel(ctx.trace, "parse", INFO)
+    if trace is not None:
+        trace("not well-formed XML, read with the regex backend:", error)
+
+
+# fills the context from the elements and css rules of an Illustrator svg
+# Argument: elements
+# (name, attributes, source) tuples, see svgTokenizer.iterElements and xmlElements.iterXmlElements
+def parseTokens(ctx, elements):
+    metrics = ctx.metrics
+    trace = channel(ctx.trace, "parse")
+    for name, attributes, source in elements:
+        if metrics is not None:
+            countElement(metrics, name)
+        if name is None:
+            # css rule, Illustrator's classes are .st0, .st1, ...
+            if source.startswith(".st"):
+                if metrics is not None:
+                    with metrics.phase("parse .st"):
+                        ctx.styles.add(parseClass(source))
+                else:
+                    ctx.styles.add(parseClass(source))
+                if trace is not None:
+                    trace("css", source)
+            continue
+        parser = ELEMENT_PARSERS.get(name)
+        if parser is not None:
+            if metrics is not None:
+                # the time of every kind of element is its own phase. Ex. parse <path>
+                with metrics.phase("parse <" + name + ">"):
+                    item = parser(ctx, attributes, source)
+            else:
+                item = parser(ctx, attributes, source)
+            if item is not None:
+                ctx.items.append(item)
+                item.addBounds(ctx.bounds)
+            if trace is not None:
+                trace(f"<{name}>", attributes, "->", type(item).__name__)
+        elif trace is not None:
+            trace(f"<{name}>", "skipped")
+
+    summary = channel(ctx.trace, "parse", INFO)
+    if summary is not None:
+        summary(f"{len(ctx.items)} items, {len(ctx.styles)} css classes, viewBox {ctx.viewBoxWidth}x{ctx.viewBoxHeight}")
+
+# counts an element by its tag name. Ex. <rect>, or .st for css rules
+def countElement(metrics, name):
+    metrics.count("tokens")
+    if name is None:
+        metrics.count(".st")
+    else:
+        metrics.count("<" + name + ">")
+
+# number value of an attribute, default when the element doesn't have it
+def floatAttribute(attributes, name, default=0.0):
+    value = attributes.get(name)
+    if value is None:
+        return default
+    return float(value)
+
+def parseText(ctx, attributes, text):
+    s = re.findall('>.*<', text)
+
+    for item in s:
+        if item.find("Title:") >= 0:
+            t = re.findall("[a-zA-Z0-9 ]+", item)
+            ctx.title = t[1]
+        if item.find("Description:") >= 0:
+            t = re.findall("[a-zA-Z0-9 ]+", item)
+            ctx.description = t[1]
+
+# the transform of a shape, the groups it is in composed with its own transform attribute
+def shapeTransform(ctx, attributes):
+    transform = attributes.get("transform")
+    if transform is None:
+        return ctx.transform
+    return ctx.transform.compose(transform)
+
+def parseGroup(ctx, attributes, source):
+    # <g/> has no end tag and nothing in it
+    if source.endswith("/>"):
+        return None
+    ctx.groups.append(ctx.transform)
+    if "transform" in attributes:
+        ctx.transform = ctx.transform.compose(attributes["transform"])
+
+def parseGroupEnd(ctx, attributes, source):
+    if ctx.groups:
+        ctx.transform = ctx.groups.pop()
+
+# a rect that is rotated or skewed (by itself or by a group) is drawn as a path through its corners
+def parseRect(ctx, attributes, source):
+    ret = illustratorRect()
+    transform = shapeTransform(ctx, attributes)
+    x = floatAttribute(attributes, "x")
+    y = floatAttribute(attributes, "y")
+    width = floatAttribute(attributes, "width")
+    height = floatAttribute(attributes, "height")
+    if "class" in attributes:
+        ret.style = ctx.styles.resolve(attributes["class"])
+
+    if transform.isAxisAligned():
+        x1, y1 = transform.point(x, y)
+        x2, y2 = transform.point(x + width, y + height)
+        ret.x = min(x1, x2)
+        ret.y = min(y1, y2)
+        ret.width = abs(x2 - x1)
+        ret.height = abs(y2 - y1)
+    else:
+        ret.corners = (transform.point(x, y), transform.point(x + width, y),
+                       transform.point(x + width, y + height), transform.point(x, y + height))
+    return ret
+
+'''
+    If the fill is the same as the stroke, it is left out
+'''
+def parseClass(cl):
+    ret = illustratorCssClass()
+    name = re.findall('.st[0-9]*', cl)
+    ret.name = name[0]
+
+    if cl.find('fill') >= 0:
+        fill = re.findall('fill:#[0-9A-Fa-f]*|fill:none;', cl)
+        fill2 = re.findall('#[0-9a-fA-F]{6}|none', fill[0])
+        ret.fill = fill2[0]
+        ret.declared.add("fill")
+
+    if cl.find('stroke:') >= 0:
+        stroke = re.findall('stroke:#[0-9A-Fa-f]*;', cl)
+        stroke2 = re.findall('#[0-9a-fA-F]{6}', stroke[0])
+        ret.stroke = stroke2[0]
+        ret.declared.add("stroke")
+
+    if cl.find('stroke-width') >= 0:
+        strokeWidth = re.findall('stroke-width:[0-9]+', cl)
+        strokeWidth2 = re.findall('[0-9]+', strokeWidth[0])
+        ret.strokeWidth = float(strokeWidth2[0]) * 0.32
+        ret.declared.add("strokeWidth")
+
+    # opacity only appears if not 100% and there is a fill
+    if cl.find('opacity') >= 0:
+        opacity = re.findall('opacity:[0-9].[0-9]', cl)
+        opacity2 = re.findall('[0-9].[0-9]', opacity[0])
+        ret.opacity = float(opacity2[0])
+        ret.declared.add("opacity")
+        pass
+
+    if cl.find('stroke-miterlimit:') >= 0:
+        miter = re.findall('stroke-miterlimit:[0-9]+', cl)
+        miter2 = re.findall('[0-9]+', miter[0])
+        ret.strokeMiterLimit = miter2[0]
+        ret.declared.add("strokeMiterLimit")
+
+    return ret
+
+# TODO: Stress test this
+def parseEllipse(ctx, attributes, source):
+    ret = illustratorEllipse()
+    transform = shapeTransform(ctx, attributes)
+    ret.cx, ret.cy = transform.point(floatAttribute(attributes, "cx"), floatAttribute(attributes, "cy"))
+    ret.rx, ret.ry, ret.angle = transform.ellipse(floatAttribute(attributes, "rx"), floatAttribute(attributes, "ry"))
+    if "class" in attributes:
+        ret.style = ctx.styles.resolve(attributes["class"])
+    return ret
+
+def parsePath(ctx, attributes, source):
+    ret = illustratorPath()
+    ret.transform = shapeTransform(ctx, attributes)
+    ret.tolerance = ctx.options.curveTolerance
+    ret.keepCurves = ctx.options.keepCurves
+    ret.simplifyTolerance = ctx.options.simplifyTolerance
+    if "d" in attributes:
+        ret.path = parsePathData(attributes["d"])
+    return ret
+
+def parseCircle(ctx, attributes, source):
+    ret = illustratorCircle()
+    transform = shapeTransform(ctx, attributes)
+    ret.cx, ret.cy = transform.point(floatAttribute(attributes, "cx"), floatAttribute(attributes, "cy"))
+    ret.r = round(transform.length(floatAttribute(attributes, "r")), 2)
+    if "class" in attributes:
+        ret.style = ctx.styles.resolve(attributes["class"])
+    return ret
+
+def parsePolygon(ctx, attributes, source):
+    ret = illustratorPolygon()
+    ret.transform = shapeTransform(ctx, attributes)
+    ret.simplifyTolerance = ctx.options.simplifyTolerance
+    ret.points = parsePoints(attributes.get("points", ""))
+    return ret
+
+def parsePolyline(ctx, attributes, source):
+    ret = parsePolygon(ctx, attributes, source)
+    ret.closed = False
+    return ret
+
+# TODO: Stress test this
+def parseLine(ctx, attributes, source):
+    ret = illustratorLine()
+    transform = shapeTransform(ctx, attributes)
+    ret.x1, ret.y1 = transform.point(floatAttribute(attributes, "x1"), floatAttribute(attributes, "y1"))
+    ret.x2, ret.y2 = transform.point(floatAttribute(attributes, "x2"), floatAttribute(attributes, "y2"))
+    if "class" in attributes:
+        ret.style = ctx.styles.resolve(attributes["class"])
+    return ret
+
+def parseHeader(ctx, attributes, source):
+    if "viewBox" in attributes:
+        vb = NUMBER_PATTERN.findall(attributes["viewBox"])
+        ctx.viewBoxWidth = math.ceil(float(vb[2]))
+        ctx.viewBoxHeight = math.ceil(float(vb[3]))
+        ctx.transform = PageTransform(ctx.viewBoxWidth, ctx.viewBoxHeight)
+
+# tag name -> parser, a parser returns the item to draw (or None)
+ELEMENT_PARSERS = {
+    "svg": parseHeader,
+    "g": parseGroup,
+    "/g": parseGroupEnd,
+    "text": parseText,
+    "rect": parseRect,
+    "ellipse": parseEllipse,
+    "circle": parseCircle,
+    "line": parseLine,
+    "path": parsePath,
+    "polygon": parsePolygon,
+    "polyline": parsePolyline,
+}
+
+# TODO: Identify which data in <svg... string is constant across files
+# NOTE: the viewBox is the bounding box around all of the items and the pivot point (ctx.bounds)
+def writeNewFile(ctx, fp):
+    with open(fp, 'w') as fil:
+        writeSvg(ctx, fil)
+
+
+# writes the converted S100 svg for a conversion into a file-like object
+def writeSvg(ctx, fil):
+    out = SvgWriter(fil, metrics=ctx.metrics, trace=ctx.trace)
+    out.write(XML_VERSION)
+    out.write(STYLE_SHEET)
+    if not ctx.bounds.isEmpty():
+        # the pivot point is written with the items, so it's in the viewBox too
+        ctx.bounds.addBox(-PIVOT_POINT_RADIUS, -PIVOT_POINT_RADIUS, PIVOT_POINT_RADIUS, PIVOT_POINT_RADIUS)
+    out.write(buildSvgTag(ctx.bounds.viewBox(DEFAULT_VIEW_BOX)))
+    out.write(buildTitle(ctx.title))
+    out.write(buildDescription(ctx.description))
+    out.write(METADATA)
+    out.write(PIVOT_POINT)
+    trace = channel(ctx.trace, "serialize")
+    if ctx.metrics is not None:
+        writeItemsMeasured(ctx.items, out, ctx.metrics, trace)
+    else:
+        for it in ctx.items:
+            if trace is not None:
+                trace(type(it).__name__, "at", out.written + out.size)
+            writeItem(out, it)
+            out.write("\n")
+    out.write("</svg>")
+    out.flush()
+
+    summary = channel(ctx.trace, "serialize", INFO)
+    if summary is not None:
+        summary(f"{len(ctx.items)} items, {out.written} characters written")
+
+
+# writes the items while timing the curve flattening (paths) apart from serializing every other item
+# the time spent writing to the file is timed by the SvgWriter, as the "write" phase (not as curves or serialize)
+def writeItemsMeasured(items, out, metrics, trace=None):
+    for it in items:
+        if trace is not None:
+            trace(type(it).__name__, "at", out.written + out.size)
+        with metrics.phase("curves" if isinstance(it, illustratorPath) else "serialize"):
+            writeItem(out, it)
+            out.write("\n")
@@ -0,0 +1,64 @@
+"""
+File: curveFlattening.py
+Name: Cody J. McBride
+Contact: cody.mcbride@unh.edu
+Description: Draws Bezier curves as straight segments, all curves of a path at once with NumPy
+Version: 0.1
+Date: 10/18/2026
+General Notes:
+    Each curve gets just enough segments to stay within a chord tolerance (distance between the
+    curve and its segments), in the units of the points it's given (S100 millimetres after the
+    page transform). The number of segments comes from Wang's formula:
+        n = ceil(sqrt(d * (d - 1) / 8 * M / tolerance))
+    where d is the degree of the curve and M the largest second difference of its control points
+    (|P0 - 2 P1 + P2|, |P1 - 2 P2 + P3|). Flat curves get one segment, tight curves get many.
+    The curves are then evaluated in their Bernstein form at all of their parameters in one NumPy call.
+"""
+
+# default chord tolerance, in S100 millimetres
+DEFAULT_TOLERANCE = 0.005
+
+# a single curve never gets more segments than this, however small the tolerance
+MAX_SEGMENTS = 256
+
+
+# number of segments each curve needs to stay within tolerance (Wang's formula)
+# Argument: controlPoints
+# (curves, degree + 1, 2) array of control points
+# returns an int array with one segment count per curve
+def segmentCounts(controlPoints, tolerance=DEFAULT_TOLERANCE):
+    import numpy as np
+    degree = controlPoints.shape[1] - 1
+    secondDifferences = controlPoints[:, :-2] - 2 * controlPoints[:, 1:-1] + controlPoints[:, 2:]
+    largest = np.sqrt((secondDifferences ** 2).sum(axis=2)).max(axis=1)
+    counts = np.ceil(np.sqrt(degree * (degree - 1) / 8 * largest / tolerance))
+    return np.clip(counts, 1, MAX_SEGMENTS).astype(np.int64)
+
+
+# flattens curves of the same degree
+# Argument: controlPoints
+# (curves, degree + 1, 2) array of control points, the first point of each curve is its start point
+# Argument: tolerance (optional)
+# largest distance allowed between a curve and its segments
+# returns (points, counts): the end points of the segments of every curve, one curve after the other
+# (start points left out), and the number of segments of each curve
+def flattenCurves(controlPoints, tolerance=DEFAULT_TOLERANCE):
+    import numpy as np
+    controlPoints = np.asarray(controlPoints, dtype=np.float64)
+    if len(controlPoints) == 0:
+        return np.empty((0, 2)), np.empty(0, dtype=np.int64)
+
+    counts = segmentCounts(controlPoints, tolerance)
+    curve = np.repeat(np.arange(len(counts)), counts)
+    # parameter of every segment end point: 1/n, 2/n, ... 1 for each curve
+    firsts = np.cumsum(counts) - counts
+    t = ((np.arange(len(curve)) - firsts[curve] + 1) / counts[curve])[:, None]
+    s = 1 - t
+
+    points = controlPoints[curve]
+    if controlPoints.shape[1] == 4:
+        flat = (s * s * s) * points[:, 0] + (3 * s * s * t) * points[:, 1] \
+            + (3 * s * t * t) * points[:, 2] + (t * t * t) * points[:, 3]
+    else:
+        flat = (s * s) * points[:, 0] + (2 * s * t) * points[:, 1] + (t * t) * points[:, 2]
+    return flat, counts
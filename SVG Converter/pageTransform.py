@@ -0,0 +1,185 @@
+"""
+File: pageTransform.py
+Name: Cody J. McBride
+Contact: cody.mcbride@unh.edu
+Description: Affine transforms from the Illustrator page (points) to S100 symbol coordinates, including
+             the transform attributes of groups and shapes
+Version: 0.3
+Date: 10/18/2026
+General Notes:
+    Illustrator writes coordinates in points with the origin in the top left corner of the viewBox.
+    S100 symbols are drawn in millimetres scaled by MM_TO_S100, with the pivot point in the centre,
+    so the page maps to S100 with one affine transform:
+        x' = SCALE * x - SCALE * viewBoxWidth / 2
+        y' = SCALE * y - SCALE * viewBoxHeight / 2
+    Every shape uses this transform instead of its own formula.
+    Shapes with many points (polygons, paths) transform all of them in a single NumPy call,
+    shapes with one or two points use the scalar functions so NumPy is only imported when needed.
+    Groups and shapes can have a transform attribute. Ex. transform="translate(10 5) rotate(30)"
+    The page transform is composed with the transform of every group around a shape and with the
+    shape's own transform into a single 3x3 matrix, so a point is transformed once however deep it is
+    nested. Composed transforms are cached by their parent, per transform attribute, so the groups and
+    shapes that share a transform share one PageTransform (and the sines and cosines of a rotation are
+    computed once).
+    An ellipse stays an ellipse under any affine transform, with other radii and a rotation (ellipse).
+Version History
+[0.3]
+    Radii and rotation of transformed ellipses (ellipse)
+[0.2]
+    Parses transform attributes (matrix, translate, scale, rotate, skewX, skewY) and composes them (compose)
+[0.1]
+    Page to S100 transform
+"""
+
+# import system libraries
+import math
+import re
+
+# Illustrator saves drawings in points regardless of the chosen units
+POINTS_TO_MM = 0.3527777778
+MM_TO_S100 = 0.039408866995
+SCALE = POINTS_TO_MM * MM_TO_S100
+
+IDENTITY = ((1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0))
+
+# one transform of a transform attribute. Ex. rotate(30 10 10)
+TRANSFORM_PATTERN = re.compile("(matrix|translate|scale|rotate|skewX|skewY)\\s*\\(([^)]*)\\)")
+
+# a number in a transform. Ex. -1.5 or 2e-3
+NUMBER_PATTERN = re.compile("[-+]?(?:[0-9]+\\.?[0-9]*|\\.[0-9]+)(?:[eE][-+]?[0-9]+)?")
+
+
+'''
+    Page to S100 transform of a conversion, built from the Illustrator viewBox, or composed with the
+    transforms of the groups and shapes on the page (see compose)
+
+    Class Members:
+        matrix          3x3 affine matrix (row major, tuples), maps (x, y, 1) page points to S100 points
+        scale           how much lengths are scaled (the square root of the area scale), exact when
+                        the matrix doesn't stretch one direction more than the other
+        composed        transform attribute -> PageTransform composed with it, see compose
+'''
+class PageTransform:
+    def __init__(self, viewBoxWidth=0, viewBoxHeight=0, scale=SCALE, matrix=None):
+        if matrix is None:
+            matrix = ((scale, 0.0, -scale * viewBoxWidth / 2),
+                      (0.0, scale, -scale * viewBoxHeight / 2),
+                      (0.0, 0.0, 1.0))
+        self.matrix = matrix
+        self.scale = math.sqrt(abs(matrix[0][0] * matrix[1][1] - matrix[0][1] * matrix[1][0]))
+        self.offsetX = matrix[0][2]
+        self.offsetY = matrix[1][2]
+        self.composed = {}
+        # the matrix as a NumPy array, made the first time many points are transformed
+        self.array = None
+
+    # the transform for something inside a group or shape with a transform attribute
+    # Argument: transform
+    # value of the transform attribute. Ex. matrix(0.7071 -0.7071 0.7071 0.7071 -76.3 265.3)
+    # returns the PageTransform that applies transform first and then this one
+    def compose(self, transform):
+        composed = self.composed.get(transform)
+        if composed is None:
+            composed = PageTransform(matrix=multiply(self.matrix, parseTransform(transform)))
+            self.composed[transform] = composed
+        return composed
+
+    # True when x' only depends on x and y' only on y (no rotation or skew)
+    def isAxisAligned(self):
+        return self.matrix[0][1] == 0 and self.matrix[1][0] == 0
+
+    # x and y are only for axis aligned transforms, use point otherwise
+    def x(self, x):
+        return self.matrix[0][0] * x + self.offsetX
+
+    def y(self, y):
+        return self.matrix[1][1] * y + self.offsetY
+
+    def point(self, x, y):
+        (a, c, e), (b, d, f), _ = self.matrix
+        return a * x + c * y + e, b * x + d * y + f
+
+    # transforms a distance (width, radius, relative move), distances aren't offset
+    def length(self, value):
+        return self.scale * value
+
+    # the ellipse an axis aligned ellipse (radii rx along x and ry along y) is transformed into
+    # returns (radius along its rotated x-axis, radius along its rotated y-axis, rotation in degrees)
+    def ellipse(self, rx, ry):
+        (a, c, _), (b, d, _), _ = self.matrix
+        # the columns of m are the transformed radii, the singular values of m are the radii of the
+        # transformed ellipse and the rotation of its left singular vectors is the ellipse's rotation
+        m00, m01, m10, m11 = a * rx, c * ry, b * rx, d * ry
+        e = (m00 + m11) / 2
+        f = (m00 - m11) / 2
+        g = (m10 + m01) / 2
+        h = (m10 - m01) / 2
+        q = math.hypot(e, h)
+        r = math.hypot(f, g)
+        angle = math.degrees((math.atan2(h, e) + math.atan2(g, f)) / 2)
+        # the same ellipse turned by 180 degrees, the rotation is kept in (-90, 90]
+        return q + r, abs(q - r), 90 - (90 - angle) % 180
+
+    # transforms many points at once
+    # Argument: points
+    # (n, 2) array-like of page points, or a flat sequence of x, y pairs
+    # returns an (n, 2) float64 NumPy array of S100 points
+    def points(self, points):
+        import numpy as np
+        if self.array is None:
+            self.array = np.array(self.matrix, dtype=np.float64)
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        return points @ self.array[:2, :2].T + self.array[:2, 2]
+
+    # transforms many distances at once (Ex. the relative segments of a path)
+    def lengths(self, values):
+        import numpy as np
+        return np.asarray(values, dtype=np.float64) * self.scale
+
+
+# product of two 3x3 matrices, the transform that applies right first and then left
+def multiply(left, right):
+    return tuple(tuple(sum(left[row][k] * right[k][column] for k in range(3)) for column in range(3))
+                 for row in range(3))
+
+
+# matrix of a transform attribute, its transforms are applied from the last one to the first
+# Argument: text
+# value of the transform attribute. Ex. translate(10 5) rotate(30)
+# raises ValueError for transforms that aren't valid
+def parseTransform(text):
+    matrix = IDENTITY
+    end = 0
+    for match in TRANSFORM_PATTERN.finditer(text):
+        if text[end:match.start()].strip(" \t\r\n,"):
+            break
+        name = match.group(1)
+        values = [float(value) for value in NUMBER_PATTERN.findall(match.group(2))]
+        matrix = multiply(matrix, transformMatrix(name, values, text))
+        end = match.end()
+    if text[end:].strip(" \t\r\n,"):
+        raise ValueError(f"Invalid transform: {text}")
+    return matrix
+
+
+# matrix of a single transform. Ex. rotate with [30, 10, 10]
+def transformMatrix(name, values, text=""):
+    count = len(values)
+    if name == "matrix" and count == 6:
+        a, b, c, d, e, f = values
+        return (a, c, e), (b, d, f), (0.0, 0.0, 1.0)
+    if name == "translate" and count in (1, 2):
+        return (1.0, 0.0, values[0]), (0.0, 1.0, values[1] if count == 2 else 0.0), (0.0, 0.0, 1.0)
+    if name == "scale" and count in (1, 2):
+        return (values[0], 0.0, 0.0), (0.0, values[-1], 0.0), (0.0, 0.0, 1.0)
+    if name == "rotate" and count in (1, 3):
+        angle = math.radians(values[0])
+        cos, sin = math.cos(angle), math.sin(angle)
+        cx, cy = (values[1], values[2]) if count == 3 else (0.0, 0.0)
+        # rotation about (cx, cy): translate(cx cy) rotate(angle) translate(-cx -cy)
+        return (cos, -sin, cx - cos * cx + sin * cy), (sin, cos, cy - sin * cx - cos * cy), (0.0, 0.0, 1.0)
+    if name == "skewX" and count == 1:
+        return (1.0, math.tan(math.radians(values[0])), 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0)
+    if name == "skewY" and count == 1:
+        return (1.0, 0.0, 0.0), (math.tan(math.radians(values[0])), 1.0, 0.0), (0.0, 0.0, 1.0)
+    raise ValueError(f"Invalid transform: {text or name}")
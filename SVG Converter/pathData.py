@@ -0,0 +1,426 @@
+"""
+File: pathData.py
+Name: Cody J. McBride
+Contact: cody.mcbride@unh.edu
+Description: Parser for the d attribute of svg paths and the points attribute of polygons and polylines
+Version: 0.3
+Date: 10/18/2026
+General Notes:
+    The d attribute is split into single commands with regular expressions, then the commands are resolved
+    to absolute coordinates. Long paths (CUMULATIVE_MINIMUM commands or more) are resolved with NumPy: the
+    relative offsets become absolute with one cumulative sum per coordinate, anchored at the absolute commands
+    and at the closes (which go back to the start of their subpath). Short paths are resolved one command at
+    a time, NumPy's overhead is larger than what it saves on them.
+    Every svg path command is understood (M L H V C S Q T A Z, relative and absolute), including
+    implicitly repeated commands (Ex. "l1,2 3,4"), exponents (Ex. 1e-3) and numbers Illustrator
+    writes without separators (Ex. "c0.5-1.2.3.4"). The flags of arcs are single digits, so they can
+    run into the numbers around them (Ex. "a1 1 0 011 1" is rx 1, ry 1, rotation 0, flags 0 and 1, to 1,1).
+    The result only uses five commands, so the rest of the converter only has to handle those:
+        M x y               move to
+        L x y               line to            (also H, V and the relative forms)
+        C x1 y1 x2 y2 x y   cubic Bezier       (also S, and A which is approximated with cubics)
+        Q x1 y1 x y         quadratic Bezier   (also T)
+        Z                   close path
+    The coordinates of all commands are kept in a single float64 NumPy array (x, y pairs).
+    The points of polygons and polylines (Ex. points="298,421 414.5,-332 2e1,243") are read straight into
+    a float64 NumPy array by NumPy's own number scanner (parsePoints), a regular expression only reads
+    the lists it can't (Ex. numbers without separators, "10-5").
+Version History
+[0.3]
+    Arc flags are read as single digits
+    Long paths are resolved with cumulative sums instead of one command at a time
+    Arcs with radii too small to reach their end point are centred exactly half way between the end points
+[0.2]
+    parsePoints for the points attribute
+[0.1]
+    Path data parser
+"""
+import functools
+import math
+import re
+import warnings
+
+# a command letter and everything up to the next one
+COMMAND_PATTERN = re.compile("([MmLlHhVvCcSsQqTtAaZz])([^MmLlHhVvCcSsQqTtAaZz]*)")
+
+# a number. Ex. -1.5 or 2e-3
+NUMBER = "[-+]?(?:[0-9]+\\.?[0-9]*|\\.[0-9]+)(?:[eE][-+]?[0-9]+)?"
+NUMBER_PATTERN = re.compile(NUMBER)
+
+# the seven arguments of an arc, the two flags are single digits that need no separator. Ex. "1 1 0 011 1"
+ARC_ARGUMENTS_PATTERN = re.compile("[\\s,]*".join(["(" + NUMBER + ")"] * 3 + ["([01])"] * 2 + ["(" + NUMBER + ")"] * 2))
+
+# number of values each command takes
+ARGUMENT_COUNTS = {"M": 2, "L": 2, "H": 1, "V": 1, "C": 6, "S": 4, "Q": 4, "T": 2, "A": 7, "Z": 0}
+
+# paths with fewer commands are resolved one command at a time, NumPy's overhead is larger than the
+# time it saves on them
+CUMULATIVE_MINIMUM = 512
+
+# number of coordinates (x, y pairs) each command of the result has
+POINT_COUNTS = {"M": 1, "L": 1, "C": 3, "Q": 2, "Z": 0}
+
+# command of the result for each command
+RESULT_COMMANDS = {"M": "M", "L": "L", "H": "L", "V": "L", "C": "C", "S": "C", "Q": "Q", "T": "Q", "A": "C", "Z": "Z"}
+
+# column of the end x and end y in the arguments of each command, -1 when the command doesn't change it
+END_COLUMNS = {"M": (0, 1), "L": (0, 1), "H": (0, -1), "V": (-1, 0), "C": (4, 5), "S": (2, 3), "Q": (2, 3),
+               "T": (0, 1), "A": (5, 6), "Z": (-1, -1)}
+
+
+# lookup tables indexed by the ascii code of a command letter, built on first use so NumPy is only
+# imported when a path is parsed
+# returns the argument counts, end x columns, end y columns and result point counts of the commands
+@functools.lru_cache(maxsize=None)
+def commandTables():
+    import numpy as np
+    tables = np.zeros((4, 128), dtype=np.int64)
+    for letter, (endX, endY) in END_COLUMNS.items():
+        tables[:, ord(letter)] = ARGUMENT_COUNTS[letter], endX, endY, POINT_COUNTS[RESULT_COMMANDS[letter]]
+    return tables
+
+
+'''
+    Parsed path data
+
+    Class Members:
+        commands        string of command letters, one per command (only M, L, C, Q and Z)
+        coords          float64 NumPy array with the (x, y) points of the commands, shape (n, 2)
+'''
+class PathData:
+    __slots__ = ("commands", "coords")
+
+    def __init__(self, commands, coords):
+        self.commands = commands
+        self.coords = coords
+
+    def __len__(self):
+        return len(self.commands)
+
+    # yields (command, points) for every command, points is a view into coords
+    def segments(self):
+        index = 0
+        for command in self.commands:
+            count = POINT_COUNTS[command]
+            yield command, self.coords[index:index + count]
+            index += count
+
+
+# parses the value of a d attribute
+# Argument: d
+# path data. Ex. "M10,20h5.5c0.5-1.2.3.4,1,1z"
+# returns a PathData with absolute coordinates
+def parsePathData(d):
+    letters, numbers = splitCommands(d)
+    if len(letters) < CUMULATIVE_MINIMUM:
+        return resolveInOrder(letters, numbers)
+    return resolveCumulative(letters, numbers)
+
+
+# splits path data into single commands, implicitly repeated commands are split up and the numbers
+# after the first pair of a move are line-tos
+# Argument: d
+# path data
+# returns (string of command letters, one per command, list of their arguments as strings)
+def splitCommands(d):
+    letters = []
+    numbers = []
+    for letter, arguments in COMMAND_PATTERN.findall(d):
+        command = letter.upper()
+        if command == "Z":
+            letters.append(letter)
+            continue
+        if command == "A":
+            found = [value for match in ARC_ARGUMENTS_PATTERN.findall(arguments) for value in match]
+        else:
+            found = NUMBER_PATTERN.findall(arguments)
+        count = ARGUMENT_COUNTS[command]
+        repeats = len(found) // count
+        if repeats == 0:
+            continue
+        if command == "M":
+            letters.append(letter + ("L" if letter == command else "l") * (repeats - 1))
+        else:
+            letters.append(letter * repeats)
+        numbers.extend(found[:repeats * count])
+    return "".join(letters), numbers
+
+
+# resolves the commands to absolute coordinates one at a time, faster than NumPy for short paths
+# Arguments: letters, numbers
+# split commands (splitCommands)
+# returns a PathData
+def resolveInOrder(letters, numbers):
+    import numpy as np
+    numbers = list(map(float, numbers))
+    commands = []
+    coords = []
+    curX = curY = 0.0
+    startX = startY = 0.0
+    # last control point, for the S and T shorthands
+    controlX = controlY = 0.0
+    previous = ""
+    index = 0
+
+    for letter in letters:
+        command = letter.upper()
+        count = ARGUMENT_COUNTS[command]
+        values = numbers[index:index + count]
+        index += count
+        offsetX, offsetY = (curX, curY) if letter != command else (0.0, 0.0)
+
+        if command == "Z":
+            commands.append("Z")
+            curX, curY = startX, startY
+        elif command == "M":
+            curX, curY = values[0] + offsetX, values[1] + offsetY
+            startX, startY = curX, curY
+            commands.append("M")
+            coords.extend((curX, curY))
+        elif command == "L" or command == "H" or command == "V":
+            if command != "V":
+                curX = values[0] + offsetX
+            if command != "H":
+                curY = values[-1] + offsetY
+            commands.append("L")
+            coords.extend((curX, curY))
+        elif command == "C" or command == "S":
+            if command == "C":
+                x1, y1 = values[0] + offsetX, values[1] + offsetY
+                values = values[2:]
+            elif previous == "C" or previous == "S":
+                # reflection of the previous control point
+                x1, y1 = 2 * curX - controlX, 2 * curY - controlY
+            else:
+                x1, y1 = curX, curY
+            controlX, controlY = values[0] + offsetX, values[1] + offsetY
+            curX, curY = values[2] + offsetX, values[3] + offsetY
+            commands.append("C")
+            coords.extend((x1, y1, controlX, controlY, curX, curY))
+        elif command == "Q" or command == "T":
+            if command == "Q":
+                controlX, controlY = values[0] + offsetX, values[1] + offsetY
+                values = values[2:]
+            elif previous == "Q" or previous == "T":
+                controlX, controlY = 2 * curX - controlX, 2 * curY - controlY
+            else:
+                controlX, controlY = curX, curY
+            curX, curY = values[0] + offsetX, values[1] + offsetY
+            commands.append("Q")
+            coords.extend((controlX, controlY, curX, curY))
+        elif command == "A":
+            endX, endY = values[5] + offsetX, values[6] + offsetY
+            for cubic in arcToCubics(curX, curY, *values[:5], endX, endY):
+                commands.append("C")
+                coords.extend(cubic)
+            curX, curY = endX, endY
+        previous = command
+
+    return PathData("".join(commands), np.array(coords, dtype=np.float64).reshape(-1, 2))
+
+
+# resolves the commands to absolute coordinates with cumulative sums of the relative offsets
+# Arguments: letters, numbers
+# split commands (splitCommands)
+# returns a PathData
+def resolveCumulative(letters, numbers):
+    import numpy as np
+
+    size = len(letters)
+    numbers = np.array(list(map(float, numbers)), dtype=np.float64)
+    codes = np.frombuffer(letters.encode("ascii"), dtype=np.uint8)
+    # lower case letters are relative, their ascii codes only differ from upper case ones in one bit
+    relative = (codes & 0x20) != 0
+    codes = codes & ~np.uint8(0x20)
+    rows = np.arange(size)
+    counts, columnsX, columnsY, points = commandTables()[:, codes]
+
+    # the arguments of every command, one row each, padded with zeros
+    columns = np.arange(7)
+    used = columns < counts[:, None]
+    values = np.zeros((size, 7))
+    values[used] = numbers[((np.cumsum(counts) - counts)[:, None] + columns)[used]]
+
+    # end point of every command, the move starting the subpath of each is needed for the closes
+    isClose = codes == ord("Z")
+    subpaths = np.maximum.accumulate(np.where(codes == ord("M"), rows, -1))
+    endX = resolveOffsets(values[rows, np.maximum(columnsX, 0)], columnsX >= 0, relative, isClose, subpaths)
+    endY = resolveOffsets(values[rows, np.maximum(columnsY, 0)], columnsY >= 0, relative, isClose, subpaths)
+
+    # commands start where the previous one ended
+    fromX = np.concatenate(([0.0], endX[:-1]))
+    fromY = np.concatenate(([0.0], endY[:-1]))
+    offsetX = np.where(relative, fromX, 0.0)
+    offsetY = np.where(relative, fromY, 0.0)
+
+    isCubic = (codes == ord("C")) | (codes == ord("S"))
+    isQuadratic = (codes == ord("Q")) | (codes == ord("T"))
+    isSmooth = codes == ord("S")
+    # second control point of cubics
+    control2X = np.where(isSmooth, values[:, 0], values[:, 2]) + offsetX
+    control2Y = np.where(isSmooth, values[:, 1], values[:, 3]) + offsetY
+    # first control point of cubics and quadratics, S and T reflect the previous control point
+    control1X = values[:, 0] + offsetX
+    control1Y = values[:, 1] + offsetY
+    reflect = np.zeros(size, dtype=bool)
+    reflect[1:] = isCubic[:-1]
+    reflect &= isSmooth
+    previousX = np.concatenate(([0.0], control2X[:-1]))
+    previousY = np.concatenate(([0.0], control2Y[:-1]))
+    control1X[isSmooth] = np.where(reflect, 2 * fromX - previousX, fromX)[isSmooth]
+    control1Y[isSmooth] = np.where(reflect, 2 * fromY - previousY, fromY)[isSmooth]
+    # each T reflects the control point of the one before it, so those are chained in order
+    for index in np.flatnonzero(codes == ord("T")).tolist():
+        if index > 0 and isQuadratic[index - 1]:
+            control1X[index] = 2 * fromX[index] - control1X[index - 1]
+            control1Y[index] = 2 * fromY[index] - control1Y[index - 1]
+        else:
+            control1X[index], control1Y[index] = fromX[index], fromY[index]
+
+    # arcs are approximated with cubics, their number is only known once they are
+    arcs = {}
+    for index in np.flatnonzero(codes == ord("A")).tolist():
+        arcs[index] = arcToCubics(float(fromX[index]), float(fromY[index]), *values[index, :5].tolist(),
+                                  float(endX[index]), float(endY[index]))
+    for index, cubics in arcs.items():
+        points[index] = 3 * len(cubics)
+    starts = np.cumsum(points) - points
+    coords = np.empty((int(points.sum()), 2))
+
+    # the end point is the last point of every command
+    ends = ~isClose & (points > 0)
+    ends[list(arcs)] = False
+    coords[(starts + points - 1)[ends]] = np.column_stack((endX, endY))[ends]
+    controls = isCubic | isQuadratic
+    coords[starts[controls]] = np.column_stack((control1X, control1Y))[controls]
+    coords[starts[isCubic] + 1] = np.column_stack((control2X, control2Y))[isCubic]
+    for index, cubics in arcs.items():
+        if cubics:
+            coords[starts[index]:starts[index] + points[index]] = np.array(cubics).reshape(-1, 2)
+
+    commands = [RESULT_COMMANDS[letter] for letter in letters.upper()]
+    for index, cubics in arcs.items():
+        commands[index] = "C" * len(cubics)
+    return PathData("".join(commands), coords)
+
+
+# resolves one coordinate (x or y) of the end points of the commands with one cumulative sum
+# Argument: values
+# the coordinate as written in each command
+# Argument: changes
+# boolean array of the commands that change the coordinate (Ex. not the x of a V)
+# Argument: relative, isClose
+# boolean arrays of the relative commands and the closes
+# Argument: subpaths
+# index of the move starting the subpath of each command, -1 before the first move
+# returns the absolute coordinates
+def resolveOffsets(values, changes, relative, isClose, subpaths):
+    import numpy as np
+    # absolute values and closes are anchors, the rest are offsets from the command before
+    anchors = (changes & ~relative) | isClose
+    totals = np.cumsum(np.where(anchors | ~changes, 0.0, values))
+    last = np.maximum.accumulate(np.where(anchors, np.arange(len(values)), -1))
+    anchorValues = np.where(anchors, values, 0.0)
+
+    # a close goes back to the start of its subpath, the value of its move
+    closes = np.flatnonzero(isClose)
+    if len(closes):
+        moves = subpaths[closes]
+        anchors = np.where(moves >= 0, last[np.maximum(moves, 0)], -1)
+        anchorValues[closes] = (np.where(anchors >= 0, anchorValues[anchors] - totals[anchors], 0.0)
+                                + np.where(moves >= 0, totals[np.maximum(moves, 0)], 0.0))
+        # moves that hang off an earlier close (Ex. "z m1,1") need that close first, so those are chained in order
+        chained = (anchors >= 0) & isClose[anchors]
+        for index, anchor, move in zip(closes[chained].tolist(), anchors[chained].tolist(), moves[chained].tolist()):
+            anchorValues[index] = anchorValues[anchor] - totals[anchor] + totals[move]
+
+    return np.where(last >= 0, anchorValues[last] - totals[last], 0.0) + totals
+
+
+# approximates an svg elliptical arc with cubic Bezier curves (at most 90 degrees each)
+# Argument: x0, y0
+# start point of the arc
+# Argument: rx, ry, rotation, largeArc, sweep
+# arc parameters as written in the path (rotation in degrees)
+# Argument: x, y
+# end point of the arc
+# returns a list of (x1, y1, x2, y2, x, y) tuples
+def arcToCubics(x0, y0, rx, ry, rotation, largeArc, sweep, x, y):
+    rx, ry = abs(rx), abs(ry)
+    if rx == 0 or ry == 0 or (x0 == x and y0 == y):
+        # degenerate arcs are straight lines
+        return [(x0, y0, x, y, x, y)] if (x0, y0) != (x, y) else []
+
+    # endpoint to centre parameterization (svg specification, appendix F.6.5)
+    phi = math.radians(rotation % 360)
+    cosPhi, sinPhi = math.cos(phi), math.sin(phi)
+    dx, dy = (x0 - x) / 2, (y0 - y) / 2
+    x1p = cosPhi * dx + sinPhi * dy
+    y1p = -sinPhi * dx + cosPhi * dy
+
+    # radii too small to reach the end point are scaled up
+    scale = (x1p * x1p) / (rx * rx) + (y1p * y1p) / (ry * ry)
+    if scale >= 1:
+        # the centre is half way between the end points, computing it would only add rounding errors
+        rx, ry = rx * math.sqrt(scale), ry * math.sqrt(scale)
+        factor = 0.0
+    else:
+        numerator = rx * rx * ry * ry - rx * rx * y1p * y1p - ry * ry * x1p * x1p
+        denominator = rx * rx * y1p * y1p + ry * ry * x1p * x1p
+        factor = math.sqrt(max(0.0, numerator / denominator))
+        if bool(largeArc) == bool(sweep):
+            factor = -factor
+    cxp = factor * rx * y1p / ry
+    cyp = -factor * ry * x1p / rx
+    cx = cosPhi * cxp - sinPhi * cyp + (x0 + x) / 2
+    cy = sinPhi * cxp + cosPhi * cyp + (y0 + y) / 2
+
+    startAngle = math.atan2((y1p - cyp) / ry, (x1p - cxp) / rx)
+    sweepAngle = math.atan2((-y1p - cyp) / ry, (-x1p - cxp) / rx) - startAngle
+    if sweep and sweepAngle < 0:
+        sweepAngle += 2 * math.pi
+    elif not sweep and sweepAngle > 0:
+        sweepAngle -= 2 * math.pi
+
+    pieces = max(1, math.ceil(abs(sweepAngle) / (math.pi / 2) - 1e-9))
+    step = sweepAngle / pieces
+    # length of the control arms of a cubic approximating a circular arc of 'step' radians
+    arm = 4 / 3 * math.tan(step / 4)
+
+    cubics = []
+    angle = startAngle
+    for piece in range(pieces):
+        nextAngle = angle + step
+        cos1, sin1 = math.cos(angle), math.sin(angle)
+        cos2, sin2 = math.cos(nextAngle), math.sin(nextAngle)
+        # control points on the unit circle, then scaled, rotated and moved onto the ellipse
+        points = ((cos1 - arm * sin1, sin1 + arm * cos1), (cos2 + arm * sin2, sin2 - arm * cos2), (cos2, sin2))
+        cubic = []
+        for ux, uy in points:
+            cubic.append(cosPhi * rx * ux - sinPhi * ry * uy + cx)
+            cubic.append(sinPhi * rx * ux + cosPhi * ry * uy + cy)
+        if piece == pieces - 1:
+            # end exactly on the end point
+            cubic[4], cubic[5] = x, y
+        cubics.append(tuple(cubic))
+        angle = nextAngle
+    return cubics
+
+
+# parses the value of a points attribute
+# Argument: text
+# list of coordinates separated by whitespace and/or commas. Ex. "298,421 414.5,-332 2e1,243 "
+# returns an (n, 2) float64 NumPy array of the points, an odd last number is left out
+def parsePoints(text):
+    import numpy as np
+    if not text.strip():
+        return np.empty((0, 2))
+    with warnings.catch_warnings():
+        # NumPy warns (or raises) when it can't read the whole list
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            values = np.fromstring(text.replace(",", " "), sep=" ")
+        except (DeprecationWarning, ValueError):
+            values = np.array(NUMBER_PATTERN.findall(text), dtype=np.float64)
+    # the svg specification says to draw up to the error
+    return values[:len(values) // 2 * 2].reshape(-1, 2)
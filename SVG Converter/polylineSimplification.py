@@ -0,0 +1,133 @@
+"""
+File: polylineSimplification.py
+Name: Cody J. McBride
+Contact: cody.mcbride@unh.edu
+Description: Removes the points of a polyline that lie (almost) on the line between their neighbours,
+             Douglas-Peucker with NumPy
+Version: 0.1
+Date: 10/18/2026
+General Notes:
+    Douglas-Peucker keeps the ends of a polyline, finds the point farthest from the segment between
+    them and, when it's farther than the tolerance, keeps it and does the same for both halves.
+    Points closer than the tolerance to the segment of the part they're in are dropped.
+    Instead of recursing, every part that still has to be split is handled in the same round: the
+    distances of all of their points are computed with one set of NumPy calls, so a round takes time
+    linear in the number of points, and there are as many rounds as the splitting is deep.
+    The tolerance is in the units of the points (S100 millimetres after the page transform).
+"""
+from tracing import channel
+
+
+# which points of a polyline are kept
+# Argument: points
+# (n, 2) NumPy array
+# Argument: tolerance
+# largest distance between a dropped point and the simplified polyline
+# Argument: fixed (optional)
+# sorted indices of points that are always kept (Ex. the ends of the subpaths of a path), the parts
+# between them are simplified on their own. Defaults to the first and last point
+# returns an (n,) bool NumPy array, True for the points that are kept
+def simplifyMask(points, tolerance, fixed=None):
+    import numpy as np
+    count = len(points)
+    keep = np.zeros(count, dtype=bool)
+    if count < 3:
+        keep[:] = True
+        return keep
+    if fixed is None:
+        fixed = np.array([0, count - 1])
+    fixed = np.asarray(fixed, dtype=np.int64)
+    keep[fixed] = True
+
+    # separate x and y columns, NumPy is much faster with them than with sums over the short axis
+    xs = np.ascontiguousarray(points[:, 0], dtype=np.float64)
+    ys = np.ascontiguousarray(points[:, 1], dtype=np.float64)
+    starts = fixed[:-1]
+    ends = fixed[1:]
+    while True:
+        # only parts with points between their ends have anything to simplify
+        interior = ends - starts - 1
+        split = interior > 0
+        starts, ends, interior = starts[split], ends[split], interior[split]
+        if len(starts) == 0:
+            break
+
+        # every point between the ends of a part, and the part it belongs to
+        part = np.repeat(np.arange(len(starts)), interior)
+        offsets = np.cumsum(interior) - interior
+        index = np.arange(len(part)) - offsets[part] + starts[part] + 1
+
+        # squared distances, the largest is the same point and it's compared with the squared tolerance
+        first, last = starts[part], ends[part]
+        distances = squaredSegmentDistances(xs[index], ys[index], xs[first], ys[first], xs[last], ys[last])
+        farthest = np.maximum.reduceat(distances, offsets)
+
+        # the first point of each part at its largest distance (the parts are in order)
+        candidates = np.flatnonzero(distances == farthest[part])
+        candidateParts = part[candidates]
+        first = np.flatnonzero(np.concatenate(([True], candidateParts[1:] != candidateParts[:-1])))
+        chosen = index[candidates[first]]
+
+        split = farthest > tolerance * tolerance
+        chosen = chosen[split]
+        keep[chosen] = True
+        starts, ends = np.concatenate((starts[split], chosen)), np.concatenate((chosen, ends[split]))
+    return keep
+
+
+# squared distance of each point (x, y) to the segment from (x0, y0) to (x1, y1), to (x0, y0) when they're the same
+def squaredSegmentDistances(x, y, x0, y0, x1, y1):
+    import numpy as np
+    dx = x1 - x0
+    dy = y1 - y0
+    rx = x - x0
+    ry = y - y0
+    lengths = dx * dx + dy * dy
+    t = np.divide(rx * dx + ry * dy, lengths, out=np.zeros(len(x)), where=lengths > 0)
+    np.clip(t, 0.0, 1.0, out=t)
+    rx -= t * dx
+    ry -= t * dy
+    return rx * rx + ry * ry
+
+
+# simplifies the vertices of a path written as runs of commands
+# Argument: vertices
+# (n, 2) NumPy array, the points of the runs one after the other
+# Argument: runs
+# [command, number of points] lists. Ex. [["M", 1], ["L", 40], ["z", 0]]
+# Argument: tolerance
+# largest distance between a dropped point and the simplified path
+# returns (vertices, runs) with the dropped points left out, the points of M commands and the last
+# point before every M are kept so subpaths are simplified on their own
+def simplifyRuns(vertices, runs, tolerance):
+    import numpy as np
+    fixed = {0, len(vertices) - 1}
+    start = 0
+    for command, count in runs:
+        if command == "M":
+            fixed.update(range(start, start + count))
+            fixed.add(start - 1)
+        start += count
+    fixed.discard(-1)
+
+    keep = simplifyMask(vertices, tolerance, sorted(fixed))
+    # number of points kept before each point
+    keptBefore = np.concatenate(([0], np.cumsum(keep))).tolist()
+    simplified = []
+    start = 0
+    for command, count in runs:
+        simplified.append([command, keptBefore[start + count] - keptBefore[start]])
+        start += count
+    return vertices[keep], simplified
+
+
+# counts the points going into and out of the simplification, and traces them (see tracing.py)
+# Argument: out
+# svgWriter.SvgWriter the shape is written into, its metrics and tracer are used
+def reportSimplification(out, shape, pointsIn, pointsOut):
+    if out.metrics is not None:
+        out.metrics.count("points in", pointsIn)
+        out.metrics.count("points out", pointsOut)
+    trace = channel(out.trace, "simplify")
+    if trace is not None:
+        trace(f"{shape}: {pointsIn} -> {pointsOut} points")
@@ -23,10 +23,18 @@ METADATA = f"\t<metadata>\n" \
            f"\t\t\t<iho:Description publisher=\"IHO\" creationDate=\"{now.month}/{now.day}/{now.year}\" source=\"S52Preslib4.0\" format=\"S100SVG\" version=\"0.1\" />\n" \
            f"\t\t</iho:S100SVG>\n" \
            f"\t</metadata>\n"
+# viewBox (x, y, width, height) of a file without shapes
+DEFAULT_VIEW_BOX = (-0.5, -0.5, 3.33, 2.78)
+def buildSvgTag(viewBox):
+    x, y, width, height = viewBox
+    return "<svg xmlns=\"http://www.w3.org/2000/svg\" version=\"1.2\" baseProfile=\"tiny\" " \
+           "xml:space=\"preserve\" style=\"shape-rendering:geometricPrecision; fill-rule:evenodd;\" " \
+           f"width=\"{width}mm\" height=\"{height}mm\" viewBox=\"{x} {y} {width} {height}\">\n"
 def buildTitle(title):
     return f"\t<title>{title}</title>\n"
 def buildDescription(desc):
     return f"\t<desc>{desc}</desc>\n"
 
-# This is the default pivot point generated from S100 tool kit
-PIVOT_POINT = "<circle class=\"pivotPoint layout\" fill=\"none\" cx=\"0.00\" cy=\"0.00\" r=\"0.4\" />\n"
\ No newline at end of file
+# This is the default pivot point generated from S100 tool kit, a circle around the origin
+PIVOT_POINT_RADIUS = 0.4
+PIVOT_POINT = f"<circle class=\"pivotPoint layout\" fill=\"none\" cx=\"0.00\" cy=\"0.00\" r=\"{PIVOT_POINT_RADIUS}\" />\n"
\ No newline at end of file
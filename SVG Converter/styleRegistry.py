@@ -0,0 +1,92 @@
+"""
+File: styleRegistry.py
+Name: Cody J. McBride
+Contact: cody.mcbride@unh.edu
+Description: Registry of the Illustrator css classes (.st0, .st1, ...) of a conversion
+Version: 0.1
+Date: 10/18/2026
+General Notes:
+    Shapes look their style up by the value of their class attribute. Ex. class="st0" or class="st0 st3"
+    Lookups are dictionary lookups (no scan over every class) and are cached per class attribute value.
+    Classes with identical definitions share one illustratorCssClass object.
+    When a shape has several classes, the properties are merged like css does it: a property declared
+    by a class that appears later in the style sheet wins, whatever the order in the class attribute.
+"""
+from classDefs import illustratorCssClass
+
+# properties of illustratorCssClass that a css class can declare, in the order they are copied
+PROPERTIES = ("fill", "stroke", "strokeWidth", "opacity", "strokeMiterLimit")
+
+
+class StyleRegistry:
+    def __init__(self):
+        # ".st0" -> illustratorCssClass
+        self.byName = {}
+        # ".st0" -> position in the style sheet, decides the cascade
+        self.order = {}
+        # definition -> illustratorCssClass, identical definitions share an object
+        self.interned = {}
+        # class attribute value -> resolved illustratorCssClass (or None when no class matched)
+        self.resolved = {}
+
+    def __len__(self):
+        return len(self.byName)
+
+    # adds a class parsed from the style sheet, a class defined twice gets both definitions merged
+    def add(self, cssClass):
+        existing = self.byName.get(cssClass.name)
+        if existing is not None:
+            cssClass = mergeClasses(cssClass.name, (existing, cssClass))
+        else:
+            self.order[cssClass.name] = len(self.order)
+
+        self.byName[cssClass.name] = self.intern(cssClass)
+        self.resolved.clear()
+
+    def intern(self, cssClass):
+        key = definitionKey(cssClass)
+        shared = self.interned.get(key)
+        if shared is None:
+            self.interned[key] = cssClass
+            return cssClass
+        return shared
+
+    # returns the class for a name as used in a class attribute (Ex. st0), or None
+    def get(self, name):
+        return self.byName.get("." + name)
+
+    # returns the style for the value of a class attribute. Ex. "st0" or "st0 st3"
+    # returns None when none of the classes are defined
+    def resolve(self, classAttribute):
+        if classAttribute in self.resolved:
+            return self.resolved[classAttribute]
+
+        names = ["." + name for name in classAttribute.split()]
+        matches = sorted((self.order[name], self.byName[name]) for name in set(names) if name in self.byName)
+
+        if not matches:
+            style = None
+        elif len(matches) == 1:
+            style = matches[0][1]
+        else:
+            style = self.intern(mergeClasses(" ".join(names), [cssClass for _, cssClass in matches]))
+
+        self.resolved[classAttribute] = style
+        return style
+
+
+# the definition of a class without its name, classes with equal keys are interchangeable
+def definitionKey(cssClass):
+    return tuple((name, getattr(cssClass, name)) for name in PROPERTIES if name in cssClass.declared)
+
+
+# merges classes in cascade order, properties declared by later classes win
+def mergeClasses(name, classes):
+    merged = illustratorCssClass()
+    merged.name = name
+    for cssClass in classes:
+        for prop in PROPERTIES:
+            if prop in cssClass.declared:
+                setattr(merged, prop, getattr(cssClass, prop))
+                merged.declared.add(prop)
+    return merged
@@ -0,0 +1,160 @@
+"""
+File: svgTokenizer.py
+Name: Cody J. McBride
+Contact: cody.mcbride@unh.edu
+Description: Streaming tokenizer, splits an Illustrator SVG file into elements (tag name and attributes)
+             and css rules without reading the whole file into memory
+Version: 0.4
+Date: 10/18/2026
+General Notes:
+    The file is read in fixed-size chunks and scanned once from < to > with str.find, so the time
+    taken is linear in the size of the file, however long its lines are.
+    Each start tag is split into its name and a dictionary of its attributes once, here, so the
+    converter can dispatch on the tag name and its parsers don't have to search the tag again.
+    The tokenizer yields (name, attributes, source) tuples:
+        start tags          ("rect", {"x": "10", ...}, "<rect x=\"10\" .../>")
+        <text> elements     ("text", {...}, "<text ...>...</text>"), the whole element including its content,
+                            or ("text", {...}, "<text .../>") for an empty one
+        css rules           (None, None, ".st0{fill:#FFFFFF;}"), the rules inside <style> elements
+        end tags            ("/g", None, "</g>"), the name with a / in front (groups end with them)
+    Comments, processing instructions (<?xml ...?>) and declarations (<!DOCTYPE ...>) are skipped.
+    Memory use is bounded by the chunk size plus the longest single element.
+Version History
+[0.4]
+    <text .../> is an empty element, the elements after it aren't skipped up to the next </text>
+[0.3]
+    Yields end tags, so the converter knows where groups end
+[0.2]
+    Yields elements with their attributes and css rules instead of the regular expression tokens,
+    css rules are only taken from inside <style> elements (path data containing '.st' isn't a css class)
+[0.1]
+    Streaming version of the regular expression tokens
+"""
+
+# import system libraries
+import re  # regular expressions
+
+# name of the element a start tag opens. Ex. rect
+TAG_NAME_PATTERN = re.compile("<([a-zA-Z_][a-zA-Z0-9_:.-]*)")
+
+# name="value" or name='value', values may span lines (Ex. long path data)
+ATTRIBUTE_PATTERN = re.compile("([^\\s=/<>\"']+)\\s*=\\s*(?:\"([^\"]*)\"|'([^']*)')")
+
+# number of characters read from the file at a time
+CHUNK_SIZE = 256 * 1024
+
+
+# splits a start tag into its name and attributes
+# Argument: tag
+# the tag, from < to > (or a whole <text> element)
+# returns (name, attributes dictionary), name is None if tag isn't a start tag
+def parseTag(tag):
+    name = TAG_NAME_PATTERN.match(tag)
+    if name is None:
+        return None, None
+    attributes = {}
+    # only the start tag, not the content of a <text> element
+    tagEnd = tag.find(">")
+    for key, doubleQuoted, singleQuoted in ATTRIBUTE_PATTERN.findall(tag, name.end(), tagEnd if tagEnd >= 0 else len(tag)):
+        attributes[key] = doubleQuoted or singleQuoted
+    return name.group(1), attributes
+
+
+# yields the css rules in the content of a <style> element. Ex. .st0{fill:#FFFFFF;}
+def iterCssRules(text):
+    for rule in text.split("}"):
+        rule = rule.strip()
+        if rule.startswith("<![CDATA["):
+            rule = rule[len("<![CDATA["):].strip()
+        if "{" in rule:
+            yield rule + "}"
+
+
+# yields the elements of a file one at a time
+# Argument: filePointer
+# file-like object opened in text mode
+# Argument: chunkSize (optional)
+# number of characters read at a time
+def iterElements(filePointer, chunkSize=CHUNK_SIZE):
+    buffer = ""
+    position = 0
+    # the end of the element at the start of the buffer isn't before this, it wasn't found before reading more
+    searchFrom = 0
+    # content of the <style> element being read, None outside of <style>
+    style = None
+    finished = False
+
+    while True:
+        start = buffer.find("<", position)
+        end = -1
+        if start >= 0:
+            # the end of what starts at '<' depends on what it is
+            if buffer.startswith("<!--", start):
+                end = buffer.find("-->", max(start + 4, searchFrom))
+                end = end + 3 if end >= 0 else -1
+            elif buffer.startswith("<![CDATA[", start):
+                end = buffer.find("]]>", max(start + 9, searchFrom))
+                end = end + 3 if end >= 0 else -1
+            elif buffer.startswith("<text", start) and not buffer[start + 5:start + 6].isalnum():
+                # <text .../> is an empty element, otherwise the element goes on to its </text>
+                # (the start tag is searched again after reading more, searchFrom may be past its '>')
+                tagEnd = buffer.find(">", start + 5)
+                if tagEnd < 0:
+                    end = -1
+                elif buffer[tagEnd - 1] == "/":
+                    end = tagEnd + 1
+                else:
+                    end = buffer.find("</text>", max(tagEnd + 1, searchFrom))
+                    end = end + 7 if end >= 0 else -1
+            else:
+                end = buffer.find(">", max(start + 1, searchFrom))
+                end = end + 1 if end >= 0 else -1
+        searchFrom = 0
+
+        if start < 0 or end < 0:
+            if finished:
+                break
+            # keep what hasn't been handled yet, and read more
+            if start < 0:
+                if style is not None:
+                    style.append(buffer[position:])
+                buffer = ""
+            else:
+                if style is not None:
+                    style.append(buffer[position:start])
+                buffer = buffer[start:]
+                # the longest end marker is "</text>", it could have been cut off by the end of the chunk
+                searchFrom = max(0, len(buffer) - 7)
+            position = 0
+            chunk = filePointer.read(chunkSize)
+            if not chunk:
+                finished = True
+            buffer = buffer + chunk
+            continue
+
+        if style is not None:
+            style.append(buffer[position:start])
+        token = buffer[start:end]
+        position = end
+
+        if token.startswith("<![CDATA["):
+            if style is not None:
+                style.append(token[9:-3])
+            continue
+        if token.startswith("</"):
+            name = token[2:].strip(" \t\r\n>")
+            if style is not None and name == "style":
+                for rule in iterCssRules("".join(style)):
+                    yield None, None, rule
+                style = None
+            yield "/" + name, None, token
+            continue
+        if token[1] in "!?":
+            continue
+
+        name, attributes = parseTag(token)
+        if name is None:
+            continue
+        if name == "style" and not token.endswith("/>"):
+            style = []
+        yield name, attributes, token
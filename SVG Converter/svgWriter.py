@@ -0,0 +1,91 @@
+"""
+File: svgWriter.py
+Name: Cody J. McBride
+Contact: cody.mcbride@unh.edu
+Description: Buffered writer the converted svg is streamed through
+Version: 0.1
+Date: 10/18/2026
+General Notes:
+    Shapes write their text into an SvgWriter piece by piece instead of building one big string,
+    the pieces are joined and written to the file every WRITE_BUFFER_SIZE characters.
+    Points are written with a fixed precision, a whole block of points at a time:
+        ("L %.3f,%.3f " * n) % (x0, y0, x1, y1, ...)
+    so serializing a path takes time linear in its number of points, and memory for at most
+    one buffer and one block of points.
+"""
+
+# number of characters collected before they are written to the file
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# number of digits written after the decimal point of every coordinate
+PRECISION = 3
+
+# number of commands formatted at a time
+POINT_BLOCK_SIZE = 4096
+
+
+class SvgWriter:
+    def __init__(self, fil, bufferSize=WRITE_BUFFER_SIZE, metrics=None, trace=None):
+        self.fil = fil
+        self.bufferSize = bufferSize
+        # conversionMetrics.FileMetrics, writes to the file are timed as the "write" phase
+        self.metrics = metrics
+        # tracing.Tracer of the conversion (or None), shapes trace their flattening through it
+        self.trace = trace
+        self.parts = []
+        # characters in parts, and characters written to the file before them
+        self.size = 0
+        self.written = 0
+        # (command, points per command, commands) -> format string
+        self.templates = {}
+
+    def write(self, text):
+        self.parts.append(text)
+        self.size += len(text)
+        if self.size >= self.bufferSize:
+            self.flush()
+
+    # writes path commands
+    # Argument: command
+    # command letter written before every group of points. Ex. L
+    # Argument: points
+    # (n, 2) NumPy array of points
+    # Argument: pointsPerCommand (optional)
+    # number of points each command takes. Ex. 3 for C
+    def writePoints(self, command, points, pointsPerCommand=1):
+        step = POINT_BLOCK_SIZE * pointsPerCommand
+        for start in range(0, len(points), step):
+            block = points[start:start + step]
+            commands = len(block) // pointsPerCommand
+            self.write(self.template(command, pointsPerCommand, commands) % tuple(block.ravel().tolist()))
+
+    def template(self, command, pointsPerCommand, commands):
+        key = (command, pointsPerCommand, commands)
+        template = self.templates.get(key)
+        if template is None:
+            point = f"%.{PRECISION}f,%.{PRECISION}f"
+            template = (command + (" " + point) * pointsPerCommand + " ") * commands
+            self.templates[key] = template
+        return template
+
+    def flush(self):
+        if not self.parts:
+            return
+        text = "".join(self.parts)
+        self.parts = []
+        self.written += self.size
+        self.size = 0
+        if self.metrics is not None:
+            with self.metrics.phase("write"):
+                self.fil.write(text)
+        else:
+            self.fil.write(text)
+
+
+# writes an item of a conversion, shapes that can stream themselves (writeTo) do
+def writeItem(out, item):
+    writeTo = getattr(item, "writeTo", None)
+    if writeTo is not None:
+        writeTo(out)
+    else:
+        out.write(item.__str__())
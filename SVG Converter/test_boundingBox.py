@@ -0,0 +1,50 @@
+"""
+File: test_boundingBox.py
+Name: Cody J. McBride
+Contact: cody.mcbride@unh.edu
+Description: Tests of the bounding box and the viewBox built from it (boundingBox.py)
+Version: 0.1
+Date: 10/18/2026
+General Notes:
+    Run from this folder with python -m pytest
+"""
+
+# import system libraries
+import numpy as np
+
+from boundingBox import BoundingBox
+
+DEFAULT = (-0.5, -0.5, 3.33, 2.78)
+
+
+def testEmptyBoxHasTheDefaultViewBox():
+    box = BoundingBox()
+    assert box.isEmpty()
+    box.addPoints(np.empty((0, 2)))
+    assert box.viewBox(DEFAULT) == DEFAULT
+
+
+def testBoxesAndMargins():
+    box = BoundingBox()
+    # the corners can come in any order
+    box.addBox(3, 4, 1, 2)
+    box.addBox(0, 0, 0, 0, 0.5)
+    assert (box.minX, box.minY, box.maxX, box.maxY) == (-0.5, -0.5, 3, 4)
+    assert box.viewBox(DEFAULT) == (-0.5, -0.5, 3.5, 4.5)
+
+
+def testPoints():
+    box = BoundingBox()
+    box.addPoints(np.array([[1.0, -2.0], [-3.0, 4.0], [0.5, 0.5]]), 0.25)
+    assert (box.minX, box.minY, box.maxX, box.maxY) == (-3.25, -2.25, 1.25, 4.25)
+
+
+# the viewBox is rounded outwards, nothing in the box is cut off
+def testViewBoxIsRoundedOutwards():
+    box = BoundingBox()
+    box.addBox(-1.23449, 0.0001, 2.0001, 1.9999)
+    x, y, width, height = box.viewBox(DEFAULT)
+    assert (x, y) == (-1.235, 0.0)
+    assert (width, height) == (3.236, 2.0)
+    assert x <= box.minX and y <= box.minY
+    assert x + width >= box.maxX and y + height >= box.maxY
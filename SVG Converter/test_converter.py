@@ -0,0 +1,124 @@
+"""
+File: test_converter.py
+Name: Cody J. McBride
+Contact: cody.mcbride@unh.edu
+Description: Tests of the converted shapes (converter.py, classDefs.py)
+Version: 0.1
+Date: 10/18/2026
+General Notes:
+    Run from this folder with python -m pytest
+"""
+
+# import system libraries
+import re
+from xml.parsers.expat import ExpatError
+
+import pytest
+
+from boundingBox import BoundingBox
+from converter import ConversionOptions, convert, convertFile
+from pageTransform import PageTransform
+
+VIEW_BOX = (100, 100)
+
+
+def drawing(*shapes):
+    return f"<svg viewBox=\"0 0 {VIEW_BOX[0]} {VIEW_BOX[1]}\">\n" + "\n".join(shapes) + "\n</svg>\n"
+
+
+# the converted shapes, one line per shape (the lines after the pivot point)
+def convertedShapes(*shapes):
+    lines = convert(drawing(*shapes)).splitlines()
+    return lines[lines.index(next(line for line in lines if "pivotPoint" in line)) + 1:-1]
+
+
+# the first point of a converted path, or the x, y of a converted rect
+def firstPoint(line):
+    if line.startswith("<rect"):
+        return float(re.search(" x=\"([^\"]+)\"", line).group(1)), float(re.search(" y=\"([^\"]+)\"", line).group(1))
+    x, y = re.search("M ([-0-9.]+),([-0-9.]+)", line).groups()
+    return float(x), float(y)
+
+
+def testRectRotatedRectAndPathShareTheirCorner():
+    rect, rotated, path = convertedShapes(
+        "<rect x=\"10\" y=\"20\" width=\"30\" height=\"10\"/>",
+        "<rect x=\"10\" y=\"20\" width=\"30\" height=\"10\" transform=\"rotate(30 10 20)\"/>",
+        "<path d=\"M 10 20 L 50 50\"/>")
+    corner = PageTransform(*VIEW_BOX).point(10, 20)
+    assert rect.startswith("<rect") and rotated.startswith("<path")
+    for line in (rect, rotated, path):
+        assert firstPoint(line) == pytest.approx(corner, abs=1e-3)
+
+
+def testRectSize():
+    rect, = convertedShapes("<rect x=\"10\" y=\"20\" width=\"30\" height=\"10\"/>")
+    transform = PageTransform(*VIEW_BOX)
+    assert float(re.search("width=\"([^\"]+)\"", rect).group(1)) == pytest.approx(transform.length(30), abs=1e-3)
+    assert float(re.search("height=\"([^\"]+)\"", rect).group(1)) == pytest.approx(transform.length(10), abs=1e-3)
+
+
+ELLIPSE_PATTERN = re.compile("M ([-0-9.]+),([-0-9.]+) A ([-0-9.]+),([-0-9.]+),([-0-9.]+),1,0,([-0-9.]+),([-0-9.]+) ")
+
+
+@pytest.mark.parametrize("transform", ["", "rotate(45 50 50)", "translate(5 0) scale(2 1)"])
+def testEllipseIsDrawnThroughTheEndsOfItsAxis(transform):
+    ellipse, path = convertedShapes(
+        f"<ellipse cx=\"50\" cy=\"50\" rx=\"10\" ry=\"5\" transform=\"{transform}\"/>",
+        f"<path d=\"M 40 50 L 60 50\" transform=\"{transform}\"/>")
+    # absolute arcs from one end of the ellipse's x-axis to the other, where the path draws the axis
+    startX, startY, rx, ry, angle, endX, endY = map(float, ELLIPSE_PATTERN.search(ellipse).groups())
+    pathEnd = tuple(map(float, re.search("L ([-0-9.]+),([-0-9.]+)", path).groups()))
+    assert (startX, startY) == pytest.approx(firstPoint(path), abs=1e-3)
+    assert (endX, endY) == pytest.approx(pathEnd, abs=1e-3)
+    page = PageTransform(*VIEW_BOX)
+    expected = (page.compose(transform) if transform else page).ellipse(10, 5)
+    assert (rx, ry, angle) == pytest.approx(expected, abs=1e-3)
+
+
+# a class without a fill (stroke only) used to crash circles
+def testStrokeOnlyCircle():
+    circle, = convertedShapes("<style type=\"text/css\">\n\t.st1{stroke:#00FF00;}\n</style>",
+                              "<circle class=\"st1\" cx=\"50\" cy=\"50\" r=\"5\"/>")
+    assert circle.startswith("<circle")
+    assert "class=\"s#00FF00\"" in circle
+    assert " f#" not in circle and "fill=" not in circle
+
+
+# (x, y, width, height) of the viewBox of a converted drawing
+def viewBox(*shapes):
+    return tuple(map(float, re.search("viewBox=\"([^\"]+)\"", convert(drawing(*shapes))).group(1).split()))
+
+
+# the box is the written shapes plus half of their stroke width, and the pivot point (radius 0.4 around the origin)
+def testViewBoxOfAKnownDrawing():
+    page = PageTransform(*VIEW_BOX)
+    expected = BoundingBox()
+    expected.addBox(-0.4, -0.4, 0.4, 0.4)
+    # an ellipse turned on its end, right of the pivot point, its box is ry wide and rx high
+    cx, cy = page.point(90, 50)
+    rx, ry = page.length(10), page.length(5)
+    expected.addBox(cx - ry, cy - rx, cx + ry, cy + rx, 0.32 * 0.32 / 2)
+    # a rect across the top of the page
+    x, y = page.point(0, 0)
+    expected.addBox(x, y, x + page.length(100), y + page.length(10), 0.32 / 2)
+    assert viewBox("<ellipse cx=\"90\" cy=\"50\" rx=\"10\" ry=\"5\" transform=\"rotate(90 90 50)\"/>",
+                   "<rect x=\"0\" y=\"0\" width=\"100\" height=\"10\"/>") == expected.viewBox(None)
+    assert expected.viewBox(None) == (-0.856, -0.856, 1.712, 1.256)
+
+
+# not well-formed XML: an entity expat doesn't know, the string scanner doesn't care
+BROKEN = drawing("<text x=\"0\" y=\"0\">&nbsp;</text>", "<rect x=\"10\" y=\"20\" width=\"30\" height=\"10\"/>")
+
+
+def testExpatRaisesForStrings():
+    with pytest.raises(ExpatError):
+        convert(BROKEN, options=ConversionOptions(backend="expat"))
+
+
+def testFilesFallBackToTheStringScanner(tmp_path):
+    source = tmp_path / "broken.svg"
+    source.write_text(BROKEN)
+    ctx = convertFile(str(source), str(tmp_path / "converted.svg"), options=ConversionOptions(backend="expat"))
+    assert [type(item).__name__ for item in ctx.items] == ["illustratorRect"]
+    assert (tmp_path / "converted.svg").read_text() == convert(BROKEN)
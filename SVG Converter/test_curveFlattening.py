@@ -0,0 +1,58 @@
+"""
+File: test_curveFlattening.py
+Name: Cody J. McBride
+Contact: cody.mcbride@unh.edu
+Description: Tests of the segment counts (Wang's formula) and the flattened curves (curveFlattening.py)
+Version: 0.1
+Date: 10/18/2026
+General Notes:
+    Run from this folder with python -m pytest
+"""
+
+# import system libraries
+import numpy as np
+import pytest
+
+from curveFlattening import MAX_SEGMENTS, flattenCurves, segmentCounts
+
+
+def testStraightCurvesGetOneSegment():
+    straight = np.array([[[0, 0], [1, 1], [2, 2], [3, 3]], [[0, 0], [0, 1], [0, 2], [0, 3]]], dtype=float)
+    assert segmentCounts(straight, 0.005).tolist() == [1, 1]
+
+
+# n = ceil(sqrt(d (d - 1) / 8 * M / tolerance)), M the largest second difference of the control points
+@pytest.mark.parametrize("controlPoints, tolerance, expected", [
+    # quadratic, M = |(0, -2)| = 2: sqrt(2 / 8 * 2 / 0.0051) = 9.90 and sqrt(2 / 8 * 2 / 0.021) = 4.88
+    ([[0, 0], [1, 1], [2, 0]], 0.0051, 10),
+    ([[0, 0], [1, 1], [2, 0]], 0.021, 5),
+    # cubic, M = max(|(0, -3)|, |(0, -3)|) = 3: sqrt(6 / 8 * 3 / 0.0101) = 14.93 and sqrt(6 / 8 * 3 / 0.0099) = 15.08
+    ([[0, 0], [1, 3], [2, 3], [3, 0]], 0.0101, 15),
+    ([[0, 0], [1, 3], [2, 3], [3, 0]], 0.0099, 16),
+])
+def testWangsFormula(controlPoints, tolerance, expected):
+    assert segmentCounts(np.array([controlPoints], dtype=float), tolerance).tolist() == [expected]
+
+
+def testSegmentCountIsCapped():
+    tight = np.array([[[0, 0], [1000, 1000], [-1000, 1000], [0, 0]]], dtype=float)
+    assert segmentCounts(tight, 1e-6).tolist() == [MAX_SEGMENTS]
+
+
+@pytest.mark.parametrize("tolerance", [0.1, 0.01, 0.001])
+def testFlattenedCurveStaysWithinTolerance(tolerance):
+    controlPoints = np.array([[[0, 0], [1, 3], [4, -2], [5, 1]], [[5, 1], [6, 1], [6, 2], [5, 3]]], dtype=float)
+    points, counts = flattenCurves(controlPoints, tolerance)
+    assert len(points) == counts.sum()
+    starts = np.concatenate(([0], np.cumsum(counts)))
+    t = np.linspace(0, 1, 2001)[:, None]
+    for curve, (p0, p1, p2, p3) in enumerate(controlPoints):
+        exact = (1 - t) ** 3 * p0 + 3 * (1 - t) ** 2 * t * p1 + 3 * (1 - t) * t ** 2 * p2 + t ** 3 * p3
+        polyline = np.vstack(([p0], points[starts[curve]:starts[curve + 1]]))
+        assert np.allclose(polyline[-1], p3)
+        # distance of every point of the curve to the closest segment of the polyline
+        a, b = polyline[:-1], polyline[1:]
+        d = b - a
+        s = np.clip(((exact[:, None] - a) * d).sum(axis=2) / (d * d).sum(axis=1), 0, 1)
+        distances = np.linalg.norm(exact[:, None] - (a + s[..., None] * d), axis=2).min(axis=1)
+        assert distances.max() <= tolerance
@@ -0,0 +1,83 @@
+"""
+File: test_pageTransform.py
+Name: Cody J. McBride
+Contact: cody.mcbride@unh.edu
+Description: Tests of the page transform and its composition with transform attributes (pageTransform.py)
+Version: 0.1
+Date: 10/18/2026
+General Notes:
+    Run from this folder with python -m pytest
+"""
+
+# import system libraries
+import math
+
+import numpy as np
+import pytest
+
+from pageTransform import SCALE, PageTransform, parseTransform
+
+PAGE = PageTransform(100, 50)
+
+
+def testPageCentreIsTheOrigin():
+    assert PAGE.point(50, 25) == (0.0, 0.0)
+    assert PAGE.point(60, 25) == pytest.approx((10 * SCALE, 0.0))
+    assert PAGE.length(10) == pytest.approx(10 * SCALE)
+
+
+# the transform attribute is applied first, then the page transform
+@pytest.mark.parametrize("transform, point, moved", [
+    ("translate(10 5)", (1, 2), (11, 7)),
+    ("translate(10)", (1, 2), (11, 2)),
+    ("scale(2 3)", (1, 2), (2, 6)),
+    ("rotate(90)", (1, 2), (-2, 1)),
+    ("rotate(90 10 10)", (10, 20), (0, 10)),
+    ("matrix(1 0 0 1 -5 4)", (1, 2), (-4, 6)),
+    ("skewX(45)", (1, 2), (3, 2)),
+    # the last transform of a list is applied first
+    ("translate(10 0) scale(2)", (1, 2), (12, 4)),
+    ("scale(2), translate(10 0)", (1, 2), (22, 4)),
+])
+def testCompose(transform, point, moved):
+    assert PAGE.compose(transform).point(*point) == pytest.approx(PAGE.point(*moved))
+
+
+# a group inside a group: the inner transform is applied first
+def testNestedComposeAppliesTheInnerTransformFirst():
+    nested = PAGE.compose("translate(10 0)").compose("scale(2)")
+    assert nested.point(1, 2) == pytest.approx(PAGE.point(12, 4))
+    np.testing.assert_allclose(nested.matrix, PAGE.compose("translate(10 0) scale(2)").matrix)
+    assert nested.length(1) == pytest.approx(2 * SCALE)
+
+
+def testComposedTransformsAreCached():
+    assert PAGE.compose("rotate(30)") is PAGE.compose("rotate(30)")
+
+
+def testPointsAgreeWithPoint():
+    transform = PAGE.compose("rotate(30 5 5) skewY(10)")
+    points = np.array([[0, 0], [1, 2], [-3, 4.5]])
+    expected = [transform.point(x, y) for x, y in points]
+    np.testing.assert_allclose(transform.points(points), expected)
+
+
+@pytest.mark.parametrize("transform", ["rotate(30)", "scale(2 1)", "skewX(20) rotate(10)"])
+def testEllipseRadiiAndRotation(transform):
+    composed = PAGE.compose(transform)
+    rx, ry, angle = composed.ellipse(10, 5)
+    # the transformed ellipse goes through the transformed ends of the original axes
+    a = math.radians(angle)
+    for x, y in ((10, 0), (0, 5), (-10, 0)):
+        px, py = np.subtract(composed.point(x, y), composed.point(0, 0))
+        # the point in the frame of the rotated ellipse
+        u = px * math.cos(a) + py * math.sin(a)
+        v = -px * math.sin(a) + py * math.cos(a)
+        assert (u / rx) ** 2 + (v / ry) ** 2 == pytest.approx(1.0)
+    assert -90 < angle <= 90
+
+
+@pytest.mark.parametrize("text", ["rotate(1 2)", "translate(1 2) nonsense", "scale()"])
+def testInvalidTransforms(text):
+    with pytest.raises(ValueError):
+        parseTransform(text)
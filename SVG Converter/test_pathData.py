@@ -0,0 +1,67 @@
+"""
+File: test_pathData.py
+Name: Cody J. McBride
+Contact: cody.mcbride@unh.edu
+Description: Tests of the path data parser (pathData.py)
+Version: 0.1
+Date: 10/18/2026
+General Notes:
+    Run from this folder with python -m pytest
+    Every test runs with both ways of resolving the commands (one at a time and cumulative sums)
+"""
+
+# import system libraries
+import numpy as np
+import pytest
+
+import pathData
+from pathData import parsePathData
+
+
+@pytest.fixture(params=["inOrder", "cumulative"], autouse=True)
+def resolver(request, monkeypatch):
+    monkeypatch.setattr(pathData, "CUMULATIVE_MINIMUM", 10 ** 9 if request.param == "inOrder" else 0)
+    return request.param
+
+
+def assertSamePath(d, expected):
+    path, other = parsePathData(d), parsePathData(expected)
+    assert path.commands == other.commands
+    np.testing.assert_allclose(path.coords, other.coords, atol=1e-9)
+
+
+def testCompactArcFlags():
+    path = parsePathData("M0 0 a1 1 0 011 1")
+    assert path.commands == "MC"
+    assert tuple(path.coords[-1]) == (1.0, 1.0)
+    assertSamePath("M0 0 a1 1 0 011 1", "M0 0 a1 1 0 0 1 1 1")
+    assertSamePath("M0 0a1,1,0,1,0,2,0a1 1 0 10-2 0", "M0 0 A1 1 0 1 0 2 0 A1 1 0 1 0 0 0")
+
+
+@pytest.mark.parametrize("relative, absolute", [
+    ("M10 10 c0 5 5 5 10 0 s10 -5 10 0", "M10 10 C10 15 15 15 20 10 S30 5 30 10"),
+    ("M10 10 q5 5 10 0 t10 0 10 0", "M10 10 Q15 15 20 10 T30 10 40 10"),
+    ("M10 10 a5 5 0 0 1 10 0 5 5 0 1 1 -10 0", "M10 10 A5 5 0 0 1 20 10 A5 5 0 1 1 10 10"),
+    ("M10 10 h5 v5 l-5 0 z m1 1 l1 0 z", "M10 10 H15 V15 L10 15 Z M11 11 L12 11 Z"),
+])
+def testRelativeCommands(relative, absolute):
+    assertSamePath(relative, absolute)
+
+
+def testSmoothCommandsReflectTheControlPoint():
+    # the first control point of S (and T) is the previous one reflected through the current point
+    cubics = parsePathData("M0 0 C0 10 10 10 10 0 S20 -10 20 0")
+    assert tuple(cubics.coords[4]) == (10.0, -10.0)
+    quadratics = parsePathData("M0 0 Q5 10 10 0 T20 0 T30 0")
+    np.testing.assert_allclose(quadratics.coords[[3, 5]], [[15, -10], [25, 10]])
+    # without a curve before them there is nothing to reflect
+    assert tuple(parsePathData("M0 0 L5 5 S20 -10 20 0").coords[2]) == (5.0, 5.0)
+
+
+def testImplicitRepeatsAndCompactNumbers():
+    assertSamePath("m1,2 3,4 5,6", "M1 2 L4 6 L9 12")
+    assertSamePath("M10,20h5.5c0.5-1.2.3.4,1,1z", "M10 20 L15.5 20 C16 18.8 15.8 20.4 16.5 21 Z")
+
+
+def testClosesGoBackToTheStartOfTheirSubpath():
+    assertSamePath("M1 1 l10 0 z l0 5 z m2 2 l1 0 z m2 2 z", "M1 1 L11 1 Z L1 6 Z M3 3 L4 3 Z M5 5 Z")
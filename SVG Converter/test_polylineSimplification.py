@@ -0,0 +1,92 @@
+"""
+File: test_polylineSimplification.py
+Name: Cody J. McBride
+Contact: cody.mcbride@unh.edu
+Description: Tests of the points Douglas-Peucker keeps (polylineSimplification.py)
+Version: 0.1
+Date: 10/18/2026
+General Notes:
+    Run from this folder with python -m pytest
+    The masks are compared with a plain recursive Douglas-Peucker
+"""
+
+# import system libraries
+import math
+
+import numpy as np
+import pytest
+
+from polylineSimplification import simplifyMask, simplifyRuns
+
+
+# recursive Douglas-Peucker, the farthest point of a part is the first one at the largest distance
+def recursiveMask(points, tolerance, fixed):
+    keep = [False] * len(points)
+
+    def distance(point, start, end):
+        (x, y), (x0, y0), (x1, y1) = point, start, end
+        dx, dy = x1 - x0, y1 - y0
+        lengthSquared = dx * dx + dy * dy
+        t = 0.0 if lengthSquared == 0 else min(1.0, max(0.0, ((x - x0) * dx + (y - y0) * dy) / lengthSquared))
+        return math.hypot(x - x0 - t * dx, y - y0 - t * dy)
+
+    def simplify(first, last):
+        if last - first < 2:
+            return
+        distances = [distance(points[index], points[first], points[last]) for index in range(first + 1, last)]
+        farthest = max(distances)
+        if farthest > tolerance:
+            chosen = first + 1 + distances.index(farthest)
+            keep[chosen] = True
+            simplify(first, chosen)
+            simplify(chosen, last)
+
+    for index in fixed:
+        keep[index] = True
+    for first, last in zip(fixed[:-1], fixed[1:]):
+        simplify(first, last)
+    return keep
+
+
+def testCollinearPointsAreDropped():
+    points = np.array([[0, 0], [1, 1], [2, 2], [3, 3], [4, 4]], dtype=float)
+    assert simplifyMask(points, 0.01).tolist() == [True, False, False, False, True]
+
+
+def testPointsFartherThanTheToleranceAreKept():
+    points = np.array([[0, 0], [1, 0.5], [2, 0], [3, 0.05], [4, 0]], dtype=float)
+    assert simplifyMask(points, 0.1).tolist() == [True, True, True, False, True]
+    assert simplifyMask(points, 0.6).tolist() == [True, False, False, False, True]
+
+
+def testShortPolylinesAreKept():
+    assert simplifyMask(np.array([[0, 0], [1, 1]], dtype=float), 10).tolist() == [True, True]
+
+
+def testFixedPointsAreAlwaysKept():
+    points = np.array([[0, 0], [1, 0], [2, 0], [3, 0], [4, 0]], dtype=float)
+    assert simplifyMask(points, 0.5, [0, 2, 4]).tolist() == [True, False, True, False, True]
+
+
+# a closed subpath starts and ends on the same point, the distances are to that point
+def testClosedPart():
+    points = np.array([[0, 0], [2, 0], [2, 2], [0, 0]], dtype=float)
+    # (2, 2) is 2.83 from the start, then (2, 0) is 1.41 from the segment to (2, 2)
+    assert simplifyMask(points, 1.5).tolist() == [True, False, True, True]
+    assert simplifyMask(points, 1.0).tolist() == [True, True, True, True]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def testSameMaskAsRecursiveDouglasPeucker(seed):
+    random = np.random.default_rng(seed)
+    points = np.cumsum(random.normal(size=(300, 2)), axis=0)
+    fixed = [0, 120, 121, 299]
+    for tolerance in (0.1, 1.0, 5.0):
+        assert simplifyMask(points, tolerance, fixed).tolist() == recursiveMask(points.tolist(), tolerance, fixed)
+
+
+def testSubpathsAreSimplifiedOnTheirOwn():
+    vertices = np.array([[0, 0], [1, 0], [2, 0], [5, 5], [6, 5], [7, 5]], dtype=float)
+    kept, runs = simplifyRuns(vertices, [["M", 1], ["L", 2], ["M", 1], ["L", 2]], 0.1)
+    assert kept.tolist() == [[0, 0], [2, 0], [5, 5], [7, 5]]
+    assert runs == [["M", 1], ["L", 1], ["M", 1], ["L", 1]]
@@ -0,0 +1,69 @@
+"""
+File: test_styleRegistry.py
+Name: Cody J. McBride
+Contact: cody.mcbride@unh.edu
+Description: Tests of the css class lookups and the cascade of several classes (styleRegistry.py)
+Version: 0.1
+Date: 10/18/2026
+General Notes:
+    Run from this folder with python -m pytest
+"""
+
+# import system libraries
+import pytest
+
+from converter import parseClass
+from styleRegistry import StyleRegistry
+
+STYLE_SHEET = (
+    ".st0{fill:#FF0000;stroke:#000000;stroke-width:2;}",
+    ".st1{fill:#0000FF;}",
+    ".st2{stroke:#00FF00;}",
+    ".st3{fill:#FF0000;stroke:#000000;stroke-width:2;}",
+)
+
+
+@pytest.fixture
+def registry():
+    registry = StyleRegistry()
+    for rule in STYLE_SHEET:
+        registry.add(parseClass(rule))
+    return registry
+
+
+def testSingleClass(registry):
+    style = registry.resolve("st1")
+    assert style.fill == "#0000FF"
+    assert registry.resolve("st9") is None
+
+
+# the class that comes later in the style sheet wins, whatever the order in the class attribute
+@pytest.mark.parametrize("classAttribute", ["st0 st1", "st1 st0", "st1  st0 st1"])
+def testLaterClassWins(registry, classAttribute):
+    style = registry.resolve(classAttribute)
+    assert style.fill == "#0000FF"
+    # properties only the earlier class declares are kept
+    assert style.stroke == "#000000"
+    assert style.strokeWidth == pytest.approx(2 * 0.32)
+
+
+def testUndefinedClassesAreIgnored(registry):
+    assert registry.resolve("st2 st9") is registry.resolve("st2")
+
+
+def testIdenticalDefinitionsShareAClass(registry):
+    assert registry.resolve("st0") is registry.resolve("st3")
+
+
+def testClassDefinedTwiceIsMerged(registry):
+    registry.add(parseClass(".st1{stroke:#FFFFFF;}"))
+    style = registry.resolve("st1")
+    assert (style.fill, style.stroke) == ("#0000FF", "#FFFFFF")
+    # the redefined class keeps its place in the cascade
+    assert registry.resolve("st1 st2").stroke == "#00FF00"
+
+
+def testAddingAClassClearsTheCachedLookups(registry):
+    assert registry.resolve("st4") is None
+    registry.add(parseClass(".st4{fill:none;}"))
+    assert registry.resolve("st4").fill == "none"
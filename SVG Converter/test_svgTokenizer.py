@@ -0,0 +1,65 @@
+"""
+File: test_svgTokenizer.py
+Name: Cody J. McBride
+Contact: cody.mcbride@unh.edu
+Description: Tests of the string scanner (svgTokenizer.py) against the expat backend (xmlElements.py)
+Version: 0.2
+Date: 10/18/2026
+General Notes:
+    Run from this folder with python -m pytest
+Version History
+[0.2]
+    pytest tests, like the other tests
+[0.1]
+    Empty <text/> tests
+"""
+
+# import system libraries
+import io
+
+import pytest
+
+from converter import ConversionOptions, convert, convertStream
+from svgTokenizer import iterElements
+
+# an empty <text/> in front of the shapes, the scanner used to skip everything up to the next </text>
+EMPTY_TEXT_SVG = """<?xml version="1.0" encoding="utf-8"?>
+<svg version="1.1" xmlns="http://www.w3.org/2000/svg" x="0px" y="0px" viewBox="0 0 100 100">
+<style type="text/css">
+	.st0{fill:#FF0000;stroke:#000000;stroke-width:2;}
+</style>
+<text x="1" y="2"/>
+<rect class="st0" x="10" y="10" width="20" height="10"/>
+<path class="st0" d="M 10 10 L 50 50"/>
+<path d="M 20 20 C 30 10 40 30 50 20"/>
+<text x="0" y="0">Title: Sample</text>
+<circle cx="50" cy="50" r="5"/>
+</svg>
+"""
+
+
+def convertWith(backend):
+    return convertStream(io.StringIO(EMPTY_TEXT_SVG), io.StringIO(), ConversionOptions(backend=backend))
+
+
+def testShapesAfterEmptyText():
+    shapes = [type(item).__name__ for item in convertWith("regex").items]
+    assert shapes == ["illustratorRect", "illustratorPath", "illustratorPath", "illustratorCircle"]
+
+
+def testSameItemsAsExpat():
+    regex = convertWith("regex")
+    expat = convertWith("expat")
+    assert [type(item).__name__ for item in regex.items] == [type(item).__name__ for item in expat.items]
+    assert regex.title == expat.title
+
+
+def testSameOutputAsExpat():
+    assert convert(EMPTY_TEXT_SVG) == convert(EMPTY_TEXT_SVG, options=ConversionOptions(backend="expat"))
+
+
+# the '>' of <text .../> can be in the next chunk, and so can the end of every other element
+@pytest.mark.parametrize("chunkSize", [1, 2, 3, 5, 7, 16, len(EMPTY_TEXT_SVG)])
+def testChunkBoundaries(chunkSize):
+    elements = list(iterElements(io.StringIO(EMPTY_TEXT_SVG)))
+    assert list(iterElements(io.StringIO(EMPTY_TEXT_SVG), chunkSize)) == elements
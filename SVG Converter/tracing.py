@@ -0,0 +1,111 @@
+"""
+File: tracing.py
+Name: Cody J. McBride
+Contact: cody.mcbride@unh.edu
+Description: Trace output of a conversion, with levels and a switch per subsystem
+Version: 0.1
+Date: 10/18/2026
+General Notes:
+    Replaces the debug prints the shape classes used to make. Tracing is off unless a Tracer is
+    given in the ConversionOptions:
+        convertFile(source, destination, options=ConversionOptions(trace=Tracer({"parse"}, DEBUG)))
+    Subsystems:
+        parse           elements and css rules as they are parsed
+        flatten         curves drawn as straight segments
+        simplify        points dropped by the polyline simplification (see polylineSimplification.py)
+        serialize       items written to the converted file
+    Code that traces asks for a channel once, before its loop:
+        trace = channel(ctx.trace, "parse")
+        ...
+        if trace is not None:
+            trace("rect", attributes)
+    channel() returns None when the tracer is off, the subsystem is switched off or the level is
+    filtered out, so a loop costs one 'is None' test per iteration, and messages are only
+    formatted when they are written.
+    Lines go to stderr, or are appended to a trace file. A Tracer can be pickled (batch workers
+    get a copy), every process opens the trace file for itself.
+"""
+import sys
+
+# levels, a channel only writes messages of its level or higher
+DEBUG = 10
+INFO = 20
+
+LEVEL_NAMES = {"debug": DEBUG, "info": INFO}
+
+SUBSYSTEMS = ("parse", "flatten", "simplify", "serialize")
+
+
+'''
+    Where trace lines go and which are written
+
+    Class Members:
+        subsystems      names of the subsystems that are traced, see SUBSYSTEMS
+        level           lowest level written, DEBUG or INFO
+        path            trace file the lines are appended to, None writes them to stderr
+'''
+class Tracer:
+    def __init__(self, subsystems=SUBSYSTEMS, level=INFO, path=None):
+        unknown = set(subsystems) - set(SUBSYSTEMS)
+        if unknown:
+            raise ValueError(f"Unknown trace subsystem(s): {', '.join(sorted(unknown))}")
+        self.subsystems = frozenset(subsystems)
+        self.level = level
+        self.path = path
+        self.stream = None
+
+    # the open file is left out when the tracer is sent to a worker process
+    def __getstate__(self):
+        return {"subsystems": self.subsystems, "level": self.level, "path": self.path}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.stream = None
+
+    def enabled(self, subsystem, level=DEBUG):
+        return subsystem in self.subsystems and level >= self.level
+
+    # Argument: subsystem
+    # one of SUBSYSTEMS
+    # Argument: level (optional)
+    # level of the messages written through the channel
+    # returns a function writing messages of the subsystem, or None when they aren't traced
+    def channel(self, subsystem, level=DEBUG):
+        if not self.enabled(subsystem, level):
+            return None
+        prefix = f"{subsystem:<9} {'debug' if level == DEBUG else 'info':<5} "
+
+        def trace(*parts):
+            self.write(prefix + " ".join(str(part) for part in parts))
+        return trace
+
+    def write(self, line):
+        if self.stream is None:
+            self.stream = open(self.path, "a", buffering=1) if self.path is not None else sys.stderr
+        self.stream.write(line + "\n")
+
+    def close(self):
+        if self.stream is not None and self.stream is not sys.stderr:
+            self.stream.close()
+        self.stream = None
+
+
+# channel of a tracer that may be None (tracing off)
+def channel(tracer, subsystem, level=DEBUG):
+    if tracer is None:
+        return None
+    return tracer.channel(subsystem, level)
+
+
+# tracer for command line options
+# Argument: subsystems
+# comma separated subsystem names or "all", None or "" turns tracing off
+# Argument: level (optional)
+# "debug" or "info"
+# Argument: path (optional)
+# trace file, defaults to stderr
+def tracerFromArguments(subsystems, level="info", path=None):
+    if not subsystems:
+        return None
+    names = SUBSYSTEMS if subsystems == "all" else [name.strip() for name in subsystems.split(",") if name.strip()]
+    return Tracer(names, LEVEL_NAMES[level], path)
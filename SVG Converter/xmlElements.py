@@ -0,0 +1,101 @@
+"""
+File: xmlElements.py
+Name: Cody J. McBride
+Contact: cody.mcbride@unh.edu
+Description: XML parser backend for the converter, splits an Illustrator SVG file into elements with
+             expat instead of the string scanning of svgTokenizer.py
+Version: 0.1
+Date: 10/18/2026
+General Notes:
+    The file is fed to xml.parsers.expat (a C parser) in fixed-size chunks, and the elements found in
+    each chunk are yielded before the next chunk is read, so memory use is bounded by the chunk size.
+    The elements are the same (name, attributes, source) tuples as svgTokenizer.iterElements yields,
+    so the converter's parsers don't know which backend read the file:
+        start tags          ("rect", {"x": "10", ...}, "<rect x=\"10\" ...>"), the tag rebuilt from its attributes
+        <text> elements     ("text", {...}, "<text ...>...</text>"), with its content and the tags inside it
+        css rules           (None, None, ".st0{fill:#FFFFFF;}"), the rules inside <style> elements
+        end tags            ("/g", None, "</g>")
+    An empty element (<g/>) is a start tag followed by its end tag.
+    Entities (&amp;, &#x41;, ...) are replaced in attribute values and text, and comments, CDATA and
+    '>' inside attribute values are handled the way the XML specification says.
+    A file that isn't well-formed XML raises xml.parsers.expat.ExpatError.
+"""
+
+# import system libraries
+from xml.parsers import expat  # C parser from the standard library
+
+from svgTokenizer import CHUNK_SIZE, iterCssRules
+
+
+# turns the events of an expat parser into elements
+class ElementBuilder:
+    def __init__(self, parser):
+        self.elements = []
+        # parts of the <text> element being read, None outside of it
+        self.text = None
+        # depth of the elements inside the <text> element
+        self.textDepth = 0
+        self.textName = None
+        self.textAttributes = None
+        # content of the <style> element being read, None outside of it
+        self.style = None
+
+        parser.buffer_text = True
+        parser.StartElementHandler = self.startElement
+        parser.EndElementHandler = self.endElement
+        parser.CharacterDataHandler = self.characterData
+
+    def startElement(self, name, attributes):
+        source = "<" + name + "".join(f" {key}=\"{value}\"" for key, value in attributes.items()) + ">"
+        if self.text is not None:
+            self.text.append(source)
+            self.textDepth += 1
+            return
+        if name == "text":
+            self.text = [source]
+            self.textDepth = 0
+            self.textName = name
+            self.textAttributes = attributes
+            return
+        if name == "style":
+            self.style = []
+        self.elements.append((name, attributes, source))
+
+    def endElement(self, name):
+        if self.text is not None:
+            self.text.append("</" + name + ">")
+            if self.textDepth == 0:
+                self.elements.append((self.textName, self.textAttributes, "".join(self.text)))
+                self.text = None
+            else:
+                self.textDepth -= 1
+            return
+        if name == "style" and self.style is not None:
+            for rule in iterCssRules("".join(self.style)):
+                self.elements.append((None, None, rule))
+            self.style = None
+        self.elements.append(("/" + name, None, "</" + name + ">"))
+
+    def characterData(self, data):
+        if self.text is not None:
+            self.text.append(data)
+        elif self.style is not None:
+            self.style.append(data)
+
+
+# yields the elements of a file one at a time, see svgTokenizer.iterElements
+# Argument: filePointer
+# file-like object opened in text mode
+# Argument: chunkSize (optional)
+# number of characters read at a time
+def iterXmlElements(filePointer, chunkSize=CHUNK_SIZE):
+    parser = expat.ParserCreate()
+    builder = ElementBuilder(parser)
+    while True:
+        chunk = filePointer.read(chunkSize)
+        parser.Parse(chunk, not chunk)
+        if builder.elements:
+            yield from builder.elements
+            builder.elements = []
+        if not chunk:
+            break
@@ -0,0 +1,243 @@
+"""
+File: batch.py
+Name: Cody J. McBride
+Contact: cody.j.mcbride@gmail.com
+Description: Command line (headless) batch mode for the CSS translator
+             Spreads the conversion of one or more directories across a pool of worker processes
+Version: 0.1
+Date: 10/18/2026
+
+Usage:
+    python batch.py DIRECTORY [DIRECTORY ...] [--workers N] [--chunksize N] [--force] [--scan]
+                    [--backend regex|expat] [--metrics FILE] [--summary]
+
+    Files that did not change since they were last converted (see manifest.py) are skipped,
+    --force converts every file again.
+    --scan only lists the files that contain style attributes to convert, with their sizes (see scan.py).
+    --backend chooses the parser the files are split into lines with (see translator.py).
+    --metrics/--summary collect per-phase timings and counters for every file (see metrics.py).
+    Every worker process converts its files with one style_rewriter.StyleRewriter, so a style string is
+    converted once per worker, the hits and misses of the workers' memos are printed after the batch.
+"""
+
+# import system libraries
+import argparse  # command line arguments
+import os  # used to handle file I/O
+import sys
+import time  # used to time the batch
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+
+from translator import DEFAULT_BACKEND, TOKENIZERS, TRANSLATOR_VERSION, convert_and_fingerprint, find_files_to_convert, \
+    write_history_file
+from manifest import ConversionManifest
+from metrics import FileMetrics, Metrics
+from scan import scan_task
+from style_rewriter import StyleRewriter
+
+# style rewriter of this worker process, every file the worker converts shares its memo (see start_worker)
+worker_rewriter = None
+
+
+# runs once in every worker process (or in this process when workers is 1), before its first file
+def start_worker():
+    global worker_rewriter
+    worker_rewriter = StyleRewriter()
+
+
+# converts a single file inside a worker process
+# Argument: task
+# (directory, filename, collect metrics, parser backend) tuple
+# returns the task with a flag saying if the file was modified, the file's manifest entry,
+# its metrics (None when metrics aren't collected) and the (hits, misses) of the style memo for the file
+# NOTE: workers report back through the return value, the worker's rewriter is only read here
+def convert_task(task):
+    directory, filename, measure, backend = task
+    if worker_rewriter is None:
+        start_worker()
+    hits, misses = worker_rewriter.hits, worker_rewriter.misses
+    metrics = Metrics() if measure else None
+    modified, entry = convert_and_fingerprint(filename, directory, metrics, backend, worker_rewriter)
+    file_metrics = metrics.files[0].as_dict() if measure else None
+    memo = (worker_rewriter.hits - hits, worker_rewriter.misses - misses)
+    return directory, filename, modified, entry, file_metrics, memo
+
+
+# pool of worker processes, or None when workers is 1 (the files are converted in this process)
+# Argument: initializer (optional)
+# function run once in every worker process, or once here when workers is 1
+def worker_pool(workers, initializer=None):
+    if workers == 1:
+        if initializer is not None:
+            initializer()
+        return nullcontext()
+    return ProcessPoolExecutor(max_workers=workers, initializer=initializer)
+
+
+# results of function for every task, in the order of the tasks, from the pool or from this process
+def map_tasks(executor, function, tasks, chunksize):
+    if executor is None:
+        return map(function, tasks)
+    return executor.map(function, tasks, chunksize=chunksize)
+
+
+# builds the list of (directory, filename) pairs to convert
+# Argument: manifests
+# manifest for each directory, files that didn't change since the last run are left out
+# Argument: force
+# convert every file regardless of the manifests
+def collect_tasks(directories, manifests, force=False):
+    tasks = []
+    for directory in directories:
+        manifest = manifests[directory]
+        for filename in find_files_to_convert(directory):
+            if force or manifest.needs_conversion(directory, filename):
+                tasks.append((directory, filename))
+    return tasks
+
+
+# converts every file in the directories using a pool of worker processes
+# Argument: directories
+# folders containing the .svg files to convert
+# Argument: workers
+# number of worker processes, defaults to the number of CPUs
+# Argument: chunksize
+# number of files handed to a worker at a time
+# Argument: force
+# convert files even if the manifest says they are up to date
+# Argument: metrics (optional)
+# metrics.Metrics that receives the per-file metrics from the workers
+# Argument: backend (optional)
+# parser backend the files are split into lines with, "regex" or "expat"
+# returns a dictionary of statistics for the batch
+def run_batch(directories, workers=None, chunksize=16, force=False, metrics=None, backend=DEFAULT_BACKEND):
+    start = time.perf_counter()
+    manifests = {directory: ConversionManifest.load(directory, TRANSLATOR_VERSION, backend) for directory in directories}
+    tasks = [(directory, filename, metrics is not None, backend)
+             for directory, filename in collect_tasks(directories, manifests, force)]
+
+    # list of modified files for each directory, used for the history files
+    modified = {directory: [] for directory in directories}
+
+    memo_hits = 0
+    memo_misses = 0
+    with worker_pool(workers, start_worker) as executor:
+        for directory, filename, was_modified, entry, file_metrics, (hits, misses) in \
+                map_tasks(executor, convert_task, tasks, chunksize):
+            memo_hits += hits
+            memo_misses += misses
+            manifests[directory].record(filename, entry)
+            if was_modified:
+                modified[directory].append(filename)
+            if file_metrics is not None:
+                metrics.add(FileMetrics.from_dict(file_metrics))
+
+    for manifest in manifests.values():
+        manifest.save()
+
+    # one history file per directory, same as the UI
+    for directory, files in modified.items():
+        if files:
+            write_history_file(directory, files)
+
+    elapsed = time.perf_counter() - start
+    return {
+        "files": len(tasks),
+        "modified": sum(len(files) for files in modified.values()),
+        "seconds": elapsed,
+        "files_per_second": len(tasks) / elapsed if elapsed > 0 else 0.0,
+        # style strings converted (misses) and reused (hits) by the workers' rewriters
+        "style_memo": {
+            "hits": memo_hits,
+            "misses": memo_misses,
+            "hit_rate": memo_hits / (memo_hits + memo_misses) if memo_hits + memo_misses > 0 else 0.0,
+        },
+    }
+
+
+# lists the files that need converting without converting anything
+# Argument: directories
+# folders containing the .svg files to scan
+# returns ([(path, size in bytes)], dictionary of statistics for the scan)
+def run_scan(directories, workers=None, chunksize=64):
+    start = time.perf_counter()
+    tasks = [(directory, filename) for directory in directories for filename in find_files_to_convert(directory)]
+
+    with worker_pool(workers) as executor:
+        needs_work = [(os.path.join(directory, filename), size)
+                      for directory, filename, size, found in map_tasks(executor, scan_task, tasks, chunksize)
+                      if found]
+
+    elapsed = time.perf_counter() - start
+    return needs_work, {
+        "files": len(tasks),
+        "modified": len(needs_work),
+        "seconds": elapsed,
+        "files_per_second": len(tasks) / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+# argparse type of the worker and chunk counts, a whole number greater than 0
+def positive_int(text):
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, not {text}")
+    return value
+
+
+def parse_arguments(argv):
+    parser = argparse.ArgumentParser(description="Translates 'style' attributes of every SVG file in one or "
+                                                 "more directories to SVG tiny compliant attributes.")
+    parser.add_argument("directories", nargs="+", help="directories containing .svg files")
+    parser.add_argument("-w", "--workers", type=positive_int, default=None,
+                        help="number of worker processes (default: number of CPUs)")
+    parser.add_argument("-c", "--chunksize", type=positive_int, default=16,
+                        help="number of files handed to a worker at a time (default: 16)")
+    parser.add_argument("-f", "--force", action="store_true",
+                        help="convert every file, even those unchanged since the last run")
+    parser.add_argument("-s", "--scan", action="store_true",
+                        help="only list the files that need converting, with their sizes")
+    parser.add_argument("-b", "--backend", choices=sorted(TOKENIZERS), default=DEFAULT_BACKEND,
+                        help=f"parser the files are split into lines with (default: {DEFAULT_BACKEND})")
+    parser.add_argument("-m", "--metrics", default=None,
+                        help="write per-file phase timings and counters to this file as JSON lines")
+    parser.add_argument("--summary", action="store_true",
+                        help="print a summary table of the phase timings and counters")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_arguments(argv)
+
+    for directory in args.directories:
+        if not os.path.isdir(directory):
+            print(f"Not a directory: {directory}", file=sys.stderr)
+            return 1
+
+    if args.scan:
+        needs_work, stats = run_scan(args.directories, workers=args.workers)
+        for path, size in needs_work:
+            print(f"{size}\t{path}")
+        print(f"Files scanned: {stats['files']}, files needing conversion: {stats['modified']} "
+              f"({sum(size for _, size in needs_work)} bytes), "
+              f"{stats['seconds']:.2f}s ({stats['files_per_second']:.1f} files/sec)")
+        return 0
+
+    metrics = Metrics() if args.metrics or args.summary else None
+    stats = run_batch(args.directories, workers=args.workers, chunksize=args.chunksize, force=args.force,
+                      metrics=metrics, backend=args.backend)
+    print(f"Files processed: {stats['files']}, files modified: {stats['modified']}, "
+          f"{stats['seconds']:.2f}s ({stats['files_per_second']:.1f} files/sec)")
+    memo = stats["style_memo"]
+    print(f"Style memo: {memo['hits']} hits, {memo['misses']} misses ({memo['hit_rate']:.1%} hit rate)")
+
+    if args.metrics:
+        with open(args.metrics, "w") as writer:
+            metrics.write_json_lines(writer)
+    if args.summary:
+        print(metrics.summary())
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
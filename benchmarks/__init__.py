@@ -0,0 +1,14 @@
+"""
+Benchmarks for the CSS translator (translator.py) and the SVG Converter (SVG Converter/converter.py)
+
+    python -m benchmarks.startup        import time of the library modules
+    python -m benchmarks.throughput     files/sec, elements/sec, MB/sec and peak RSS on a synthetic corpus
+    python -m benchmarks.backends       regex against expat parser backends of both tools
+    python -m benchmarks.corpus         writes a synthetic corpus of Illustrator-style SVG files
+"""
+import os
+
+# folders of the two tools, the tools import their own modules by name so they are run/imported from there
+REPOSITORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TRANSLATOR_FOLDER = REPOSITORY
+CONVERTER_FOLDER = os.path.join(REPOSITORY, "SVG Converter")
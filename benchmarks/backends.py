@@ -0,0 +1,183 @@
+"""
+File: backends.py
+Name: Cody J. McBride
+Contact: cody.j.mcbride@gmail.com
+Description: Compares the regular expression and the expat parser backends of both tools
+Version: 0.2
+Date: 10/18/2026
+General Notes:
+    Generates the same synthetic corpora as throughput.py and, for every backend, times
+        translator_tokenize     splitting every file into lines (tokenizer.py / xml_tokenizer.py)
+        translator              translate_stream() on every file, tokenizing, rewriting and writing
+        converter_tokenize      splitting every file into elements (svgTokenizer.py / xmlElements.py)
+        converter_parse         the converter's element parsing loop (parseTokens) on every file
+    Each phase reports files/sec, elements/sec and MB/sec (of source svg) as JSON, with the
+    speed-up of expat over the regular expressions.
+    Every phase of every backend runs once on the first file before anything is timed (warm_up), so what
+    the tools import on first use (Ex. NumPy, when the converter parses its first path) isn't timed as part
+    of whichever backend runs first. The phases are then timed --repeat times, the order of the backends
+    alternates between repeats and the fastest run of each phase is reported.
+
+Usage:
+    python -m benchmarks.backends [--files N] [--elements N] [--repeat N] [--seed N] [--corpus DIRECTORY]
+                                  [--output FILE]
+Version History
+[0.2]
+    Untimed warm-up run, repeats in alternating backend order, fastest run of each phase reported
+[0.1]
+    Backend benchmark
+"""
+import argparse
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from benchmarks.corpus import generate_corpus
+from benchmarks.throughput import folder_bytes, rates
+
+import converter  # noqa: E402 (throughput.py puts the tools' folders on sys.path)
+import translator  # noqa: E402
+
+BACKENDS = ("regex", "expat")
+
+
+# reads every file into memory, so only the parsing is timed
+def read_files(directory, names):
+    contents = []
+    for name in names:
+        with open(os.path.join(directory, name), "r") as reader:
+            contents.append(reader.read())
+    return contents
+
+
+def time_phase(contents, elements, total_bytes, function):
+    errors = 0
+    start = time.perf_counter()
+    for text in contents:
+        try:
+            function(text)
+        except Exception:
+            errors += 1
+    return rates(time.perf_counter() - start, len(contents), elements * len(contents), total_bytes, errors)
+
+
+def bench_translator(contents, elements, total_bytes, backend):
+    tokenize = translator.TOKENIZERS[backend]
+
+    def split(text):
+        for _ in tokenize(io.StringIO(text)):
+            pass
+
+    def translate(text):
+        translator.translate_stream(io.StringIO(text), io.StringIO(), backend)
+
+    return {
+        "translator_tokenize": time_phase(contents, elements, total_bytes, split),
+        "translator": time_phase(contents, elements, total_bytes, translate),
+    }
+
+
+def bench_converter(contents, elements, total_bytes, backend):
+    read = converter.ELEMENT_READERS[backend]
+
+    def split(text):
+        for _ in read(io.StringIO(text)):
+            pass
+
+    def parse(text):
+        converter.parseTokens(converter.ConversionContext(), read(io.StringIO(text)))
+
+    return {
+        "converter_tokenize": time_phase(contents, elements, total_bytes, split),
+        "converter_parse": time_phase(contents, elements, total_bytes, parse),
+    }
+
+
+# runs every phase of every backend on the first file without timing them
+def warm_up(translator_contents, converter_contents):
+    for backend in BACKENDS:
+        bench_translator(translator_contents[:1], 0, 0, backend)
+        bench_converter(converter_contents[:1], 0, 0, backend)
+
+
+# keeps the fastest run of every phase
+# Argument: best
+# phase -> rates of the fastest runs so far, None before the first run
+# Argument: result
+# phase -> rates of a run
+def fastest(best, result):
+    if best is None:
+        return result
+    return {phase: min(best[phase], result[phase], key=lambda rate: rate["seconds"]) for phase in best}
+
+
+def run_backends(files, elements, seed=0, corpus=None, repeat=3):
+    if repeat < 1:
+        raise ValueError(f"repeat must be at least 1, not {repeat}")
+    directory = corpus or tempfile.mkdtemp(prefix="css_translator_bench_")
+    try:
+        translator_folder = os.path.join(directory, "translator")
+        converter_folder = os.path.join(directory, "converter")
+        names = generate_corpus(translator_folder, files, elements, seed)
+        generate_corpus(converter_folder, files, elements, seed, style_ratio=0.0)
+        translator_bytes = folder_bytes(translator_folder, names)
+        converter_bytes = folder_bytes(converter_folder, names)
+        translator_contents = read_files(translator_folder, names)
+        converter_contents = read_files(converter_folder, names)
+
+        report = {
+            "corpus": {"files": files, "elements_per_file": elements, "seed": seed,
+                       "translator_bytes": translator_bytes, "converter_bytes": converter_bytes},
+            "repeat": repeat,
+        }
+        warm_up(translator_contents, converter_contents)
+        for run in range(repeat):
+            # neither backend always runs first
+            for backend in (BACKENDS if run % 2 == 0 else BACKENDS[::-1]):
+                result = bench_translator(translator_contents, elements, translator_bytes, backend)
+                result.update(bench_converter(converter_contents, elements, converter_bytes, backend))
+                report[backend] = fastest(report.get(backend), result)
+
+        # how many times faster expat is than the regular expressions, per phase
+        report["expat_speedup"] = {
+            phase: report["regex"][phase]["seconds"] / report["expat"][phase]["seconds"]
+            if report["expat"][phase]["seconds"] > 0 else 0.0
+            for phase in report["regex"]
+        }
+        report["python"] = sys.version.split()[0]
+        return report
+    finally:
+        if corpus is None:
+            shutil.rmtree(directory, ignore_errors=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compares the regex and expat parser backends of both tools.")
+    parser.add_argument("-f", "--files", type=int, default=100, help="number of files, 1 to 100000 (default: 100)")
+    parser.add_argument("-e", "--elements", type=int, default=100,
+                        help="drawn elements per file, 10 to 1000000 (default: 100)")
+    parser.add_argument("-r", "--repeat", type=int, default=3,
+                        help="times every phase is timed, the fastest is reported (default: 3)")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="random seed (default: 0)")
+    parser.add_argument("--corpus", default=None,
+                        help="write the corpus to (and keep it in) this folder instead of a temporary folder")
+    parser.add_argument("-o", "--output", default=None, help="also write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    if args.repeat < 1:
+        parser.error(f"--repeat must be at least 1, not {args.repeat}")
+    report = run_backends(args.files, args.elements, args.seed, args.corpus, args.repeat)
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w") as writer:
+            writer.write(text + "\n")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
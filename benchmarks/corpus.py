@@ -0,0 +1,171 @@
+"""
+File: corpus.py
+Name: Cody J. McBride
+Contact: cody.j.mcbride@gmail.com
+Description: Synthetic corpus generator, writes Illustrator-style SVG files for the benchmarks
+Version: 0.1
+Date: 10/18/2026
+General Notes:
+    The files look like Adobe Illustrator 'SVG 1.1' exports:
+        a <style> block of .stN{...} css classes
+        rects (some with transform="matrix(...)"), ellipses, circles, lines, polygons
+        paths with h/v/H/V segments and C/c curves
+        inline style="..." attributes on some of the elements (for the CSS translator)
+    The output only depends on the seed, so corpora can be regenerated to compare versions.
+
+Usage:
+    python -m benchmarks.corpus DIRECTORY [--files N] [--elements N] [--seed N]
+"""
+import argparse
+import os
+import random
+import sys
+
+# A4 page in points, the default Illustrator template
+PAGE_WIDTH = 595.3
+PAGE_HEIGHT = 841.9
+
+HEADER = ("<?xml version=\"1.0\" encoding=\"utf-8\"?>\n"
+          "<!-- Generator: Adobe Illustrator 27.0.0, SVG Export Plug-In . SVG Version: 6.00 Build 0)  -->\n"
+          "<svg version=\"1.1\" id=\"Layer_1\" xmlns=\"http://www.w3.org/2000/svg\" "
+          "xmlns:xlink=\"http://www.w3.org/1999/xlink\" x=\"0px\" y=\"0px\"\n"
+          f"\t viewBox=\"0 0 {PAGE_WIDTH} {PAGE_HEIGHT}\" "
+          f"style=\"enable-background:new 0 0 {PAGE_WIDTH} {PAGE_HEIGHT};\" xml:space=\"preserve\">\n")
+
+# number of .stN classes in each file
+CLASS_COUNT = 8
+
+# inline styles repeat a small set of colours, like the S100 colour tokens they stand for
+INLINE_COLORS = ("#000000", "#FFFFFF", "#ED1C24", "#39B54A", "#00AEEF", "#FFF200", "#808080", "#C758A0")
+
+
+def color(rng):
+    return "#%06X" % rng.randrange(0x1000000)
+
+
+def number(rng, low, high):
+    return round(rng.uniform(low, high), 1)
+
+
+def css_class(rng, index):
+    if rng.random() < 0.3:
+        return f"\t.st{index}{{fill:{color(rng)};}}\n"
+    fill = "none" if rng.random() < 0.5 else color(rng)
+    return (f"\t.st{index}{{fill:{fill};stroke:{color(rng)};stroke-width:{rng.randint(1, 4)};"
+            f"stroke-miterlimit:10;}}\n")
+
+
+def inline_style(rng):
+    return f" style=\"stroke-width: {rng.choice((0.32, 0.64, 0.96))}; fill: {rng.choice(INLINE_COLORS)};\""
+
+
+def rect(rng, cls, style):
+    x, y = number(rng, 0, PAGE_WIDTH - 60), number(rng, 0, PAGE_HEIGHT - 60)
+    transform = ""
+    if rng.random() < 0.3:
+        angle = rng.uniform(-1, 1)
+        transform = (f" transform=\"matrix({round(1 - angle * angle / 2, 4)} {round(-angle, 4)} "
+                     f"{round(angle, 4)} {round(1 - angle * angle / 2, 4)} {number(rng, -50, 50)} "
+                     f"{number(rng, -50, 50)})\"")
+    return (f"<rect x=\"{x}\" y=\"{y}\"{transform} class=\"{cls}\" width=\"{number(rng, 5, 60)}\" "
+            f"height=\"{number(rng, 5, 60)}\"{style}/>\n")
+
+
+def ellipse(rng, cls, style):
+    return (f"<ellipse class=\"{cls}\" cx=\"{number(rng, 50, PAGE_WIDTH - 50)}\" "
+            f"cy=\"{number(rng, 50, PAGE_HEIGHT - 50)}\" rx=\"{number(rng, 5, 50)}\" "
+            f"ry=\"{number(rng, 5, 50)}\"{style}/>\n")
+
+
+def circle(rng, cls, style):
+    return (f"<circle class=\"{cls}\" cx=\"{number(rng, 50, PAGE_WIDTH - 50)}\" "
+            f"cy=\"{number(rng, 50, PAGE_HEIGHT - 50)}\" r=\"{number(rng, 5, 50)}\"{style}/>\n")
+
+
+def line(rng, cls, style):
+    return (f"<line class=\"{cls}\" x1=\"{number(rng, 0, PAGE_WIDTH)}\" y1=\"{number(rng, 0, PAGE_HEIGHT)}\" "
+            f"x2=\"{number(rng, 0, PAGE_WIDTH)}\" y2=\"{number(rng, 0, PAGE_HEIGHT)}\"{style}/>\n")
+
+
+def polygon(rng, cls, style):
+    points = " ".join(f"{number(rng, 0, PAGE_WIDTH)},{number(rng, 0, PAGE_HEIGHT)}"
+                      for _ in range(rng.randint(3, 12)))
+    return f"<polygon class=\"{cls}\" points=\"{points} \"{style}/>\n"
+
+
+def path(rng, cls, style):
+    x, y = number(rng, 50, PAGE_WIDTH - 100), number(rng, 50, PAGE_HEIGHT - 100)
+    segments = [f"M{x},{y}"]
+    for _ in range(rng.randint(1, 6)):
+        kind = rng.random()
+        if kind < 0.4:
+            # relative curve, Illustrator writes the control points without separators before '-'
+            segments.append(f"c{number(rng, 1, 10)},{number(rng, -20, 20)},{number(rng, 11, 30)},"
+                            f"{number(rng, -20, 20)},{number(rng, 31, 40)},{number(rng, -5, 5)}")
+        elif kind < 0.6:
+            x2 = round(x + rng.uniform(5, 15), 1)
+            x3 = round(x2 + rng.uniform(5, 15), 1)
+            segments.append(f"C{round(x + 1, 1)},{number(rng, y - 20, y)},{x2},{number(rng, y - 20, y)},"
+                            f"{x3},{number(rng, y - 20, y)}")
+        elif kind < 0.8:
+            segments.append(f"h{number(rng, 1, 40)}")
+        else:
+            segments.append(f"v{number(rng, 1, 40)}")
+    if rng.random() < 0.5:
+        segments.append("z")
+    return f"<path class=\"{cls}\" d=\"{''.join(segments)}\"{style}/>\n"
+
+
+SHAPES = (rect, rect, ellipse, circle, line, polygon, path, path)
+
+
+# builds one Illustrator-style svg document
+# Argument: elements
+# number of drawn elements in the document
+# Argument: rng
+# random.Random the document is built from
+# Argument: style_ratio (optional)
+# fraction of the elements that get an inline style attribute
+def generate_svg(elements, rng, style_ratio=0.5):
+    parts = [HEADER, "<style type=\"text/css\">\n"]
+    parts.extend(css_class(rng, index) for index in range(CLASS_COUNT))
+    parts.append("</style>\n")
+    parts.append("<text transform=\"matrix(1 0 0 1 10 10)\">Title: Synthetic</text>\n")
+    for _ in range(elements):
+        cls = f"st{rng.randrange(CLASS_COUNT)}"
+        style = inline_style(rng) if rng.random() < style_ratio else ""
+        parts.append(rng.choice(SHAPES)(rng, cls, style))
+    parts.append("</svg>\n")
+    return "".join(parts)
+
+
+# writes a corpus of svg files
+# returns the list of file names
+def generate_corpus(directory, files, elements, seed=0, style_ratio=0.5):
+    os.makedirs(directory, exist_ok=True)
+    names = []
+    for index in range(files):
+        rng = random.Random(f"{seed}-{index}")
+        name = f"synthetic_{index:06d}.svg"
+        with open(os.path.join(directory, name), "w") as writer:
+            writer.write(generate_svg(elements, rng, style_ratio))
+        names.append(name)
+    return names
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Writes a synthetic corpus of Illustrator-style SVG files.")
+    parser.add_argument("directory", help="folder the files are written to")
+    parser.add_argument("-f", "--files", type=int, default=100, help="number of files (default: 100)")
+    parser.add_argument("-e", "--elements", type=int, default=100, help="drawn elements per file (default: 100)")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="random seed (default: 0)")
+    parser.add_argument("--style-ratio", type=float, default=0.5,
+                        help="fraction of elements with an inline style attribute (default: 0.5)")
+    args = parser.parse_args(argv)
+
+    generate_corpus(args.directory, args.files, args.elements, args.seed, args.style_ratio)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,90 @@
+"""
+File: startup.py
+Name: Cody J. McBride
+Contact: cody.j.mcbride@gmail.com
+Description: Start-up time benchmark, measures how long a fresh interpreter takes to import each tool
+Version: 0.1
+Date: 10/18/2026
+General Notes:
+    Worker processes import the tools once per process, so import time is paid by every worker.
+    Each import runs in a new interpreter; the report also lists any heavy module
+    (tkinter, numpy, scipy, matplotlib) that was imported as a side effect.
+
+Usage:
+    python -m benchmarks.startup [--repeat N] [--max-ms MS]
+    Exits with 1 when the median import time of a tool is over --max-ms.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+from benchmarks import CONVERTER_FOLDER, TRANSLATOR_FOLDER
+
+HEAVY_MODULES = ("tkinter", "numpy", "scipy", "matplotlib")
+
+# (name, folder, module)
+TARGETS = (
+    ("translator", TRANSLATOR_FOLDER, "translator"),
+    ("converter", CONVERTER_FOLDER, "converter"),
+)
+
+# imports the module and prints the import time and the heavy modules it pulled in
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"ms": elapsed * 1000, "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+# imports a module in a new interpreter
+# returns (import time in ms, heavy modules imported)
+def measure_import(folder, module):
+    probe = PROBE.format(module=module, heavy=HEAVY_MODULES)
+    output = subprocess.run([sys.executable, "-c", probe], cwd=folder, check=True,
+                            capture_output=True, text=True).stdout
+    result = json.loads(output.splitlines()[-1])
+    return result["ms"], result["heavy"]
+
+
+def run_startup(repeat=5):
+    results = {}
+    for name, folder, module in TARGETS:
+        times = []
+        heavy = []
+        for _ in range(repeat):
+            ms, heavy = measure_import(folder, module)
+            times.append(ms)
+        results[name] = {
+            "module": module,
+            "median_ms": statistics.median(times),
+            "min_ms": min(times),
+            "max_ms": max(times),
+            "heavy_modules": heavy,
+        }
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measures the import time of the translator and the converter.")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="imports per tool (default: 5)")
+    parser.add_argument("--max-ms", type=float, default=None,
+                        help="fail when a median import time is over this many milliseconds")
+    args = parser.parse_args(argv)
+
+    results = run_startup(args.repeat)
+    print(json.dumps(results, indent=2))
+
+    if args.max_ms is not None:
+        slow = [name for name, result in results.items() if result["median_ms"] > args.max_ms]
+        if slow:
+            print(f"Import time over {args.max_ms} ms: {', '.join(slow)}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,180 @@
+"""
+File: throughput.py
+Name: Cody J. McBride
+Contact: cody.j.mcbride@gmail.com
+Description: Throughput benchmark for the CSS translator and the SVG Converter
+Version: 0.2
+Date: 10/18/2026
+General Notes:
+    Generates two synthetic corpora (see corpus.py), one with inline style attributes for the
+    translator and one without (like real Illustrator exports) for the converter, and times
+        translator      check_for_style() on every file
+        converter_parse the converter's element parsing loop (parseTokens) on every file
+        converter_write writeNewFile() for every parsed file
+    Each phase reports files/sec, elements/sec and MB/sec (of source svg); the report also
+    includes the peak RSS of the process. The report is JSON so runs can be compared across versions.
+    Both tools run once on the first file before anything is timed (warm_up), so what they import on
+    first use (Ex. NumPy, when the converter parses its first path) isn't timed as part of the first file.
+
+Usage:
+    python -m benchmarks.throughput [--files N] [--elements N] [--seed N] [--corpus DIRECTORY] [--output FILE]
+Version History
+[0.2]
+    Untimed warm-up run before the phases are timed
+[0.1]
+    Throughput benchmark
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from benchmarks import CONVERTER_FOLDER, TRANSLATOR_FOLDER
+from benchmarks.corpus import generate_corpus
+
+try:
+    import resource  # not available on Windows
+except ImportError:
+    resource = None
+
+# the tools import their own modules by name
+for folder in (TRANSLATOR_FOLDER, CONVERTER_FOLDER):
+    if folder not in sys.path:
+        sys.path.insert(0, folder)
+
+import converter  # noqa: E402
+import translator  # noqa: E402
+from style_rewriter import StyleRewriter  # noqa: E402
+
+
+# returns the peak resident set size of the process in MB, or None when it can't be measured
+def peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def folder_bytes(directory, names):
+    return sum(os.path.getsize(os.path.join(directory, name)) for name in names)
+
+
+def rates(seconds, files, elements, total_bytes, errors=0):
+    return {
+        "seconds": seconds,
+        "files": files,
+        "errors": errors,
+        "files_per_second": files / seconds if seconds > 0 else 0.0,
+        "elements_per_second": elements / seconds if seconds > 0 else 0.0,
+        "mb_per_second": total_bytes / (1024 * 1024) / seconds if seconds > 0 else 0.0,
+    }
+
+
+# runs the translator and the converter on the first file without timing them
+def warm_up(translator_folder, converter_folder, names):
+    translator.check_for_style(names[0], translator_folder)
+    ctx = converter.ConversionContext()
+    with open(os.path.join(converter_folder, names[0]), "r") as filePointer:
+        converter.parseTokens(ctx, converter.iterElements(filePointer))
+    output = os.path.join(converter_folder, "converted")
+    os.makedirs(output, exist_ok=True)
+    converter.writeNewFile(ctx, os.path.join(output, names[0]))
+
+
+def bench_translator(directory, names, elements, total_bytes):
+    rewriter = StyleRewriter()
+    start = time.perf_counter()
+    for name in names:
+        translator.check_for_style(name, directory, rewriter=rewriter)
+    seconds = time.perf_counter() - start
+    result = rates(seconds, len(names), elements * len(names), total_bytes)
+    result["style_memo"] = rewriter.stats()
+    return result
+
+
+# parses every file, then writes every parsed file, so the two phases are timed separately
+def bench_converter(directory, names, elements, total_bytes):
+    output = os.path.join(directory, "converted")
+    os.makedirs(output, exist_ok=True)
+
+    contexts = []
+    errors = 0
+    start = time.perf_counter()
+    for name in names:
+        ctx = converter.ConversionContext()
+        try:
+            with open(os.path.join(directory, name), "r") as filePointer:
+                converter.parseTokens(ctx, converter.iterElements(filePointer))
+        except Exception:
+            errors += 1
+            continue
+        contexts.append((name, ctx))
+    parse = rates(time.perf_counter() - start, len(names), elements * len(names), total_bytes, errors)
+
+    errors = 0
+    start = time.perf_counter()
+    for name, ctx in contexts:
+        try:
+            converter.writeNewFile(ctx, os.path.join(output, name))
+        except Exception:
+            errors += 1
+    write = rates(time.perf_counter() - start, len(contexts), elements * len(contexts), total_bytes, errors)
+    return parse, write
+
+
+def run_throughput(files, elements, seed=0, corpus=None):
+    directory = corpus or tempfile.mkdtemp(prefix="css_translator_bench_")
+    try:
+        translator_folder = os.path.join(directory, "translator")
+        converter_folder = os.path.join(directory, "converter")
+        names = generate_corpus(translator_folder, files, elements, seed)
+        generate_corpus(converter_folder, files, elements, seed, style_ratio=0.0)
+        translator_bytes = folder_bytes(translator_folder, names)
+        converter_bytes = folder_bytes(converter_folder, names)
+
+        warm_up(translator_folder, converter_folder, names)
+        translator_result = bench_translator(translator_folder, names, elements, translator_bytes)
+        parse_result, write_result = bench_converter(converter_folder, names, elements, converter_bytes)
+
+        return {
+            "corpus": {"files": files, "elements_per_file": elements, "seed": seed,
+                       "translator_bytes": translator_bytes, "converter_bytes": converter_bytes},
+            "translator": translator_result,
+            "converter_parse": parse_result,
+            "converter_write": write_result,
+            "peak_rss_mb": peak_rss_mb(),
+            "python": sys.version.split()[0],
+        }
+    finally:
+        if corpus is None:
+            shutil.rmtree(directory, ignore_errors=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Times the translator and the converter on a synthetic corpus.")
+    parser.add_argument("-f", "--files", type=int, default=100, help="number of files, 1 to 100000 (default: 100)")
+    parser.add_argument("-e", "--elements", type=int, default=100,
+                        help="drawn elements per file, 10 to 1000000 (default: 100)")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="random seed (default: 0)")
+    parser.add_argument("--corpus", default=None,
+                        help="write the corpus to (and keep it in) this folder instead of a temporary folder")
+    parser.add_argument("-o", "--output", default=None, help="also write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    report = run_throughput(args.files, args.elements, args.seed, args.corpus)
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w") as writer:
+            writer.write(text + "\n")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -3,13 +3,13 @@ File: main.py
 Name: Cody J. McBride
 Contact: cody.j.mcbride@gmail.com
 Description: Translates 'style' attribute from SVG 1.1 compliant to SVG tiny compliant version
-Version: 0.1
+Version: 0.2
 Date: 02/07/2024
+General Notes:
+    This file is the UI, the translator itself is in translator.py
 """
 
 # import system libraries
-import os  # used to handle file I/O
-import re  # regular expressions
 import time  # datetime
 import signal
 
@@ -18,7 +18,9 @@ import tkinter
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
-from datetime import datetime
+from manifest import ConversionManifest
+from style_rewriter import StyleRewriter
+from translator import DEFAULT_BACKEND, TRANSLATOR_VERSION, convert_and_fingerprint, find_files_to_convert, write_history_file
 
 # list of modified files for history
 files_modified = []
@@ -34,150 +36,35 @@ def button_listener(source_folder, current_file):
     source_folder.insert(1.0, directory)
     source_folder.config(state='disabled')
 
+    # only files that changed since the last conversion are converted again
+    manifest = ConversionManifest.load(directory, TRANSLATOR_VERSION, DEFAULT_BACKEND)
+    # the files of a folder share their style memo
+    rewriter = StyleRewriter()
+
     # iterate over the files in the directory
-    for filename in os.listdir(directory):
-        # prepend the converted file with css_removed_
-        modified_file_name = "css_removed_" + filename
-        modified_file_path = os.path.join(directory, modified_file_name)
-
-        # don't modify the history file
-        if "list_of_modified_files" not in filename:
-            # don't try to modify a file that's already been modified
-            if not os.path.exists(modified_file_path):
-                # don't try to modify a 'modified' file
-                if "css_removed" not in filename:
-                    if ".svg" in filename:
-                        # update the text box to show the current file
-                        current_file.config(state='normal')
-                        current_file.delete(1.0, 'end')
-                        current_file.insert(1.0, filename)
-                        current_file.config(state='disabled')
-                        current_file.master.update()
-                        check_for_style(filename, directory)
-
-    nam = write_history_file(directory)
+    for filename in find_files_to_convert(directory):
+        if not manifest.needs_conversion(directory, filename):
+            continue
+
+        # update the text box to show the current file
+        current_file.config(state='normal')
+        current_file.delete(1.0, 'end')
+        current_file.insert(1.0, filename)
+        current_file.config(state='disabled')
+        current_file.master.update()
+        modified, entry = convert_and_fingerprint(filename, directory, rewriter=rewriter)
+        manifest.record(filename, entry)
+        if modified and filename not in files_modified:
+            files_modified.append(filename)
+
+    manifest.save()
+    nam = write_history_file(directory, files_modified)
     tkinter.messagebox.showinfo("Success!",
                                 f"Number of files modified: {len(files_modified)}, list of files modified in the file: {nam}")
     reset_app(source_folder, current_file)
     pass
 
 
-# function to check if the file has style information that needs to be replaced
-def check_for_style(filename, filepath):
-    global files_modified
-    whole_path = os.path.join(filepath, filename)
-
-    # pointer to the current file
-    filePointer = open(whole_path, "r")
-
-    # contiguous string of all the file contents
-    fileContents = filePointer.read()
-
-    # collection of individual lines in the file as defined by brackets <>
-    # This regular expression parses the file into lines based on opening and closing brackets < ... >
-    lines = re.findall("<text[a-zA-Z0-9 \"=:)(><\/.]+|<[^>]*>|..*|[a-z]+}", fileContents)
-
-    # check all the lines for 'style'
-    for line in lines:
-        if line.find("style") >= 0:
-
-            # ignore style in the header
-            if line.find("xml") >= 0:
-                pass
-
-            # this file needs style information replaced
-            else:
-                lines = replace_style_information(lines)
-                if not os.path.exists(filepath + "/css_removed/"):
-                    os.makedirs(filepath + "/css_removed/")
-                new_file = os.path.join(filepath + "/css_removed/", filename)
-                write_new_file(lines, new_file)
-                if filename not in files_modified:
-                    files_modified.append(filename)
-        else:
-            lines = replace_style_information(lines)
-            if not os.path.exists(filepath + "/css_removed/"):
-                os.makedirs(filepath + "/css_removed/")
-            new_file = os.path.join(filepath + "/css_removed/", filename)
-            write_new_file(lines, new_file)
-            if filename not in files_modified:
-                files_modified.append(filename)
-
-    pass
-
-
-# function for replacing all the style information
-# Argument: lines
-# all lines in the file
-def replace_style_information(lines):
-    new_lines = []
-    for line in lines:
-        if "style" in line and "xml" not in line:
-            new_lines.append(re.sub("style=\"[a-zA-Z0-9- :.;]*\"", parse_style(line), line))
-        else:
-            new_lines.append(line)
-    return new_lines
-
-
-# replace all style information with new format
-# Argument: line
-# the current line in the file. Ex. <path d=" M 0,-1.5 L 0,1.5" class="sl f0 sCHBLK" style="stroke-width: 0.64;"/>
-def parse_style(line):
-    # This Regular Expression only handles style components with numeric values
-    style_lines = re.findall("[a-zA-Z-]+:\s*[0-9.]+;*", line)
-
-    # initialize empty lists
-    style_type_collection = []
-    value_collection = []
-
-    for line in style_lines:
-        style_type_collection += re.findall("[a-zA-Z-]+:\s*", line)
-        value_collection += re.findall("[0-9.]+", line)
-
-    string_return = ""
-
-    # iterate over the style components and their values
-    for style, value in zip(style_type_collection, value_collection):
-        style = style.replace(":", "=\"")
-        style = style.replace(" ", "")
-        string_return = string_return + style + value + "\" "
-
-    return string_return
-
-
-def write_new_file(lines, filepath):
-    file_writer = open(filepath, "w")
-    for line in lines:
-        file_writer.write(line)
-        file_writer.write("\n")
-    pass
-
-
-def write_history_file(directory):
-    history = "list_of_modified_files.txt"
-    mod_file = os.path.join(directory + "/css_removed/", history)
-
-    # append to the history
-    file_writer = open(mod_file, 'a')
-
-    # Get the current date and time
-    current_datetime = datetime.now()
-
-    # Format the datetime
-    formatted_datetime = current_datetime.strftime("%Y-%m-%d %H:%M:%S")
-
-    # Write the history to the file
-    file_writer.write(formatted_datetime)
-    file_writer.write("\n")
-    for file in files_modified:
-        file_writer.write("\t" + file)
-        file_writer.write("\n")
-    file_writer.write("\n")
-    file_writer.close()
-
-    return history
-
-
 # clears the text boxes
 # resets the modified files collection to an empty collection
 def reset_app(source_folder, current_file):
@@ -0,0 +1,138 @@
+"""
+File: manifest.py
+Name: Cody J. McBride
+Contact: cody.j.mcbride@gmail.com
+Description: Machine-readable record of converted files, used to only reconvert files that changed
+Version: 0.2
+Date: 10/18/2026
+General Notes:
+    The manifest lives next to the converted files: <directory>/css_removed/manifest.json
+        {
+            "format": 1,
+            "files": {
+                "symbol.svg": {"sha256": "...", "size": 1234, "mtime_ns": 1700000000000000000,
+                               "translator_version": "0.2", "backend": "regex", "modified": true}
+            }
+        }
+    A file is skipped when its size and mtime match the manifest (a stat call, no read).
+    When they don't match the file is hashed, so a touched but unchanged file is still skipped.
+    Changing the translator version, or the parser backend the files are read with (a regex conversion
+    and an expat conversion of the same file can differ), reconverts everything.
+Version History
+[0.2]
+    Records the parser backend of every file
+[0.1]
+    Content-hash manifest
+"""
+
+# import system libraries
+import hashlib  # content hashes
+import json  # manifest file format
+import os  # used to handle file I/O
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_FORMAT = 1
+
+# size of the blocks read while hashing a file
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+# returns the sha256 hex digest of a file
+def hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as file_reader:
+        for block in iter(lambda: file_reader.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+# returns the manifest entry for a file in its current state
+# Argument: backend (optional)
+# parser backend the file is converted with. Ex. regex
+def fingerprint(path, translator_version, modified, backend=None):
+    status = os.stat(path)
+    return {
+        "sha256": hash_file(path),
+        "size": status.st_size,
+        "mtime_ns": status.st_mtime_ns,
+        "translator_version": translator_version,
+        "backend": backend,
+        "modified": modified,
+    }
+
+
+class ConversionManifest:
+    def __init__(self, output_folder, translator_version, backend=None):
+        self.output_folder = output_folder
+        self.path = os.path.join(output_folder, MANIFEST_NAME)
+        self.translator_version = translator_version
+        self.backend = backend
+        self.files = {}
+        self.changed = False
+
+    # reads the manifest for a directory of source files, a missing or unreadable manifest is empty
+    # Argument: directory
+    # the folder containing the source files (not the css_removed/ folder)
+    # Argument: backend (optional)
+    # parser backend the files will be converted with, files converted with another one are converted again
+    @classmethod
+    def load(cls, directory, translator_version, backend=None):
+        manifest = cls(os.path.join(directory, "css_removed"), translator_version, backend)
+        try:
+            with open(manifest.path, "r") as file_reader:
+                contents = json.load(file_reader)
+        except (OSError, ValueError):
+            return manifest
+
+        if contents.get("format") == MANIFEST_FORMAT:
+            manifest.files = contents.get("files", {})
+        return manifest
+
+    # checks if a source file has to be (re)converted
+    # Argument: directory
+    # the folder containing the source file
+    # Argument: filename
+    # name of the source file
+    def needs_conversion(self, directory, filename):
+        entry = self.files.get(filename)
+        if entry is None or entry.get("translator_version") != self.translator_version:
+            return True
+        if entry.get("backend") != self.backend:
+            return True
+
+        # the converted copy was deleted
+        if not os.path.exists(os.path.join(self.output_folder, filename)):
+            return True
+
+        path = os.path.join(directory, filename)
+        try:
+            status = os.stat(path)
+        except OSError:
+            return True
+
+        if status.st_size == entry.get("size") and status.st_mtime_ns == entry.get("mtime_ns"):
+            return False
+
+        # the file was touched, only reconvert if the contents changed
+        if status.st_size == entry.get("size") and hash_file(path) == entry.get("sha256"):
+            entry["mtime_ns"] = status.st_mtime_ns
+            self.changed = True
+            return False
+
+        return True
+
+    # stores the entry for a converted file
+    def record(self, filename, entry):
+        self.files[filename] = entry
+        self.changed = True
+
+    # writes the manifest if anything changed, replacing the old one in a single step
+    def save(self):
+        if not self.changed:
+            return
+        os.makedirs(self.output_folder, exist_ok=True)
+        temporary_path = self.path + ".tmp"
+        with open(temporary_path, "w") as file_writer:
+            json.dump({"format": MANIFEST_FORMAT, "files": self.files}, file_writer, indent=1, sort_keys=True)
+        os.replace(temporary_path, self.path)
+        self.changed = False
@@ -0,0 +1,155 @@
+"""
+File: metrics.py
+Name: Cody J. McBride
+Contact: cody.j.mcbride@gmail.com
+Description: Opt-in per-file timing and counters for the CSS translator and the SVG Converter
+Version: 0.2
+Date: 10/18/2026
+General Notes:
+    Metrics are off unless a Metrics object is passed in (check_for_style(..., metrics=Metrics())).
+    When they're off the translator only pays for a few 'is None' checks per file.
+    For each file the collector records
+        wall time per phase     scan, read, tokenize, rewrite, write, copy
+        counters                tokens, style_lines (lines with style attributes rewritten)
+        bytes in and out
+    Results can be written as JSON lines (one file per line) or printed as a summary table.
+    The SVG Converter uses this module too (see SVG Converter/conversionMetrics.py for its phases).
+    Phases can be timed inside other phases (Ex. the writes to the file while an item is serialized),
+    the time of the inner phase only counts for the inner phase, so the phases never overlap and the
+    shares of the summary add up to 100%.
+Version History
+[0.2]
+    Nested phases don't count their time twice, shared with the SVG Converter
+[0.1]
+    Per-phase timing and counters of the translator
+"""
+
+# import system libraries
+import json  # JSON lines export
+import time  # phase timing
+
+
+# adds the time spent inside a 'with' block to a phase of a FileMetrics
+# the phase it was started in is paused until the block ends
+class PhaseTimer:
+    def __init__(self, file_metrics, name):
+        self.file_metrics = file_metrics
+        self.name = name
+        self.start = 0.0
+        # timer of the phase this one was started in, None at the top
+        self.outer = None
+
+    def __enter__(self):
+        now = time.perf_counter()
+        self.outer = self.file_metrics.active
+        if self.outer is not None:
+            self.outer.stop(now)
+        self.file_metrics.active = self
+        self.start = now
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        now = time.perf_counter()
+        self.stop(now)
+        self.file_metrics.active = self.outer
+        if self.outer is not None:
+            self.outer.start = now
+        return False
+
+    # adds the time since the timer (re)started to its phase
+    def stop(self, now):
+        phases = self.file_metrics.phases
+        phases[self.name] = phases.get(self.name, 0.0) + now - self.start
+
+
+'''
+    Metrics for a single file
+
+    Class Members:
+        name        the file
+        phases      phase name -> seconds
+        counts      counter name -> count
+        bytes_in    size of the source file
+        bytes_out   size of the converted file
+        active      PhaseTimer of the phase being timed, None between phases
+'''
+class FileMetrics:
+    def __init__(self, name):
+        self.name = name
+        self.phases = {}
+        self.counts = {}
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.active = None
+
+    def phase(self, name):
+        return PhaseTimer(self, name)
+
+    def count(self, name, amount=1):
+        self.counts[name] = self.counts.get(name, 0) + amount
+
+    def as_dict(self):
+        return {
+            "file": self.name,
+            "phases": self.phases,
+            "counts": self.counts,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+        }
+
+    @classmethod
+    def from_dict(cls, values):
+        file_metrics = cls(values["file"])
+        file_metrics.phases = dict(values["phases"])
+        file_metrics.counts = dict(values["counts"])
+        file_metrics.bytes_in = values["bytes_in"]
+        file_metrics.bytes_out = values["bytes_out"]
+        return file_metrics
+
+
+# collects the FileMetrics of a run
+class Metrics:
+    def __init__(self):
+        self.files = []
+
+    def start_file(self, name):
+        file_metrics = FileMetrics(name)
+        self.files.append(file_metrics)
+        return file_metrics
+
+    # adds a file measured somewhere else (Ex. in a worker process, see FileMetrics.as_dict)
+    def add(self, file_metrics):
+        self.files.append(file_metrics)
+
+    # sums every file into a single FileMetrics
+    def totals(self):
+        total = FileMetrics("total")
+        for file_metrics in self.files:
+            for name, seconds in file_metrics.phases.items():
+                total.phases[name] = total.phases.get(name, 0.0) + seconds
+            for name, amount in file_metrics.counts.items():
+                total.count(name, amount)
+            total.bytes_in += file_metrics.bytes_in
+            total.bytes_out += file_metrics.bytes_out
+        return total
+
+    # one JSON object per file, one file per line
+    def write_json_lines(self, writer):
+        for file_metrics in self.files:
+            writer.write(json.dumps(file_metrics.as_dict()))
+            writer.write("\n")
+
+    def summary(self):
+        total = self.totals()
+        measured = sum(total.phases.values())
+        rows = [f"{'phase':<24}{'seconds':>12}{'share':>10}"]
+        for name, seconds in sorted(total.phases.items(), key=lambda item: -item[1]):
+            share = seconds / measured if measured > 0 else 0.0
+            rows.append(f"{name:<24}{seconds:>12.4f}{share:>10.1%}")
+        rows.append("")
+        rows.append(f"{'counter':<24}{'count':>12}")
+        for name, amount in sorted(total.counts.items()):
+            rows.append(f"{name:<24}{amount:>12}")
+        rows.append("")
+        rows.append(f"files: {len(self.files)}, bytes in: {total.bytes_in}, bytes out: {total.bytes_out}")
+        return "\n".join(rows)
@@ -0,0 +1,69 @@
+"""
+File: scan.py
+Name: Cody J. McBride
+Contact: cody.j.mcbride@gmail.com
+Description: Fast pre-scan that only detects which files contain style attributes that need converting
+Version: 0.1
+Date: 10/18/2026
+General Notes:
+    The file is memory mapped and searched for 'style=' as bytes, no decoding or tokenizing.
+    The search stops at the first style attribute that is not part of the XML header, which
+    follows the same rule as check_for_style: a tag containing 'xml' (<?xml ... ?>, <svg xml:space=...>)
+    is left alone.
+"""
+
+# import system libraries
+import mmap  # memory mapped file search
+import os  # used to handle file I/O
+
+# characters that make 'style' part of a longer attribute name. Ex. font-style=, xlink:style=
+NAME_CHARACTERS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_:-"
+
+# (style, name characters, =, <, >, xml) for text and for bytes
+TEXT_SEARCH = ("style", NAME_CHARACTERS, "=", "<", ">", "xml")
+BYTES_SEARCH = tuple(text.encode("ascii") for text in TEXT_SEARCH)
+
+
+# returns the offset of the first convertible style attribute in a buffer, or -1 if there is none
+# Argument: buffer
+# str, bytes, bytearray or mmap of the file contents
+def find_style_attribute(buffer):
+    style, name_characters, equals, open_bracket, close_bracket, xml = \
+        TEXT_SEARCH if isinstance(buffer, str) else BYTES_SEARCH
+
+    position = buffer.find(style)
+    while position >= 0:
+        after = position + len(style)
+        if (position == 0 or buffer[position - 1:position] not in name_characters) \
+                and buffer[after:after + 16].lstrip().startswith(equals):
+            # style attributes in the header are not converted
+            tag_start = buffer.rfind(open_bracket, 0, position)
+            tag_end = buffer.find(close_bracket, position)
+            if tag_end < 0:
+                tag_end = len(buffer)
+            if buffer.find(xml, max(tag_start, 0), tag_end) < 0:
+                return position
+        position = buffer.find(style, after)
+    return -1
+
+
+# checks if a file contains style information that needs to be replaced
+# Argument: path
+# full path of the file
+def needs_conversion(path):
+    with open(path, "rb") as file_reader:
+        # empty files can't be memory mapped (and have nothing to convert)
+        if os.fstat(file_reader.fileno()).st_size == 0:
+            return False
+        with mmap.mmap(file_reader.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            return find_style_attribute(buffer) >= 0
+
+
+# scans a single file
+# Argument: task
+# (directory, filename) tuple
+# returns the task, the size of the file in bytes and whether it needs converting
+def scan_task(task):
+    directory, filename = task
+    path = os.path.join(directory, filename)
+    return directory, filename, os.path.getsize(path), needs_conversion(path)
@@ -0,0 +1,98 @@
+"""
+File: style_rewriter.py
+Name: Cody J. McBride
+Contact: cody.j.mcbride@gmail.com
+Description: Rewrites SVG 1.1 'style' attributes as SVG tiny presentation attributes
+             Ex. style="stroke-width: 0.64; fill: #FF0000;"  ->  stroke-width="0.64" fill="#FF0000"
+Version: 0.1
+Date: 10/18/2026
+General Notes:
+    The same style strings repeat thousands of times in a symbol library, so every converted
+    style string is kept in a bounded least-recently-used memo.
+    Values are not limited to numbers: colours (#FF0000, rgb(...)), keywords (none) and
+    url(...) references are carried over as written.
+    A StyleRewriter isn't thread safe (the memo is read and reordered without a lock), give every
+    thread its own.
+"""
+
+# import system libraries
+import re  # regular expressions
+from collections import OrderedDict  # least-recently-used memo
+
+# a style attribute with either quote character, group 2 is the raw style string
+# the look-behind keeps attributes such as font-style="..." from matching
+STYLE_ATTRIBUTE_PATTERN = re.compile(r"(?<![\w:-])style\s*=\s*([\"'])(.*?)\1", re.DOTALL)
+
+# one 'property: value' declaration, the value may contain ';' inside url(...) or quotes
+DECLARATION_PATTERN = re.compile(r"\s*([a-zA-Z-]+)\s*:\s*((?:[^;()\"']|\([^)]*\)|\"[^\"]*\"|'[^']*')*)")
+
+# default number of style strings kept in the memo
+DEFAULT_MEMO_SIZE = 4096
+
+
+class StyleRewriter:
+    def __init__(self, memo_size=DEFAULT_MEMO_SIZE):
+        self.memo_size = memo_size
+        self.memo = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    # converts the raw contents of a style attribute into presentation attributes
+    # Argument: style
+    # the raw style string. Ex. stroke-width: 0.64;
+    # returns the attribute string. Ex. stroke-width="0.64" (with a trailing space)
+    def convert_style(self, style):
+        attributes = self.memo.get(style)
+        if attributes is not None:
+            self.hits += 1
+            self.memo.move_to_end(style)
+            return attributes
+
+        self.misses += 1
+        attributes = build_attributes(style)
+        self.memo[style] = attributes
+        if len(self.memo) > self.memo_size:
+            self.memo.popitem(last=False)
+        return attributes
+
+    # replaces every style attribute in a line
+    # Argument: line
+    # the current line in the file. Ex. <path d=" M 0,-1.5 L 0,1.5" class="sl f0 sCHBLK" style="stroke-width: 0.64;"/>
+    def rewrite(self, line):
+        if "style" not in line:
+            return line
+        return STYLE_ATTRIBUTE_PATTERN.sub(self._replace, line)
+
+    def _replace(self, match):
+        return self.convert_style(match.group(2))
+
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+        return self.hits / lookups
+
+    # counters for reporting, the memo itself is not included
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate(),
+            "entries": len(self.memo),
+            "memo_size": self.memo_size,
+        }
+
+    def clear(self):
+        self.memo.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# builds the presentation attributes for a raw style string (no memo)
+def build_attributes(style):
+    parts = []
+    for match in DECLARATION_PATTERN.finditer(style):
+        value = match.group(2).strip()
+        if value:
+            parts.append(f"{match.group(1)}=\"{value.replace(chr(34), '&quot;')}\" ")
+    return "".join(parts)
@@ -0,0 +1,90 @@
+"""
+File: test_manifest.py
+Name: Cody J. McBride
+Contact: cody.j.mcbride@gmail.com
+Description: Tests of the conversion manifest (manifest.py), which files are skipped and which are reconverted
+Version: 0.1
+Date: 10/18/2026
+General Notes:
+    Run from this folder with python -m pytest
+"""
+
+# import system libraries
+import os
+
+import pytest
+
+from manifest import ConversionManifest, fingerprint
+
+
+# a folder with one converted file, recorded in a saved manifest
+@pytest.fixture
+def directory(tmp_path):
+    source = tmp_path / "symbol.svg"
+    source.write_text("<svg><rect style=\"fill:#FF0000\"/></svg>\n")
+    (tmp_path / "css_removed").mkdir()
+    (tmp_path / "css_removed" / "symbol.svg").write_text("converted\n")
+    manifest = ConversionManifest.load(str(tmp_path), "0.4", "regex")
+    manifest.record("symbol.svg", fingerprint(str(source), "0.4", True, "regex"))
+    manifest.save()
+    return tmp_path
+
+
+def load(directory, version="0.4", backend="regex"):
+    return ConversionManifest.load(str(directory), version, backend)
+
+
+def testNewFileIsConverted(directory):
+    (directory / "new.svg").write_text("<svg/>\n")
+    assert load(directory).needs_conversion(str(directory), "new.svg")
+
+
+def testUnchangedFileIsSkipped(directory):
+    manifest = load(directory)
+    assert not manifest.needs_conversion(str(directory), "symbol.svg")
+    assert not manifest.changed
+
+
+def testTouchedFileWithTheSameContentsIsSkipped(directory):
+    source = directory / "symbol.svg"
+    status = source.stat()
+    os.utime(source, ns=(status.st_atime_ns, status.st_mtime_ns + 5_000_000_000))
+    manifest = load(directory)
+    assert not manifest.needs_conversion(str(directory), "symbol.svg")
+    # the new mtime is recorded, so the next run doesn't hash the file again
+    assert manifest.changed
+    assert manifest.files["symbol.svg"]["mtime_ns"] == source.stat().st_mtime_ns
+
+
+def testChangedFileIsReconverted(directory):
+    source = directory / "symbol.svg"
+    status = source.stat()
+    # same size, different contents
+    source.write_text(source.read_text().replace("FF0000", "00FF00"))
+    os.utime(source, ns=(status.st_atime_ns, status.st_mtime_ns + 5_000_000_000))
+    assert load(directory).needs_conversion(str(directory), "symbol.svg")
+
+
+def testDeletedCopyIsReconverted(directory):
+    (directory / "css_removed" / "symbol.svg").unlink()
+    assert load(directory).needs_conversion(str(directory), "symbol.svg")
+
+
+@pytest.mark.parametrize("version, backend", [("0.5", "regex"), ("0.4", "expat"), ("0.4", None)])
+def testOtherVersionOrBackendIsReconverted(directory, version, backend):
+    assert load(directory, version, backend).needs_conversion(str(directory), "symbol.svg")
+
+
+def testUnreadableManifestIsEmpty(directory):
+    (directory / "css_removed" / "manifest.json").write_text("{not json")
+    manifest = load(directory)
+    assert manifest.files == {}
+    assert manifest.needs_conversion(str(directory), "symbol.svg")
+
+
+def testSaveOnlyWritesChanges(directory):
+    path = directory / "css_removed" / "manifest.json"
+    path.write_text("{\"format\": 1, \"files\": {}}")
+    manifest = load(directory)
+    manifest.save()
+    assert path.read_text() == "{\"format\": 1, \"files\": {}}"
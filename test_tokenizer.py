@@ -0,0 +1,43 @@
+"""
+File: test_tokenizer.py
+Name: Cody J. McBride
+Contact: cody.j.mcbride@gmail.com
+Description: Tests of the streaming tokenizer (tokenizer.py) at every chunk boundary
+Version: 0.1
+Date: 10/18/2026
+General Notes:
+    Run from this folder with python -m pytest
+"""
+
+# import system libraries
+import io
+
+import pytest
+
+from tokenizer import TOKEN_PATTERN, iter_tokens
+
+# tags split over lines, a <text> token, css rules and text between tags
+DOCUMENT = """<?xml version="1.0" encoding="utf-8"?>
+<svg version="1.1" xmlns="http://www.w3.org/2000/svg" x="0px" y="0px"
+\t viewBox="0 0 100 100" xml:space="preserve">
+<style type="text/css">
+\t.st0{fill:#FF0000;stroke:#000000;stroke-width:2;}
+</style>
+<text transform="matrix(1 0 0 1 10 10)">Title: Sample</text>
+<rect x="10" y="10" width="20" height="10" style="fill:#00FF00;stroke:#0000FF"/>
+<path d="M 10 10
+\tL 50 50"/>
+</svg>
+"""
+
+
+@pytest.mark.parametrize("chunkSize", [1, 2, 3, 5, 7, 16, 64, len(DOCUMENT)])
+def testChunkBoundaries(chunkSize):
+    assert list(iter_tokens(io.StringIO(DOCUMENT), chunk_size=chunkSize)) == TOKEN_PATTERN.findall(DOCUMENT)
+
+
+# a document that doesn't end with a newline or a closed tag
+@pytest.mark.parametrize("chunkSize", [1, 4, 1024])
+def testUnfinishedEnd(chunkSize):
+    text = DOCUMENT + "<rect x=\"1\""
+    assert list(iter_tokens(io.StringIO(text), chunk_size=chunkSize)) == TOKEN_PATTERN.findall(text)
@@ -0,0 +1,45 @@
+"""
+File: test_translator.py
+Name: Cody J. McBride
+Contact: cody.j.mcbride@gmail.com
+Description: Tests of the translator's fall back from the expat backend to the regular expressions (translator.py)
+Version: 0.1
+Date: 10/18/2026
+General Notes:
+    Run from this folder with python -m pytest
+"""
+
+# import system libraries
+from xml.parsers.expat import ExpatError
+
+import pytest
+
+from metrics import Metrics
+from translator import check_for_style, translate
+
+# not well-formed XML: an entity expat doesn't know, regular expressions don't care
+BROKEN = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100">
+<text x="0" y="0">&nbsp;</text>
+<rect x="10" y="10" width="20" height="10" style="fill:#00FF00;stroke:#0000FF"/>
+</svg>
+"""
+
+
+@pytest.fixture
+def brokenFile(tmp_path):
+    (tmp_path / "broken.svg").write_text(BROKEN)
+    return tmp_path
+
+
+def testExpatRaisesForStrings():
+    with pytest.raises(ExpatError):
+        translate(BROKEN, backend="expat")
+
+
+@pytest.mark.parametrize("measured", [False, True])
+def testFilesFallBackToRegex(brokenFile, measured):
+    metrics = Metrics() if measured else None
+    assert check_for_style("broken.svg", str(brokenFile), metrics, backend="expat")
+    assert (brokenFile / "css_removed" / "broken.svg").read_text() == translate(BROKEN, backend="regex")
+    if measured:
+        assert metrics.files[0].counts["xml_errors"] == 1
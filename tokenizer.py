@@ -0,0 +1,87 @@
+"""
+File: tokenizer.py
+Name: Cody J. McBride
+Contact: cody.j.mcbride@gmail.com
+Description: Streaming tokenizer, splits an SVG file into lines as defined by brackets < ... >
+             without reading the whole file into memory
+Version: 0.1
+Date: 10/18/2026
+General Notes:
+    The file is read in fixed-size chunks and the tokens are yielded one at a time.
+    The tokens are exactly the ones TOKEN_PATTERN.findall() would return for the whole file;
+    a token is only handed out once more data can no longer change it:
+        a tag < ... > is final once its closing bracket has been read
+        any other token is final once the end of its line has been read
+    Everything else is carried over to the next chunk, so memory use is bounded by the chunk
+    size plus the longest single token, however big the file is.
+"""
+
+# import system libraries
+import re  # regular expressions
+
+# collection of individual lines in the file as defined by brackets <>
+# This regular expression parses the file into lines based on opening and closing brackets < ... >
+TOKEN_PATTERN = re.compile("<text[a-zA-Z0-9 \"=:)(><\\/.]+|<[^>]*>|..*|[a-z]+}")
+
+# number of characters read from the file at a time
+CHUNK_SIZE = 256 * 1024
+
+
+# yields the tokens of a file one at a time
+# Argument: file_reader
+# file-like object opened in text mode
+# Argument: pattern (optional)
+# compiled regular expression the file is split with, alternatives other than < ... > must not span lines
+# Argument: chunk_size (optional)
+# number of characters read at a time
+def iter_tokens(file_reader, pattern=TOKEN_PATTERN, chunk_size=CHUNK_SIZE):
+    buffer = ""
+    pending = []
+
+    # character that has to be read before another scan of the buffer can hand out a token
+    wait_for = None
+
+    while True:
+        chunk = file_reader.read(chunk_size)
+        if not chunk:
+            break
+
+        pending.append(chunk)
+        if wait_for is not None and wait_for not in chunk:
+            continue
+        buffer = buffer + "".join(pending)
+        pending = []
+        wait_for = None
+
+        # start of the last line, it hasn't been completely read yet
+        line_start = buffer.rfind("\n") + 1
+        # first < that hasn't been closed yet
+        unclosed = buffer.find("<", buffer.rfind(">") + 1)
+        if unclosed < 0:
+            unclosed = len(buffer)
+
+        # end of the last token handed out
+        consumed = 0
+        for match in pattern.finditer(buffer):
+            start, end = match.span()
+            token = match.group()
+            if start >= unclosed:
+                wait_for = ">"
+                break
+            if end == len(buffer):
+                break
+            # on the incomplete line only closed tags that directly follow the previous token are final
+            if start >= line_start and (start > max(consumed, line_start) or token[0] != "<" or token[-1] != ">"):
+                wait_for = "\n"
+                break
+            yield token
+            consumed = end
+        else:
+            # nothing left matched, the complete lines before the first unclosed < can't match later either
+            consumed = max(consumed, min(line_start, unclosed))
+
+        buffer = buffer[consumed:]
+
+    buffer = buffer + "".join(pending)
+    for match in pattern.finditer(buffer):
+        yield match.group()
@@ -0,0 +1,289 @@
+"""
+File: translator.py
+Name: Cody J. McBride
+Contact: cody.j.mcbride@gmail.com
+Description: Library interface for the CSS translator, no UI
+             Translates 'style' attributes from SVG 1.1 compliant to SVG tiny compliant presentation attributes
+Version: 0.4
+Date: 10/18/2026
+General Notes:
+    Nothing here imports tkinter or keeps per-file state in module globals, so the translator
+    can be embedded in other programs and imported quickly by short-lived worker processes.
+        translate(text)                     -> converted text
+        translate(data)                     -> converted bytes
+        translate(reader)                   -> converted text read from a file-like object
+        translate(reader, writer)           -> streams the converted text into writer
+        check_for_style(filename, folder)   -> converts folder/filename into folder/css_removed/filename
+    The file is split into lines by one of two parser backends (backend="regex" or "expat"):
+        regex       the regular expressions of tokenizer.py, the lines are the tags as written
+        expat       the XML parser of xml_tokenizer.py, the tags are rebuilt from the parser's events,
+                    handles '>' in attributes, comments, CDATA and tags spanning lines
+    A file that isn't well-formed XML is converted with the regex backend instead.
+    Style attributes are converted by a style_rewriter.StyleRewriter, which keeps a memo of the style
+    strings it converted. Every function takes the rewriter as an argument (rewriter=...), a call without
+    one gets its own, so calls never share a memo unless the caller passes them the same rewriter.
+    A StyleRewriter isn't thread safe, give every thread its own.
+Version History
+[0.4]
+    No module level StyleRewriter, the rewriter is passed in or made per call
+[0.3]
+    Pluggable parser backend, expat (xml_tokenizer.py) next to the regular expressions
+[0.2]
+    Library interface without a UI
+"""
+
+# import system libraries
+import io  # in-memory files
+import os  # used to handle file I/O
+import shutil  # copies files that need no conversion
+from datetime import datetime
+
+from manifest import fingerprint
+from scan import find_style_attribute, needs_conversion
+from style_rewriter import StyleRewriter, STYLE_ATTRIBUTE_PATTERN, build_attributes
+from tokenizer import iter_tokens
+from xml_tokenizer import iter_xml_tokens
+from xml.parsers.expat import ExpatError
+
+# recorded in the conversion manifest, files converted by another version are converted again
+TRANSLATOR_VERSION = "0.2"
+
+# size of the output buffer used when writing converted files
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# parser backend name -> function splitting a file-like object into lines
+TOKENIZERS = {"regex": iter_tokens, "expat": iter_xml_tokens}
+DEFAULT_BACKEND = "regex"
+
+
+# translates the style information of an SVG document
+# Argument: source
+# the document as a string, bytes or a file-like object opened for reading
+# Argument: destination (optional)
+# file-like object the converted document is written to, only used with a file-like source
+# Argument: encoding (optional)
+# encoding of bytes sources
+# Argument: backend (optional)
+# parser backend, "regex" or "expat" (see TOKENIZERS)
+# Argument: rewriter (optional)
+# style_rewriter.StyleRewriter converting the style attributes, a new one when None
+# returns the converted document (the same type as source), or None when it was written to destination
+def translate(source, destination=None, encoding="utf-8", backend=DEFAULT_BACKEND, rewriter=None):
+    if isinstance(source, str):
+        return translate_string(source, backend, rewriter)
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return translate_bytes(bytes(source), encoding, backend, rewriter)
+    if destination is None:
+        destination = io.StringIO()
+        translate_stream(source, destination, backend, rewriter)
+        return destination.getvalue()
+    translate_stream(source, destination, backend, rewriter)
+    return None
+
+
+# returns the converted document, a document without style attributes to convert is returned unchanged
+def translate_string(text, backend=DEFAULT_BACKEND, rewriter=None):
+    if find_style_attribute(text) < 0:
+        return text
+    destination = io.StringIO()
+    translate_stream(io.StringIO(text), destination, backend, rewriter)
+    return destination.getvalue()
+
+
+def translate_bytes(data, encoding="utf-8", backend=DEFAULT_BACKEND, rewriter=None):
+    if find_style_attribute(data) < 0:
+        return data
+    return translate_string(data.decode(encoding), backend, rewriter).encode(encoding)
+
+
+# streams the converted lines of reader into writer, one line per token
+# Argument: reader
+# file-like object opened in text mode
+# Argument: writer
+# file-like object opened in text mode
+# Argument: backend (optional)
+# parser backend, "regex" or "expat" (see TOKENIZERS), expat raises ExpatError for documents that aren't XML
+# Argument: rewriter (optional)
+# style_rewriter.StyleRewriter converting the style attributes, a new one when None
+def translate_stream(reader, writer, backend=DEFAULT_BACKEND, rewriter=None):
+    lines = replace_style_information(TOKENIZERS[backend](reader), rewriter=rewriter)
+    writer.writelines(line + "\n" for line in lines)
+
+
+# yields the names of the files in a directory that should be converted
+# Argument: directory
+# the folder to search
+def find_files_to_convert(directory):
+    for filename in os.listdir(directory):
+        # prepend the converted file with css_removed_
+        modified_file_name = "css_removed_" + filename
+        modified_file_path = os.path.join(directory, modified_file_name)
+
+        # don't modify the history file
+        if "list_of_modified_files" not in filename:
+            # don't try to modify a file that's already been modified
+            if not os.path.exists(modified_file_path):
+                # don't try to modify a 'modified' file
+                if "css_removed" not in filename:
+                    if ".svg" in filename:
+                        yield filename
+
+
+# function to check if the file has style information that needs to be replaced
+# the file is tokenized once, every style attribute is rewritten in a single pass
+# and the converted file is written exactly once
+# Argument: metrics (optional)
+# metrics.Metrics collecting per-phase timing and counters for the file
+# Argument: backend (optional)
+# parser backend, "regex" or "expat" (see TOKENIZERS)
+# Argument: rewriter (optional)
+# style_rewriter.StyleRewriter converting the style attributes, pass the same one for every file of a
+# folder to share its memo between them, a new one when None
+# returns True when a converted copy of the file was written to css_removed/
+def check_for_style(filename, filepath, metrics=None, backend=DEFAULT_BACKEND, rewriter=None):
+    whole_path = os.path.join(filepath, filename)
+    output_folder = os.path.join(filepath, "css_removed")
+    new_file = os.path.join(output_folder, filename)
+
+    os.makedirs(output_folder, exist_ok=True)
+
+    if metrics is not None:
+        return check_for_style_measured(whole_path, new_file, metrics.start_file(whole_path), backend, rewriter)
+
+    # nothing to replace, a plain copy keeps css_removed/ complete without rewriting the file
+    # (the byte scan avoids decoding and tokenizing these files at all)
+    if not needs_conversion(whole_path):
+        shutil.copyfile(whole_path, new_file)
+        return False
+
+    # the lines are tokenized, rewritten and written as the file is read
+    try:
+        with open(whole_path, "r") as filePointer, open(new_file, "w", buffering=WRITE_BUFFER_SIZE) as file_writer:
+            translate_stream(filePointer, file_writer, backend, rewriter)
+    except ExpatError:
+        # not well-formed XML, the regular expressions convert what they can
+        with open(whole_path, "r") as filePointer, open(new_file, "w", buffering=WRITE_BUFFER_SIZE) as file_writer:
+            translate_stream(filePointer, file_writer, "regex", rewriter)
+    return True
+
+
+# check_for_style with metrics, the phases run one after the other (instead of streaming) so each can be timed
+def check_for_style_measured(whole_path, new_file, file_metrics, backend=DEFAULT_BACKEND, rewriter=None):
+    file_metrics.bytes_in = os.path.getsize(whole_path)
+
+    with file_metrics.phase("scan"):
+        found = needs_conversion(whole_path)
+
+    if not found:
+        with file_metrics.phase("copy"):
+            shutil.copyfile(whole_path, new_file)
+        file_metrics.bytes_out = file_metrics.bytes_in
+        return False
+
+    with file_metrics.phase("read"):
+        with open(whole_path, "r") as filePointer:
+            fileContents = filePointer.read()
+    with file_metrics.phase("tokenize"):
+        try:
+            lines = list(TOKENIZERS[backend](io.StringIO(fileContents)))
+        except ExpatError:
+            file_metrics.count("xml_errors")
+            lines = list(iter_tokens(io.StringIO(fileContents)))
+    file_metrics.count("tokens", len(lines))
+    with file_metrics.phase("rewrite"):
+        lines = list(replace_style_information(lines, file_metrics, rewriter))
+    with file_metrics.phase("write"):
+        write_new_file(lines, new_file)
+
+    file_metrics.bytes_out = os.path.getsize(new_file)
+    return True
+
+
+# converts a file and builds its manifest entry
+# the fingerprint is taken before converting so a file edited mid-conversion is picked up next time
+# returns (modified, manifest entry)
+def convert_and_fingerprint(filename, filepath, metrics=None, backend=DEFAULT_BACKEND, rewriter=None):
+    entry = fingerprint(os.path.join(filepath, filename), TRANSLATOR_VERSION, False, backend)
+    entry["modified"] = check_for_style(filename, filepath, metrics, backend, rewriter)
+    return entry["modified"], entry
+
+
+# style information in the header (<?xml ... ?>, xml:space on <svg>) is left alone
+def needs_style_replacement(line):
+    return "style" in line and "xml" not in line
+
+
+# function for replacing all the style information
+# Argument: lines
+# all lines in the file (a list or the tokens streamed by iter_tokens or iter_xml_tokens)
+# Argument: file_metrics (optional)
+# metrics.FileMetrics counting the lines with style information
+# Argument: rewriter (optional)
+# style_rewriter.StyleRewriter converting the style attributes, a new one when None
+# yields the lines with their style information replaced
+def replace_style_information(lines, file_metrics=None, rewriter=None):
+    if rewriter is None:
+        rewriter = StyleRewriter()
+    rewrite = rewriter.rewrite
+    if file_metrics is None:
+        for line in lines:
+            yield rewrite(line) if needs_style_replacement(line) else line
+        return
+
+    style_lines = 0
+    for line in lines:
+        if needs_style_replacement(line):
+            style_lines += 1
+            yield rewrite(line)
+        else:
+            yield line
+    file_metrics.count("style_lines", style_lines)
+
+
+# replace all style information with new format
+# Argument: line
+# the current line in the file. Ex. <path d=" M 0,-1.5 L 0,1.5" class="sl f0 sCHBLK" style="stroke-width: 0.64;"/>
+# Argument: rewriter (optional)
+# style_rewriter.StyleRewriter to look the style up in, converted without a memo when None
+# returns the attributes for the first style attribute in the line. Ex. stroke-width="0.64"
+def parse_style(line, rewriter=None):
+    match = STYLE_ATTRIBUTE_PATTERN.search(line)
+    if match is None:
+        return ""
+    if rewriter is None:
+        return build_attributes(match.group(2))
+    return rewriter.convert_style(match.group(2))
+
+
+# writes the lines through a single buffered writer, one line per token
+def write_new_file(lines, filepath):
+    with open(filepath, "w", buffering=WRITE_BUFFER_SIZE) as file_writer:
+        file_writer.writelines(line + "\n" for line in lines)
+
+
+# appends the list of modified files to the history file in css_removed/
+# Argument: modified_files
+# names of the modified files
+def write_history_file(directory, modified_files):
+    history = "list_of_modified_files.txt"
+    mod_file = os.path.join(directory + "/css_removed/", history)
+
+    # append to the history
+    file_writer = open(mod_file, 'a')
+
+    # Get the current date and time
+    current_datetime = datetime.now()
+
+    # Format the datetime
+    formatted_datetime = current_datetime.strftime("%Y-%m-%d %H:%M:%S")
+
+    # Write the history to the file
+    file_writer.write(formatted_datetime)
+    file_writer.write("\n")
+    for file in modified_files:
+        file_writer.write("\t" + file)
+        file_writer.write("\n")
+    file_writer.write("\n")
+    file_writer.close()
+
+    return history
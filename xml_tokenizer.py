@@ -0,0 +1,205 @@
+"""
+File: xml_tokenizer.py
+Name: Cody J. McBride
+Contact: cody.j.mcbride@gmail.com
+Description: XML parser backend for the translator, splits an SVG file into lines with expat
+             instead of the regular expressions of tokenizer.py
+Version: 0.1
+Date: 10/18/2026
+General Notes:
+    The file is fed to xml.parsers.expat (a C parser) in fixed-size chunks, the start, end, text,
+    comment and CDATA events of each chunk are turned into lines and yielded before the next chunk
+    is read, so memory use is bounded by the chunk size like tokenizer.iter_tokens.
+    The lines are the ones the translator writes, one line per tag like the regular expression tokens:
+        <rect x="10" style="fill: #FF0000;"/>   every tag is rebuilt from its name and attributes,
+                                                an element without content is written as <name .../>
+        <text ...>Title: X</text>               a <text> element is kept on one line with its content
+        <![CDATA[ ... ]]>                       CDATA sections (Ex. in <style>) are written as they are
+    Unlike the regular expressions, attributes containing '>', comments, CDATA and tags spanning
+    several lines are handled the way the XML specification says. Whitespace between tags is
+    dropped and the attribute values are written in double quotes, escaped where needed, so the
+    style rewriter always finds style="...".
+    A document that isn't well-formed XML raises xml.parsers.expat.ExpatError.
+"""
+
+# import system libraries
+from xml.parsers import expat  # C parser from the standard library
+
+# number of characters read from the file at a time
+CHUNK_SIZE = 256 * 1024
+
+# elements kept on one line with their content, like the <text ...> alternative of tokenizer.TOKEN_PATTERN
+INLINE_ELEMENTS = ("text",)
+
+
+# escapes an attribute value for double quotes
+def escape_attribute(value):
+    if "&" in value:
+        value = value.replace("&", "&amp;")
+    if "<" in value:
+        value = value.replace("<", "&lt;")
+    if "\"" in value:
+        value = value.replace("\"", "&quot;")
+    return value
+
+
+# escapes text content
+def escape_text(text):
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    return text
+
+
+# builds a start tag. Ex. <rect x="10" y="5"
+# the closing > or /> is added when it's known whether the element has content
+# Argument: attributes
+# name -> value dictionary, in the order of the document
+def start_tag(name, attributes):
+    tag = "<" + name + "".join([f" {key}=\"{value}\"" for key, value in attributes.items()])
+    # values only need escaping when they contain & < or " (which adds more quotes than the attributes have)
+    if "&" in tag or "<" in tag[1:] or tag.count("\"") != 2 * len(attributes):
+        tag = "<" + name + "".join([f" {key}=\"{escape_attribute(value)}\"" for key, value in attributes.items()])
+    return tag
+
+
+# turns the events of an expat parser into lines
+class LineBuilder:
+    def __init__(self, parser):
+        self.lines = []
+        # start tag waiting for its > (or /> when the element ends right away)
+        self.open_tag = None
+        # parts of the <text> element being collected on one line, None outside of it
+        self.inline = None
+        # depth of the elements inside the <text> element
+        self.inline_depth = 0
+        self.text = []
+        self.in_cdata = False
+        self.has_internal_subset = False
+
+        parser.buffer_text = True
+        parser.XmlDeclHandler = self.xml_declaration
+        parser.StartDoctypeDeclHandler = self.start_doctype
+        parser.EntityDeclHandler = self.entity_declaration
+        parser.EndDoctypeDeclHandler = self.end_doctype
+        parser.ProcessingInstructionHandler = self.processing_instruction
+        parser.CommentHandler = self.comment
+        parser.StartElementHandler = self.start_element
+        parser.EndElementHandler = self.end_element
+        parser.CharacterDataHandler = self.character_data
+        parser.StartCdataSectionHandler = self.start_cdata
+        parser.EndCdataSectionHandler = self.end_cdata
+
+    def emit(self, line):
+        if self.inline is not None:
+            self.inline.append(line)
+        else:
+            self.lines.append(line)
+
+    # writes what came before the next event: the pending start tag and the text collected since it
+    def flush(self):
+        if self.open_tag is not None:
+            self.emit(self.open_tag + ">")
+            self.open_tag = None
+        if self.text:
+            text = "".join(self.text)
+            self.text = []
+            if self.inline is not None:
+                self.inline.append(text)
+            elif text.strip():
+                self.lines.append(text.strip())
+
+    def xml_declaration(self, version, encoding, standalone):
+        line = f"<?xml version=\"{version}\""
+        if encoding:
+            line += f" encoding=\"{encoding}\""
+        if standalone != -1:
+            line += f" standalone=\"{'yes' if standalone else 'no'}\""
+        self.lines.append(line + "?>")
+
+    def start_doctype(self, name, system_id, public_id, has_internal_subset):
+        line = f"<!DOCTYPE {name}"
+        if public_id:
+            line += f" PUBLIC \"{public_id}\" \"{system_id}\""
+        elif system_id:
+            line += f" SYSTEM \"{system_id}\""
+        self.has_internal_subset = has_internal_subset
+        self.lines.append(line + (" [" if has_internal_subset else ">"))
+
+    def entity_declaration(self, name, is_parameter_entity, value, base, system_id, public_id, notation_name):
+        if value is not None:
+            self.lines.append(f"\t<!ENTITY {'% ' if is_parameter_entity else ''}{name} \"{escape_attribute(value)}\">")
+
+    def end_doctype(self):
+        if self.has_internal_subset:
+            self.lines.append("]>")
+
+    def processing_instruction(self, target, data):
+        self.flush()
+        self.emit(f"<?{target} {data}?>" if data else f"<?{target}?>")
+
+    def comment(self, data):
+        self.flush()
+        self.emit(f"<!--{data}-->")
+
+    def start_element(self, name, attributes):
+        self.flush()
+        if self.inline is not None:
+            self.inline_depth += 1
+        elif name in INLINE_ELEMENTS:
+            self.inline = []
+            self.inline_depth = 0
+        self.open_tag = start_tag(name, attributes)
+
+    def end_element(self, name):
+        if self.open_tag is not None:
+            self.emit(self.open_tag + "/>")
+            self.open_tag = None
+        else:
+            self.flush()
+            self.emit(f"</{name}>")
+        if self.inline is not None:
+            if self.inline_depth == 0:
+                self.lines.append("".join(self.inline))
+                self.inline = None
+            else:
+                self.inline_depth -= 1
+
+    def character_data(self, data):
+        if self.open_tag is not None:
+            self.emit(self.open_tag + ">")
+            self.open_tag = None
+        self.text.append(data if self.in_cdata else escape_text(data))
+
+    def start_cdata(self):
+        self.flush()
+        self.in_cdata = True
+        self.text.append("<![CDATA[")
+
+    def end_cdata(self):
+        self.in_cdata = False
+        self.text.append("]]>")
+        self.flush()
+
+
+# yields the lines of a file one at a time, see tokenizer.iter_tokens
+# Argument: file_reader
+# file-like object opened in text mode
+# Argument: chunk_size (optional)
+# number of characters read at a time
+def iter_xml_tokens(file_reader, chunk_size=CHUNK_SIZE):
+    parser = expat.ParserCreate()
+    builder = LineBuilder(parser)
+    while True:
+        chunk = file_reader.read(chunk_size)
+        parser.Parse(chunk, not chunk)
+        if builder.lines:
+            yield from builder.lines
+            builder.lines = []
+        if not chunk:
+            break
+    builder.flush()
+    yield from builder.lines